@@ -157,6 +157,7 @@ BAGMENU_MOVE_CURSOR_CALLBACK_ADDR = sym_addr("BagListMenuMoveCursorFunc")
 BAGMENU_ITEM_PRINT_CALLBACK_ADDR = sym_addr("BagListMenuItemPrintFunc")
 LIST_MENU_DUMMY_TASK_ADDR = sym_addr("ListMenuDummyTask")
 TASK_BAG_MENU_HANDLE_INPUT_ADDR = sym_addr("Task_BagMenu_HandleInput")
+TASK_ANIMATE_SWITCH_POCKETS_ADDR = sym_addr("Task_AnimateSwitchPockets")
 TASK_ITEM_CONTEXT_MENU_BY_LOCATION_ADDR = sym_addr("Task_ItemContextMenuByLocation")
 TASK_FIELD_ITEM_CONTEXT_MENU_HANDLE_INPUT_ADDR = sym_addr("Task_FieldItemContextMenuHandleInput")
 
@@ -6,13 +6,18 @@ from ..constants.addresses import *  # noqa: F403
 from ..game_data import get_ability_name, get_item_name, get_move_name, get_species_name
 from ..memory import mgba
 from ..text import encoding as text_encoding
-from ..util.bytes import _u8_from
+from ..util.bytes import _u8_from, _xor_u32le_block
 from .save import get_national_pokedex_num
 
 # Pokemon party (PID/OTID decryption, substructures, stats...)
 # =============================================================================
 
 _SPECIES_INFO_CACHE: Dict[int, Tuple[int, int, int, int]] = {}
+# pid % 24 -> (start, end) of the Growth / Attacks / EVs / Misc substructures in the decrypted block.
+_SUBSTRUCTURE_SLICES: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+    tuple((order.index(ch) * SUBSTRUCTURE_SIZE, (order.index(ch) + 1) * SUBSTRUCTURE_SIZE) for ch in "GAEM")
+    for order in SUBSTRUCTURE_ORDER
+)
 
 
 def get_party_count() -> int:
@@ -37,22 +42,12 @@ def decrypt_encrypted_block(slot: int) -> Tuple[int, int, bytes]:
     pid = mgba.mgba_read32(base + PID_OFFSET)
     otid = mgba.mgba_read32(base + OTID_OFFSET)
     enc = mgba.mgba_read_range_bytes(base + ENCRYPTED_BLOCK_OFFSET, ENCRYPTED_BLOCK_SIZE)
-    key = pid ^ otid
-    out = bytearray(ENCRYPTED_BLOCK_SIZE)
-    for i in range(0, ENCRYPTED_BLOCK_SIZE, 4):
-        val = int.from_bytes(enc[i : i + 4], "little") ^ key
-        out[i : i + 4] = val.to_bytes(4, "little")
-    return pid, otid, bytes(out)
+    return pid, otid, _xor_u32le_block(enc, pid ^ otid)
 
 
 def unshuffle_substructures(decrypted: bytes, pid: int) -> Dict[str, bytes]:
-    order = SUBSTRUCTURE_ORDER[pid % 24]
-    out: Dict[str, Optional[bytes]] = {"G": None, "A": None, "E": None, "M": None}
-    for i, ch in enumerate(order):
-        start = i * SUBSTRUCTURE_SIZE
-        out[ch] = decrypted[start : start + SUBSTRUCTURE_SIZE]
-    # type ignore: we've filled bytes
-    return out  # type: ignore[return-value]
+    (g0, g1), (a0, a1), (e0, e1), (m0, m1) = _SUBSTRUCTURE_SLICES[pid % 24]
+    return {"G": decrypted[g0:g1], "A": decrypted[a0:a1], "E": decrypted[e0:e1], "M": decrypted[m0:m1]}
 
 
 def get_species_id_from_growth(growth: bytes) -> int:
@@ -266,12 +261,7 @@ def _get_party_data_fast_from_raw(raw: bytes) -> List[Dict[str, Any]]:
         otid = int.from_bytes(raw[base + OTID_OFFSET : base + OTID_OFFSET + 4], "little")
 
         enc = raw[base + ENCRYPTED_BLOCK_OFFSET : base + ENCRYPTED_BLOCK_OFFSET + ENCRYPTED_BLOCK_SIZE]
-        key = pid ^ otid
-        dec = bytearray(ENCRYPTED_BLOCK_SIZE)
-        for i in range(0, ENCRYPTED_BLOCK_SIZE, 4):
-            val = int.from_bytes(enc[i : i + 4], "little") ^ key
-            dec[i : i + 4] = val.to_bytes(4, "little")
-        subs = unshuffle_substructures(bytes(dec), pid)
+        subs = unshuffle_substructures(_xor_u32le_block(enc, pid ^ otid), pid)
         if subs["G"] is None or subs["A"] is None or subs["E"] is None or subs["M"] is None:
             continue
 
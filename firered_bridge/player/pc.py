@@ -6,7 +6,7 @@ from ..constants.addresses import *  # noqa: F403
 from ..game_data import get_ability_name, get_item_name, get_move_name, get_species_name
 from ..memory import mgba
 from ..text import encoding as text_encoding
-from ..util.bytes import _u8_from
+from ..util.bytes import _u8_from, _xor_u32le_block
 from .party import (
     get_ability_for_species,
     get_species_id_from_growth,
@@ -218,12 +218,7 @@ def _parse_box_slot_to_party_schema(slot_raw: bytes) -> Optional[Dict[str, Any]]
     if len(enc) < BOXMON_ENCRYPTED_BLOCK_SIZE:
         return None
 
-    key = pid ^ otid
-    dec = bytearray(BOXMON_ENCRYPTED_BLOCK_SIZE)
-    for i in range(0, BOXMON_ENCRYPTED_BLOCK_SIZE, 4):
-        val = int.from_bytes(enc[i : i + 4], "little") ^ key
-        dec[i : i + 4] = val.to_bytes(4, "little")
-    subs = unshuffle_substructures(bytes(dec), pid)
+    subs = unshuffle_substructures(_xor_u32le_block(enc, pid ^ otid), pid)
     if subs["G"] is None or subs["A"] is None or subs["E"] is None or subs["M"] is None:
         return None
 
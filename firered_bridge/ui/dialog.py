@@ -75,6 +75,12 @@ _DIALOG_SNAPSHOT_RANGES_EXT: List[Tuple[int, int]] = [
     (GBATTLERPARTYINDEXES_ADDR, BATTLE_MAX_BATTLERS * 2),
 ]
 
+# Buffers the slow (no-snapshot) path reads once per poll and shares across the menu getters.
+_DIALOG_FALLBACK_SHARED_RANGES: List[Tuple[int, int]] = [
+    (GTASKS_ADDR, NUM_TASKS * TASK_SIZE),
+    (SMENU_ADDR, 0x0C),
+]
+
 
 def get_dialog_state(
     snapshot: Optional[List[bytes]] = None,
@@ -259,7 +265,7 @@ def get_dialog_state(
             party_raw=_safe_bytes(PARTY_BASE_ADDR, PARTY_SIZE * POKEMON_DATA_SIZE),
         )
 
-    def _compute(buffers: _DialogBuffers, *, mode: str) -> Dict[str, Any]:
+    def _compute(buffers: _DialogBuffers, *, from_snapshot: bool) -> Dict[str, Any]:
         callback2 = int(buffers.callback2) & 0xFFFFFFFF
 
         # Only count the window0 TextPrinter as dialog evidence (other windows can be used for UI).
@@ -488,11 +494,7 @@ def get_dialog_state(
         except Exception:
             pass
 
-        birch_speech_active = (
-            menus._is_new_game_birch_speech_active(buffers.tasks_raw)
-            if buffers.tasks_raw is not None
-            else menus._is_new_game_birch_speech_active()
-        )
+        birch_speech_active = menus._is_new_game_birch_speech_active(buffers.tasks_raw)
         dialog_read_safe = bool(in_dialog) or bool(birch_speech_active)
 
         title_screen = menus.get_title_screen_press_start_state(callback2=callback2, tasks_raw=buffers.tasks_raw)
@@ -718,11 +720,19 @@ def get_dialog_state(
             result["visibleText"] = "\n".join(options_text)
             return result
 
+        # Both item screens decrypt quantities: resolve the key once here instead of once per reader.
+        item_menu_sec_key = sec_key
+        if item_menu_sec_key is None and (callback2 & 0xFFFFFFFE) in menus._ITEM_MENU_CB2_MASKED:
+            try:
+                item_menu_sec_key = int(menus.get_security_key())
+            except Exception:
+                item_menu_sec_key = None
+
         tm_case = menus.get_tm_case_state(
             callback2=callback2,
             tasks_raw=buffers.tasks_raw,
             smenu_raw=buffers.smenu_raw,
-            sec_key=sec_key,
+            sec_key=item_menu_sec_key,
         )
         if tm_case:
             result["menuType"] = "tmCase"
@@ -736,7 +746,7 @@ def get_dialog_state(
             callback2=callback2,
             tasks_raw=buffers.tasks_raw,
             smenu_raw=buffers.smenu_raw,
-            sec_key=sec_key,
+            sec_key=item_menu_sec_key,
         )
         if bag_menu:
             result["menuType"] = "bagMenu"
@@ -1004,7 +1014,7 @@ def get_dialog_state(
                     result["currentPage"] = 1
             return result
 
-        if mode == "slow" and not in_dialog:
+        if not from_snapshot and not in_dialog:
             choice_menu = (
                 menus.get_shop_choice_menu_state(buffers.tasks_raw, buffers.smenu_raw)
                 or menus.get_multichoice_menu_state(
@@ -1084,7 +1094,7 @@ def get_dialog_state(
 
         if buffers.in_battle:
             battle_text: Optional[str] = None
-            if mode == "snapshot":
+            if from_snapshot:
                 try:
                     battle_text = find_active_textprinter_text(
                         text_printers_raw=buffers.text_printers_raw,
@@ -1268,7 +1278,7 @@ def get_dialog_state(
                 if save_prompt:
                     result["visibleText"] = _append_section_once(result.get("visibleText"), save_prompt)
 
-            if mode == "snapshot" and not result.get("visibleText"):
+            if from_snapshot and not result.get("visibleText"):
                 try:
                     prompt_visible = find_active_textprinter_text(
                         text_printers_raw=buffers.text_printers_raw,
@@ -1326,7 +1336,7 @@ def get_dialog_state(
         snap_reader = SnapshotMemoryReader.from_ranges(_DIALOG_SNAPSHOT_RANGES, snapshot[: len(_DIALOG_SNAPSHOT_RANGES)])
         snap_buffers = _read_snapshot_buffers(snap_reader)
         if snap_buffers is not None:
-            return _compute(snap_buffers, mode="snapshot")
+            return _compute(snap_buffers, from_snapshot=True)
 
     # Slow fallback (no snapshot available)
     try:
@@ -1345,15 +1355,28 @@ def get_dialog_state(
         save_info_window_id = int(mgba.mgba_read8(SSAVE_INFO_WINDOWID_ADDR))
     except Exception:
         save_info_window_id = None
+    # Fetch gTasks and sMenu once so the menu getters below share them instead of re-reading per call.
+    tasks_raw: Optional[bytes] = None
+    smenu_raw: Optional[bytes] = None
+    try:
+        tasks_raw, smenu_raw = mgba.mgba_read_ranges_bytes(_DIALOG_FALLBACK_SHARED_RANGES)
+    except Exception:
+        tasks_raw = smenu_raw = None
+    if tasks_raw is not None and len(tasks_raw) < NUM_TASKS * TASK_SIZE:
+        tasks_raw = None
+    if smenu_raw is not None and len(smenu_raw) < 0x0C:
+        smenu_raw = None
 
     return _compute(
         _DialogBuffers(
             field_locked=field_locked,
             in_battle=in_battle,
             callback2=callback2,
+            tasks_raw=tasks_raw,
+            smenu_raw=smenu_raw,
             save_info_window_id=save_info_window_id,
         ),
-        mode="slow",
+        from_snapshot=False,
     )
 
 
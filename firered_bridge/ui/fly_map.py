@@ -46,6 +46,9 @@ _MAPSEC_ID_BY_CONST: Dict[str, int] = {}
 _MAPSEC_NONE_ID: Optional[int] = None  # enum appends MAPSEC_NONE after the JSON list
 _MAPSEC_TO_WORLD_MAP_FLAG_CONST: Dict[str, str] = {}
 _WORLD_MAP_FLAG_CONST_TO_ID: Dict[str, int] = {}
+# (mapsec_id, flag_id, lock_reason) resolved once from the tables above; flag ids kept alongside for bulk reads.
+_RESOLVED_FLY_SPECS: Optional[Tuple[Tuple[int, int, str], ...]] = None
+_RESOLVED_FLY_FLAG_IDS: Tuple[int, ...] = ()
 
 
 def _read_u32(addr: int) -> int:
@@ -184,7 +187,7 @@ def _mapsec_meta(mapsec_id: int) -> Optional[Dict[str, Any]]:
     return meta if isinstance(meta, dict) else None
 
 
-def _read_flags_bulk(sb1_ptr: int, flag_ids: List[int]) -> Optional[Dict[int, bool]]:
+def _read_flags_bulk(sb1_ptr: int, flag_ids: Sequence[int]) -> Optional[Dict[int, bool]]:
     """
     Read multiple flag bits from saveblock1.flags with one RAM read.
     """
@@ -195,46 +198,38 @@ def _read_flags_bulk(sb1_ptr: int, flag_ids: List[int]) -> Optional[Dict[int, bo
 
     try:
         base = int(sb1_ptr) + int(SB1_FLAGS_OFFSET)
-        byte_offsets = [int(fid) // 8 for fid in flag_ids if int(fid) >= 0]
-        if not byte_offsets:
+        ids = [int(fid) for fid in flag_ids if int(fid) >= 0]
+        if not ids:
             return {}
-        lo = min(byte_offsets)
-        hi = max(byte_offsets)
+        lo = min(ids) >> 3
+        hi = max(ids) >> 3
         size = (hi - lo) + 1
         raw = _read_range_bytes(base + lo, size)
         if len(raw) < size:
             return None
 
-        out: Dict[int, bool] = {}
-        for fid in flag_ids:
-            fid_i = int(fid)
-            if fid_i < 0:
-                continue
-            b_off = (fid_i // 8) - lo
-            bit = fid_i % 8
-            if b_off < 0 or b_off >= len(raw):
-                continue
-            out[fid_i] = ((int(raw[b_off]) >> bit) & 1) == 1
-        return out
+        # Test every flag against one little-endian integer instead of indexing byte by byte.
+        bits = int.from_bytes(raw[:size], "little")
+        shift = lo << 3
+        return {fid: ((bits >> (fid - shift)) & 1) == 1 for fid in ids}
     except Exception:
         return None
 
 
-def _build_fly_destinations(
-    *,
-    sb1_ptr: int,
-    current_mapsec_id: int,
-    current_subtitle: Optional[str],
-) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+def _resolve_fly_specs() -> Tuple[Tuple[int, int, str], ...]:
     """
-    Build the list of Fly destinations (available + locked) with cursor positions.
+    Resolve (mapsec_id, flag_id, lock_reason) for every Fly destination once.
     """
+    global _RESOLVED_FLY_SPECS, _RESOLVED_FLY_FLAG_IDS
+    if _RESOLVED_FLY_SPECS is not None:
+        return _RESOLVED_FLY_SPECS
+
     _load_map_sections()
     _load_world_map_flag_ids()
     _load_mapsec_to_world_map_flag_map()
 
     if not _MAPSEC_TO_WORLD_MAP_FLAG_CONST or not _WORLD_MAP_FLAG_CONST_TO_ID:
-        return None
+        return ()
 
     specs: List[Tuple[int, int, str]] = []
     seen: set[Tuple[int, int]] = set()
@@ -249,6 +244,22 @@ def _build_fly_destinations(
         seen.add(key)
         specs.append((int(mapsec_id), int(flag_id), "not visited"))
 
+    if specs:
+        _RESOLVED_FLY_SPECS = tuple(specs)
+        _RESOLVED_FLY_FLAG_IDS = tuple(flag for _mid, flag, _reason in specs)
+    return tuple(specs)
+
+
+def _build_fly_destinations(
+    *,
+    sb1_ptr: int,
+    current_mapsec_id: int,
+    current_subtitle: Optional[str],
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Build the list of Fly destinations (available + locked) with cursor positions.
+    """
+    specs = _resolve_fly_specs()
     if not specs:
         return None
 
@@ -256,7 +267,7 @@ def _build_fly_destinations(
     if sb1_ptr == 0:
         sb1_ptr = _read_u32(GSAVEBLOCK1_PTR_ADDR)
 
-    flag_map = _read_flags_bulk(int(sb1_ptr), [flag for _mid, flag, _reason in specs]) if sb1_ptr else None
+    flag_map = _read_flags_bulk(int(sb1_ptr), _RESOLVED_FLY_FLAG_IDS) if sb1_ptr else None
     if flag_map is None:
         return None
 
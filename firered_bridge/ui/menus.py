@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+import re
+import struct
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from ..constants.addresses import *  # noqa: F403
 from ..game_data import get_ability_name, get_item_name, get_move_name, get_species_name, load_reference_tables
@@ -12,7 +16,7 @@ from ..player import save as player_save
 from ..player import snapshot as player_snapshot
 from ..text import encoding as text_encoding
 from ..text.text_printer import get_current_dialog_text, get_textprinter_text_for_window
-from ..util.bytes import _s16_from_u16, _s8_from_u8, _u16le_from, _u32le_from, _u8_from
+from ..util.bytes import _s16_from_u16, _s8_from_u8, _u16le_from, _u32le_from, _u8_from, _xor_u32le_block
 
 def mgba_read8(addr: int) -> int:
     return mgba.mgba_read8(addr)
@@ -44,43 +48,115 @@ def decode_gba_string(raw_bytes: Sequence[int], max_len: int = 500, stop_at_prom
 
 _ITEM_TM01_ID = 289  # FireRed vanilla: ITEM_TM01
 _TMHM_COUNT = 58  # 50 TMs + 8 HMs
+_ITEM_SLOT_STRUCT = struct.Struct("<HH")  # struct ItemSlot: u16 itemId, u16 (encrypted) quantity
+# gItems[] name and price, fetched together by the shop readers.
+_ITEM_NAME_PRICE_READ_LEN = max(ITEM_NAME_LENGTH, ITEM_PRICE_OFFSET + 2)
+_ITEM_NAME_PRICE_CACHE: Dict[int, Tuple[str, int]] = {}
+# sShopData head read by the buy menu: itemList, totalCost, selectedRow, scrollOffset, itemCount,
+# itemsShowed, martType (SMARTINFO_* / SHOPDATA_* offsets 0x04..0x16).
+_SHOP_DATA_STRUCT = struct.Struct("<4xIIHHHH2xH")
+_TMHM_CODES = tuple(f"No{i + 1:02d}" for i in range(50)) + tuple(f"HM No{i + 1}" for i in range(_TMHM_COUNT - 50))
 _PARTY_MSG_TEACH_WHICH_MON = 4  # pokefirered/include/constants/party_menu.h
 
-_ITEM_DESCRIPTION_CACHE: Dict[int, str] = {}
+# Per-frame constants for the bag / TM CASE readers, built once instead of on every call.
+_BAG_CB2_MASKED = frozenset((CB2_BAG_MENU_RUN_ADDR & 0xFFFFFFFE, CB2_BAG_ADDR & 0xFFFFFFFE))
+_TM_CASE_CB2_MASKED = frozenset((int(CB2_TM_CASE_IDLE_ADDR) & 0xFFFFFFFE, int(CB2_TM_CASE_SETUP_ADDR) & 0xFFFFFFFE))
+_ITEM_MENU_CB2_MASKED = _BAG_CB2_MASKED | _TM_CASE_CB2_MASKED  # screens that decrypt item quantities
+_TM_CASE_MENU_MODE_NAMES = {0: "field", 1: "giveParty", 2: "sell", 3: "givePc", 4: "pokedude"}
+_TM_CASE_FALLBACK_ACTION_LABELS = {0: "USE", 1: "GIVE", 2: "EXIT"}
+_CURSOR_PREFIX = ("►", " ")  # indexed by `idx != cursor`
+_CONTEXT_CURSOR_PREFIX = ("▷", " ")  # list cursor while a context menu has focus
+_ALL_WINDOW_NONE = bytes((WINDOW_NONE,)) * 4  # gBagMenu->windowIds[ITEMWIN_1x1..ITEMWIN_2x3] with no context menu
+# list index -> ((pocketId, itemId, quantity, isCloseBag), row dict) from the last bag frame.
+_LAST_BAG_ROWS: Dict[int, Tuple[Tuple[int, Optional[int], Optional[int], bool], Dict[str, Any]]] = {}
+# list index -> ((itemId, quantity, len(sTMHMMoves)), base label, row dict) from the last TM CASE frame.
+_LAST_TM_ROWS: Dict[int, Tuple[Tuple[int, int, int], str, Dict[str, Any]]] = {}
+# ((isClose, itemId, moveId), move_info, description, non-blank description lines) of the last TM CASE
+# details panel.
+_LAST_TM_MOVE_PANEL: Tuple[Optional[Tuple[bool, Optional[int], Optional[int]]], Dict[str, Any], str, List[str]] = (
+    None,
+    {},
+    "",
+    [],
+)
+# ((moveId, tmhmIndex, description), move_info it was built from, selectedMove dict) of the last TM CASE frame.
+_LAST_TM_SELECTED_MOVE: Tuple[Optional[Tuple[int, Optional[int], str]], Dict[str, Any], Dict[str, Any]] = (None, {}, {})
+_TM_CASE_CLOSE_ROW: Dict[str, Any] = {
+    "index": 0,
+    "name": "CLOSE",
+    "label": "CLOSE",
+    "id": None,
+    "quantity": None,
+    "isClose": True,
+    "isHm": False,
+    "tmhmIndex": None,
+    "moveId": None,
+    "moveName": None,
+}
+
+# Menu-action label caches are keyed by u8 action ids (bounded) and filled by one batched read each.
 _ITEM_MENU_ACTION_LABEL_CACHE: Dict[int, str] = {}
 _PARTY_MENU_ACTION_LABEL_CACHE: Dict[int, str] = {}
-_TM_CASE_MENU_ACTION_LABEL_CACHE: Dict[int, str] = {}
-_MOVE_NAME_TO_ID_CACHE: Optional[Dict[str, int]] = None
+_TM_CASE_MENU_ACTION_LABEL_CACHE: List[Optional[str]] = [None] * 256  # indexed by u8 action id
+_TMHM_MOVES_CACHE: Optional[Tuple[int, ...]] = None  # sTMHMMoves is ROM-constant
+_TMHM_LEARNSET_WORD_CACHE: Dict[Tuple[int, int], int] = {}  # (species, word index) -> sTMHMLearnsets word
+_BATTLE_MOVE_CACHE: Dict[int, Tuple[int, int, int, int]] = {}  # gBattleMoves is ROM-constant
+_BATTLE_MOVE_HEADER = struct.Struct("<xBBBB")  # struct BattleMove: effect, power, type, accuracy, pp
+# gSpeciesInfo[] span from types[0] through abilities[1], and where abilities start inside it.
+_SPECIES_INFO_ABILITIES_REL = SPECIES_INFO_ABILITIES_OFFSET - SPECIES_INFO_TYPES_OFFSET
+_SPECIES_INFO_TYPES_ABILITIES_LEN = _SPECIES_INFO_ABILITIES_REL + 2
 _POKE_STORAGE_MENU_WINDOWID_OFFSET: Optional[int] = None
 _POKE_STORAGE_BOX_TITLE_TEXT_OFFSET: Optional[int] = None
 _POKE_STORAGE_MESSAGE_TEXT_OFFSET: Optional[int] = None
 
 _LISTMENU_SILPHCO_FLOORS = 1
-_ELEVATOR_MULTICHOICE_IDS = {
-    20,  # MULTICHOICE_ROOFTOP_B1F
-    31,  # MULTICHOICE_DEPT_STORE_ELEVATOR
-    42,  # MULTICHOICE_ROCKET_HIDEOUT_ELEVATOR
-}
-_SCRIPT_LIST_MENU_TASK_FUNCS = (
-    TASK_LISTMENU_HANDLE_INPUT_ADDR,
-    TASK_SUSPEND_LIST_MENU_ADDR,
-    TASK_REDRAW_SCROLL_ARROWS_AND_WAIT_INPUT_ADDR,
+_ELEVATOR_MULTICHOICE_IDS = frozenset(
+    (
+        20,  # MULTICHOICE_ROOFTOP_B1F
+        31,  # MULTICHOICE_DEPT_STORE_ELEVATOR
+        42,  # MULTICHOICE_ROCKET_HIDEOUT_ELEVATOR
+    )
 )
-_BAG_CONTEXT_MENU_TASK_FUNCS = (
-    TASK_ITEM_CONTEXT_MENU_BY_LOCATION_ADDR,
-    TASK_FIELD_ITEM_CONTEXT_MENU_HANDLE_INPUT_ADDR,
+# Task-function sets are frozen so membership checks against them stay O(1).
+_SCRIPT_LIST_MENU_TASK_FUNCS = frozenset(
+    (
+        TASK_LISTMENU_HANDLE_INPUT_ADDR,
+        TASK_SUSPEND_LIST_MENU_ADDR,
+        TASK_REDRAW_SCROLL_ARROWS_AND_WAIT_INPUT_ADDR,
+    )
 )
-_ITEM_PC_TASK_FUNCS = tuple(
-    sorted({int(addr) for addr in _sym_addrs_by_prefix("Task_ItemPc") if int(addr) != 0})
-) or (int(ITEM_STORAGE_PROCESS_INPUT_ADDR),)
-_ITEM_PC_SUBMENU_TASK_FUNCS = tuple(
-    sorted({int(addr) for addr in _sym_addrs_by_prefix("Task_ItemPcSubmenu") if int(addr) != 0})
+_SCRIPT_LIST_MENU_TASK_FUNCS_MASKED = frozenset(addr & 0xFFFFFFFE for addr in _SCRIPT_LIST_MENU_TASK_FUNCS if addr)
+_BAG_CONTEXT_MENU_TASK_FUNCS = frozenset(
+    (
+        TASK_ITEM_CONTEXT_MENU_BY_LOCATION_ADDR,
+        TASK_FIELD_ITEM_CONTEXT_MENU_HANDLE_INPUT_ADDR,
+    )
+)
+# Any of these tasks is alive for as long as the bag UI is on screen (item_menu.c keeps its item list
+# ListMenu task around, and the pocket-switch animation briefly replaces it).
+_BAG_MENU_TASK_FUNCS = frozenset(
+    (
+        LIST_MENU_DUMMY_TASK_ADDR,
+        TASK_BAG_MENU_HANDLE_INPUT_ADDR,
+        TASK_ANIMATE_SWITCH_POCKETS_ADDR,
+    )
+) | _BAG_CONTEXT_MENU_TASK_FUNCS
+_ITEM_PC_TASK_FUNCS = frozenset(
+    int(addr) for addr in _sym_addrs_by_prefix("Task_ItemPc") if int(addr) != 0
+) or frozenset((int(ITEM_STORAGE_PROCESS_INPUT_ADDR),))
+_ITEM_PC_SUBMENU_TASK_FUNCS = frozenset(
+    int(addr) for addr in _sym_addrs_by_prefix("Task_ItemPcSubmenu") if int(addr) != 0
 )
 _SCRIPT_LIST_TASK_DATA_LIST_TASK_ID_INDEX = 14
-_LISTMENU_TEMPLATE_ITEMS_PTR_OFFSET = 0x00
-_LISTMENU_TEMPLATE_TOTAL_ITEMS_OFFSET = 0x0C
-_LISTMENU_CURSOR_POS_OFFSET = 0x18
-_LISTMENU_ITEMS_ABOVE_OFFSET = 0x1A
+# struct ListMenu as stored in its task's data[]: template.items, template.moveCursorFunc,
+# template.itemPrintFunc, template.totalItems, template.windowId, cursorPos (scroll), itemsAbove (row).
+_LIST_MENU_TASK_STRUCT = struct.Struct("<IIIH2xB7xHH")
+_LIST_MENU_ITEM_STRUCT = struct.Struct("<I4x")  # struct ListMenuItem: label ptr, (id)
+_MENU_ACTION_TEXT_STRUCT = struct.Struct(f"<I{MENU_ACTION_SIZE - 4}x")  # struct MenuAction: text ptr, (func)
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+# Offset of each gTasks slot within a snapshot, and its absolute address for live reads.
+_TASK_BASES = tuple(i * TASK_SIZE for i in range(NUM_TASKS))
+_TASK_ABS_BASES = tuple(GTASKS_ADDR + base for base in _TASK_BASES)
 
 
 def _party_menu_message_id_from_flags(flags: int) -> int:
@@ -96,30 +172,137 @@ def _get_tmhm_index(item_id: int) -> Optional[int]:
     return None
 
 
+def _read_tmhm_moves() -> Tuple[int, ...]:
+    """
+    Read the whole sTMHMMoves table (TM/HM index -> move id) once and cache it.
+    """
+    global _TMHM_MOVES_CACHE
+    if _TMHM_MOVES_CACHE is not None:
+        return _TMHM_MOVES_CACHE
+    try:
+        raw = mgba_read_range_bytes(STMHM_MOVES_ADDR, _TMHM_COUNT * 2)
+    except Exception:
+        return ()
+    if len(raw) < _TMHM_COUNT * 2:
+        return ()
+    _TMHM_MOVES_CACHE = struct.unpack_from(f"<{_TMHM_COUNT}H", raw, 0)
+    return _TMHM_MOVES_CACHE
+
+
+def _read_battle_move_entries(move_ids: Sequence[int]) -> Dict[int, bytes]:
+    """
+    Raw gBattleMoves[] records for the given (sorted, unique, non-zero) move ids, in one bridge call.
+
+    Runs of consecutive ids share a single range.
+    """
+    if not move_ids:
+        return {}
+    runs: List[List[int]] = []
+    for mid in move_ids:
+        if runs and mid == runs[-1][0] + runs[-1][1]:
+            runs[-1][1] += 1
+        else:
+            runs.append([mid, 1])
+    blobs = mgba_read_ranges_bytes(
+        [(GBATTLE_MOVES_ADDR + (first * BATTLE_MOVE_SIZE), count * BATTLE_MOVE_SIZE) for first, count in runs]
+    )
+    entries: Dict[int, bytes] = {}
+    for (first, count), blob in zip(runs, blobs):
+        for i in range(min(count, len(blob) // BATTLE_MOVE_SIZE)):
+            entries[first + i] = bytes(blob[i * BATTLE_MOVE_SIZE : (i + 1) * BATTLE_MOVE_SIZE])
+    return entries
+
+
+def _read_battle_move_stats(move_id: int) -> Optional[Tuple[int, int, int, int]]:
+    """(power, type, accuracy, pp) from gBattleMoves[move_id], read once per move."""
+    cached = _BATTLE_MOVE_CACHE.get(move_id)
+    if cached is not None:
+        return cached
+    raw = mgba_read_range_bytes(GBATTLE_MOVES_ADDR + (move_id * BATTLE_MOVE_SIZE), BATTLE_MOVE_SIZE)
+    if len(raw) < BATTLE_MOVE_SIZE:
+        return None
+    stats = _BATTLE_MOVE_HEADER.unpack_from(raw, 0)
+    _BATTLE_MOVE_CACHE[move_id] = stats
+    return stats
+
+
+@lru_cache(maxsize=1024)
+def _item_display_name(item_id: int) -> str:
+    return get_item_name(item_id) or f"ITEM_{item_id}"
+
+
+@lru_cache(maxsize=1024)
+def _move_display_name(move_id: int) -> str:
+    return (get_move_name(move_id) or f"MOVE_{move_id}").replace("_", " ")
+
+
 def _normalize_move_label_for_lookup(label: Optional[str]) -> str:
     txt = str(label or "").replace("_", " ").strip().upper()
     return " ".join(txt.split())
 
 
+@lru_cache(maxsize=None)
+def _move_name_to_id_table() -> Dict[str, int]:
+    table: Dict[str, int] = {}
+    try:
+        tables = load_reference_tables()
+        for mid, nm in tables.move_names.items():
+            key = _normalize_move_label_for_lookup(str(nm))
+            if key and key not in table:
+                table[key] = int(mid)
+    except Exception:
+        table = {}
+    return table
+
+
 def _move_id_from_name_label(label: Optional[str]) -> Optional[int]:
-    global _MOVE_NAME_TO_ID_CACHE
     norm = _normalize_move_label_for_lookup(label)
-    if not norm:
+    if not norm or norm in ("-", "—"):
         return None
-    if norm in {"-", "—"}:
+    return _move_name_to_id_table().get(norm)
+
+
+# Fixed-layout pieces of struct Pokemon used by the teach-info kernel below.
+_PARTY_MON_PID_OTID = struct.Struct("<II")  # PID_OFFSET, OTID_OFFSET
+_PARTY_MON_LEVEL_HP = struct.Struct("<BxHH")  # LEVEL_OFFSET (u8 level, u8 mail), currentHP, maxHP
+_PARTY_MON_STATS = struct.Struct("<Bx7H")  # LEVEL_OFFSET: level, (mail), HP, maxHP, Atk, Def, Spe, SpA, SpD
+# A whole struct Pokemon record reduced to (nickname[10], level, currentHP, maxHP).
+_PARTY_MON_ROW = struct.Struct(
+    f"<{NICKNAME_OFFSET}x10s{LEVEL_OFFSET - NICKNAME_OFFSET - 10}x"
+    f"BxHH{POKEMON_DATA_SIZE - LEVEL_OFFSET - 6}x"
+)
+_SUBSTRUCTURE_MOVES = struct.Struct("<4H")
+_SUBSTRUCTURE_GROWTH_HEAD = struct.Struct("<HHIB")  # species, heldItem, experience, ppBonuses
+_SUBSTRUCTURE_ATTACKS = struct.Struct("<4H4B")  # moves[4], pp[4]
+_SUBSTRUCTURE_MISC_HEAD = struct.Struct("<xBHII")  # (pokerus), metLocation, met info, IVs/egg/ability, ribbons
+_SUMMARY_MOVE_TYPES = struct.Struct("<5H")  # PokemonSummaryScreenData moveTypes[5]
+# pid % 24 -> byte offsets of the Growth / Attacks / Misc substructures inside the decrypted block.
+_SUBSTRUCTURE_GAM_OFFSETS: Tuple[Tuple[int, int, int], ...] = tuple(
+    tuple(order.index(ch) * SUBSTRUCTURE_SIZE for ch in "GAM") for order in SUBSTRUCTURE_ORDER
+)
+
+
+def _party_mon_teach_fields(
+    raw_party: bytes, base: int
+) -> Optional[Tuple[int, int, int, int, Tuple[int, ...], bool]]:
+    """
+    Numeric part of the teach-info decode: (level, currentHP, maxHP, species, moves, isEgg).
+
+    Returns None for an empty slot (pid == 0).
+    """
+    pid, otid = _PARTY_MON_PID_OTID.unpack_from(raw_party, base + PID_OFFSET)
+    if pid == 0:
         return None
-    if _MOVE_NAME_TO_ID_CACHE is None:
-        cache: Dict[str, int] = {}
-        try:
-            tables = load_reference_tables()
-            for mid, nm in tables.move_names.items():
-                key = _normalize_move_label_for_lookup(str(nm))
-                if key and key not in cache:
-                    cache[key] = int(mid)
-        except Exception:
-            cache = {}
-        _MOVE_NAME_TO_ID_CACHE = cache
-    return _MOVE_NAME_TO_ID_CACHE.get(norm)
+    level, current_hp, max_hp = _PARTY_MON_LEVEL_HP.unpack_from(raw_party, base + LEVEL_OFFSET)
+
+    enc_off = base + ENCRYPTED_BLOCK_OFFSET
+    dec = _xor_u32le_block(raw_party[enc_off : enc_off + ENCRYPTED_BLOCK_SIZE], pid ^ otid)
+    g_off, a_off, m_off = _SUBSTRUCTURE_GAM_OFFSETS[pid % 24]
+
+    species_id = _u16le_from(dec, g_off)
+    moves = _SUBSTRUCTURE_MOVES.unpack_from(dec, a_off)
+    is_egg = ((_u32le_from(dec, m_off + 4) >> 30) & 1) != 0
+    return level, current_hp, max_hp, species_id, moves, is_egg
 
 
 def _decode_party_mon_teach_info(raw_party: bytes, slot: int) -> Optional[Dict[str, Any]]:
@@ -133,47 +316,13 @@ def _decode_party_mon_teach_info(raw_party: bytes, slot: int) -> Optional[Dict[s
         if base < 0 or (base + POKEMON_DATA_SIZE) > len(raw_party):
             return None
 
-        nickname_raw = raw_party[base + NICKNAME_OFFSET : base + NICKNAME_OFFSET + 10]
-        nickname = decode_gba_string(nickname_raw, 10) or f"MON_{slot}"
-
-        level = int(_u8_from(raw_party, base + LEVEL_OFFSET))
-        current_hp = int(_u16le_from(raw_party, base + CURRENT_HP_OFFSET))
-        max_hp = int(_u16le_from(raw_party, base + MAX_HP_OFFSET))
-
-        pid = int(_u32le_from(raw_party, base + PID_OFFSET))
-        otid = int(_u32le_from(raw_party, base + OTID_OFFSET))
-        if pid == 0:
-            return None
-
-        enc = raw_party[base + ENCRYPTED_BLOCK_OFFSET : base + ENCRYPTED_BLOCK_OFFSET + ENCRYPTED_BLOCK_SIZE]
-        if len(enc) < ENCRYPTED_BLOCK_SIZE:
+        fields = _party_mon_teach_fields(raw_party, base)
+        if fields is None:
             return None
+        level, current_hp, max_hp, species_id, moves, is_egg = fields
 
-        key = pid ^ otid
-        dec = bytearray(ENCRYPTED_BLOCK_SIZE)
-        for i in range(0, ENCRYPTED_BLOCK_SIZE, 4):
-            word = _u32le_from(enc, i) ^ key
-            dec[i : i + 4] = int(word & 0xFFFFFFFF).to_bytes(4, "little")
-
-        order = SUBSTRUCTURE_ORDER[pid % 24]
-        sub: Dict[str, bytes] = {}
-        for i, ch in enumerate(order):
-            start = i * SUBSTRUCTURE_SIZE
-            sub[ch] = bytes(dec[start : start + SUBSTRUCTURE_SIZE])
-
-        growth = sub.get("G", b"")
-        attacks = sub.get("A", b"")
-        misc = sub.get("M", b"")
-
-        species_id = int(_u16le_from(growth, 0))
-        moves = [
-            int(_u16le_from(attacks, 0)),
-            int(_u16le_from(attacks, 2)),
-            int(_u16le_from(attacks, 4)),
-            int(_u16le_from(attacks, 6)),
-        ]
-        iv_bitfield = int(_u32le_from(misc, 4))
-        is_egg = ((iv_bitfield >> 30) & 1) != 0
+        nickname_raw = raw_party[base + NICKNAME_OFFSET : base + NICKNAME_OFFSET + 10]
+        nickname = decode_gba_string(nickname_raw, 10) or f"MON_{slot}"
 
         return {
             "slot": int(slot),
@@ -182,7 +331,7 @@ def _decode_party_mon_teach_info(raw_party: bytes, slot: int) -> Optional[Dict[s
             "currentHP": current_hp,
             "maxHP": max_hp,
             "speciesId": species_id,
-            "moves": moves,
+            "moves": list(moves),
             "isEgg": bool(is_egg),
         }
     except Exception:
@@ -201,6 +350,14 @@ def get_security_key() -> int:
     return player_snapshot.get_security_key()
 
 
+def _security_key16(sec_key: Optional[int]) -> int:
+    """Low 16 bits of the save's security key (quantity XOR key), fetched only when not supplied."""
+    try:
+        return (int(sec_key) if sec_key is not None else int(get_security_key())) & 0xFFFF
+    except Exception:
+        return 0
+
+
 def get_start_menu_state(
     tasks_raw: Optional[bytes] = None,
     *,
@@ -274,17 +431,37 @@ def get_bag_menu_state(
     Read the BAG menu state if it's open.
     """
     try:
+        if callback2 is not None and (int(callback2) & 0xFFFFFFFE) not in _BAG_CB2_MASKED:
+            return None
+
+        # With a task snapshot at hand, a closed bag is detectable without touching the bridge.
+        if tasks_raw is not None and _find_active_task_by_funcs(_BAG_MENU_TASK_FUNCS, tasks_raw) is None:
+            return None
+
+        # Fetch the fixed-address globals in a single bridge call (callback2 only when not supplied).
+        startup_ranges: List[Tuple[int, int]] = [
+            (GBAGMENU_PTR_ADDR, 4),
+            (GBAGPOSITION_ADDR + BAGPOSITION_POCKET_OFFSET, 1),
+        ]
+        if SCONTEXT_MENU_ITEMS_PTR_ADDR and SCONTEXT_MENU_NUM_ITEMS_ADDR:
+            startup_ranges.append((SCONTEXT_MENU_ITEMS_PTR_ADDR, 4))
+            startup_ranges.append((SCONTEXT_MENU_NUM_ITEMS_ADDR, 1))
         if callback2 is None:
-            callback2 = mgba_read32(GMAIN_ADDR + GMAIN_CALLBACK2_OFFSET)
-        callback2_masked = int(callback2) & 0xFFFFFFFE
-        if callback2_masked not in ((CB2_BAG_MENU_RUN_ADDR & 0xFFFFFFFE), (CB2_BAG_ADDR & 0xFFFFFFFE)):
+            startup_ranges.append((GMAIN_ADDR + GMAIN_CALLBACK2_OFFSET, 4))
+        startup = mgba_read_ranges_bytes(startup_ranges)
+        if len(startup) < len(startup_ranges):
             return None
 
-        bag_menu_ptr = mgba_read32(GBAGMENU_PTR_ADDR)
+        if callback2 is None:
+            callback2 = _u32le_from(startup[-1], 0)
+            if (int(callback2) & 0xFFFFFFFE) not in _BAG_CB2_MASKED:
+                return None
+
+        bag_menu_ptr = _u32le_from(startup[0], 0)
         if bag_menu_ptr == 0:
             return None
 
-        pocket_id = mgba_read8(GBAGPOSITION_ADDR + BAGPOSITION_POCKET_OFFSET)
+        pocket_id = _u8_from(startup[1], 0)
         if pocket_id > 4:
             return None
 
@@ -308,10 +485,11 @@ def get_bag_menu_state(
 
             stacks_off = 0
             shown_off = BAG_MENU_NUM_POCKETS
-            num_item_stacks = int(meta[stacks_off + pocket_id]) if (stacks_off + pocket_id) < len(meta) else 0
-            num_shown_items = int(meta[shown_off + pocket_id]) if (shown_off + pocket_id) < len(meta) else 8
-            context_items_ptr = int(mgba_read32(SCONTEXT_MENU_ITEMS_PTR_ADDR)) if SCONTEXT_MENU_ITEMS_PTR_ADDR else 0
-            context_num_items = int(mgba_read8(SCONTEXT_MENU_NUM_ITEMS_ADDR)) if SCONTEXT_MENU_NUM_ITEMS_ADDR else 0
+            num_item_stacks = meta[stacks_off + pocket_id] if (stacks_off + pocket_id) < len(meta) else 0
+            num_shown_items = meta[shown_off + pocket_id] if (shown_off + pocket_id) < len(meta) else 8
+            has_context_globals = bool(SCONTEXT_MENU_ITEMS_PTR_ADDR and SCONTEXT_MENU_NUM_ITEMS_ADDR)
+            context_items_ptr = _u32le_from(startup[2], 0) if has_context_globals else 0
+            context_num_items = _u8_from(startup[3], 0) if has_context_globals else 0
             # FireRed keeps these globals populated even outside the context menu.
             # Gate with the actual context-menu task state to avoid stale false positives.
             context_open = bool(context_task_active and context_items_ptr != 0 and context_num_items > 0)
@@ -328,18 +506,18 @@ def get_bag_menu_state(
 
             window_ids = list(meta[0:5]) if len(meta) >= 5 else []
             if len(window_ids) >= 5:
-                wid = int(window_ids[4]) & 0xFF
+                wid = window_ids[4] & 0xFF
                 if wid != WINDOW_NONE and 0 <= wid < 32:
                     message_window_id = wid
 
-            flags = int(meta[flags_off]) if 0 <= flags_off < len(meta) else 0
+            flags = meta[flags_off] if 0 <= flags_off < len(meta) else 0
             hide_close_bag = (flags & BAGMENU_HIDE_CLOSE_BAG_MASK) != 0
 
-            num_item_stacks = int(meta[stacks_off + pocket_id]) if (stacks_off + pocket_id) < len(meta) else 0
-            num_shown_items = int(meta[shown_off + pocket_id]) if (shown_off + pocket_id) < len(meta) else 8
+            num_item_stacks = meta[stacks_off + pocket_id] if (stacks_off + pocket_id) < len(meta) else 0
+            num_shown_items = meta[shown_off + pocket_id] if (shown_off + pocket_id) < len(meta) else 8
             context_items_ptr = _u32le_from(meta, context_ptr_off) if (context_ptr_off + 4) <= len(meta) else 0
-            context_num_items = int(meta[context_num_off]) if 0 <= context_num_off < len(meta) else 0
-            context_open = any(int(b) != WINDOW_NONE for b in window_ids[0:4]) if len(window_ids) >= 4 else False
+            context_num_items = meta[context_num_off] if 0 <= context_num_off < len(meta) else 0
+            context_open = meta[0:4] != _ALL_WINDOW_NONE if len(window_ids) >= 4 else False
 
         if num_item_stacks < 0 or num_item_stacks > 255:
             num_item_stacks = 0
@@ -364,9 +542,9 @@ def get_bag_menu_state(
             scroll_pos, selected_row = list_state
         else:
             cursor_offset = BAGPOSITION_CURSOR_OFFSET + (pocket_id * 2)
-            selected_row = int(mgba_read16(GBAGPOSITION_ADDR + cursor_offset))
+            selected_row = mgba_read16(GBAGPOSITION_ADDR + cursor_offset)
             scroll_offset = BAGPOSITION_SCROLL_OFFSET + (pocket_id * 2)
-            scroll_pos = int(mgba_read16(GBAGPOSITION_ADDR + scroll_offset))
+            scroll_pos = mgba_read16(GBAGPOSITION_ADDR + scroll_offset)
 
         if scroll_pos < 0:
             scroll_pos = 0
@@ -422,72 +600,68 @@ def get_bag_menu_state(
             # Real pocket slots stop at num_item_stacks (the extra row is CANCEL).
             read_end = min(int(end), int(num_item_stacks), int(pocket_cap))
             if read_start < read_end:
+                entry_size = player_bag.ITEM_ENTRY_SIZE
                 raw = mgba_read_range_bytes(
-                    int(pocket_ptr) + (read_start * player_bag.ITEM_ENTRY_SIZE),
-                    (read_end - read_start) * player_bag.ITEM_ENTRY_SIZE,
+                    int(pocket_ptr) + (read_start * entry_size),
+                    (read_end - read_start) * entry_size,
                 )
 
                 key16: int = 0
                 if pocket_id != 4:
-                    try:
-                        key16 = (int(sec_key) if sec_key is not None else int(get_security_key())) & 0xFFFF
-                    except Exception:
-                        key16 = 0
+                    key16 = _security_key16(sec_key)
                 else:
                     # Key Items don't display quantities; only compute if we already have a key.
                     if sec_key is not None:
                         key16 = int(sec_key) & 0xFFFF
 
-                for i in range(read_end - read_start):
-                    off = i * player_bag.ITEM_ENTRY_SIZE
-                    if off + 3 >= len(raw):
-                        break
-                    item_id = int(_u16le_from(raw, off)) & 0xFFFF
-                    enc_qty = int(_u16le_from(raw, off + 2)) & 0xFFFF
-                    qty = int(enc_qty ^ key16) if key16 else 0
-                    slots_by_index[read_start + i] = (item_id, qty)
+                # Decode every visible slot at once: XOR the high (quantity) half of each
+                # ItemSlot word with the key, then let struct walk the slots in C.
+                count = min(read_end - read_start, len(raw) // entry_size)
+                if count > 0:
+                    if key16:
+                        raw = _xor_u32le_block(raw, key16 << 16)
+                    slots = _ITEM_SLOT_STRUCT.iter_unpack(raw[: count * entry_size])
+                    if key16:
+                        slots_by_index = dict(enumerate(slots, read_start))
+                    else:
+                        slots_by_index = {read_start + i: (item_id, 0) for i, (item_id, _qty) in enumerate(slots)}
 
+        selected_prefix = "▷" if context_menu_open else "►"
         for list_index in range(start, end):
             is_close_bag = (not hide_close_bag) and (list_index == int(num_item_stacks))
 
-            name = None
-            slot = slots_by_index.get(int(list_index)) if not is_close_bag else None
-            if not name:
+            item_id: Optional[int] = None
+            qty: Optional[int] = None
+            slot = slots_by_index.get(list_index) if not is_close_bag else None
+            if slot is not None and slot[0] > 0:
+                item_id, qty = slot
+
+            # Rows only change when their slot does: reuse last frame's dict for an unchanged row.
+            row_key = (pocket_id, item_id, qty, is_close_bag)
+            cached_row = _LAST_BAG_ROWS.get(list_index)
+            if cached_row is not None and cached_row[0] == row_key:
+                entry = cached_row[1]
+            else:
                 if is_close_bag:
                     name = "CANCEL"
-                elif slot is not None and int(slot[0]) > 0:
-                    name = get_item_name(int(slot[0])) or f"ITEM_{int(slot[0])}"
+                elif item_id is not None:
+                    name = _item_display_name(item_id)
                 else:
                     name = f"ITEM_{list_index}"
-
-            item_id: Optional[int] = None
-            qty: Optional[int] = None
-
-            if slot is not None:
-                item_id, slot_qty = slot
-                if int(item_id) <= 0:
-                    item_id = None
-                else:
-                    qty = int(slot_qty)
-
-            show_qty = (qty is not None) and (pocket_id != 4) and (not is_close_bag)
-            label = name
-            if show_qty:
-                label = f"{label} x{qty}"
-
-            prefix = ("▷" if context_menu_open else "►") if list_index == selected_index else ""
-            lines.append(f"{prefix}{label}")
-
-            visible_items.append(
-                {
+                show_qty = (qty is not None) and (pocket_id != 4) and (not is_close_bag)
+                entry = {
                     "index": int(list_index),
                     "name": name,
-                    "label": label,
+                    "label": f"{name} x{qty}" if show_qty else name,
                     "id": item_id,
                     "quantity": qty,
                     "isCloseBag": bool(is_close_bag),
                 }
-            )
+                _LAST_BAG_ROWS[list_index] = (row_key, entry)
+
+            label = entry["label"]
+            lines.append(selected_prefix + label if list_index == selected_index else label)
+            visible_items.append(entry)
 
         if down_visible:
             lines.append("↓")
@@ -533,37 +707,30 @@ def get_bag_menu_state(
                     rows = (len(cells) + columns - 1) // columns
 
                 if columns == 2:
+                    num_cells = len(cells)
                     for row in range(rows):
                         left_idx = row * 2
                         right_idx = left_idx + 1
-                        left_label = str(cells[left_idx]) if left_idx < len(cells) else ""
-                        right_label = str(cells[right_idx]) if right_idx < len(cells) else ""
+                        left_label = str(cells[left_idx]) if left_idx < num_cells else ""
+                        right_label = str(cells[right_idx]) if right_idx < num_cells else ""
                         if not left_label and not right_label:
                             continue
 
-                        left_prefix = "►" if left_idx == cursor_raw else " "
-                        left_part = f"{left_prefix}{left_label}" if left_label else left_prefix
-
-                        line = left_part
+                        parts = [_CURSOR_PREFIX[left_idx != cursor_raw], left_label]
                         if right_label:
-                            line += " "
-                            if right_idx == cursor_raw:
-                                line += f"►{right_label}"
-                            else:
-                                line += right_label
-                        lines.append(line.rstrip())
+                            # The right column has no blank gutter when unselected.
+                            parts.extend((" ", "►" if right_idx == cursor_raw else "", right_label))
+                        lines.append("".join(parts).rstrip())
                 else:
                     options = context_menu.get("options") if isinstance(context_menu.get("options"), list) else []
                     cursor = int(context_menu.get("cursorPosition", 0) or 0)
                     for i, opt in enumerate(options):
-                        prefix = "►" if i == cursor else " "
-                        lines.append(f"{prefix}{opt}")
+                        lines.append(f"{_CURSOR_PREFIX[i != cursor]}{opt}")
             else:
                 options = context_menu.get("options") if isinstance(context_menu.get("options"), list) else []
                 cursor = int(context_menu.get("cursorPosition", 0) or 0)
                 for i, opt in enumerate(options):
-                    prefix = "►" if i == cursor else " "
-                    lines.append(f"{prefix}{opt}")
+                    lines.append(f"{_CURSOR_PREFIX[i != cursor]}{opt}")
 
         return {
             "type": "bagMenu",
@@ -604,68 +771,81 @@ def get_tm_case_state(
 
     This screen is not the regular Bag callback/path, so it needs dedicated detection.
     """
+    global _LAST_TM_MOVE_PANEL, _LAST_TM_SELECTED_MOVE
     try:
         if callback2 is None:
             callback2 = mgba_read32(GMAIN_ADDR + GMAIN_CALLBACK2_OFFSET)
-        cb2_masked = int(callback2) & 0xFFFFFFFE
-        is_tmcase_cb = cb2_masked in (
-            int(CB2_TM_CASE_IDLE_ADDR) & 0xFFFFFFFE,
-            int(CB2_TM_CASE_SETUP_ADDR) & 0xFFFFFFFE,
+        if (int(callback2) & 0xFFFFFFFE) not in _TM_CASE_CB2_MASKED:
+            return None
+
+        # tm_case.c static state, the dynamic-state pointer and the TM CASE pocket header (gBagPockets[3])
+        # all live at fixed addresses: fetch them in one bridge call.
+        head = mgba_read_ranges_bytes(
+            [
+                (STM_CASE_STATIC_RESOURCES_ADDR, 0x0C),
+                (STM_CASE_DYNAMIC_RESOURCES_PTR_ADDR, 4),
+                (BAG_MAIN_ADDR + (3 * player_bag.POCKET_ENTRY_SIZE), player_bag.POCKET_ENTRY_SIZE),
+            ]
         )
-        if not is_tmcase_cb:
+        if len(head) < 3:
             return None
+        static_raw, dynamic_ptr_raw, pocket_header = head[0], head[1], head[2]
+        selected_row = _u16le_from(static_raw, TMCASE_STATIC_SELECTED_ROW_OFFSET) if len(static_raw) >= 0x0C else 0
+        scroll_pos = _u16le_from(static_raw, TMCASE_STATIC_SCROLL_OFFSET) if len(static_raw) >= 0x0C else 0
+        menu_type = _u8_from(static_raw, TMCASE_STATIC_MENU_TYPE_OFFSET) if len(static_raw) >= 0x06 else 0
+        allow_select_close = _u8_from(static_raw, TMCASE_STATIC_ALLOW_SELECT_CLOSE_OFFSET) != 0 if len(static_raw) >= 0x06 else False
 
-        # tm_case.c static state
-        static_raw = mgba_read_range_bytes(STM_CASE_STATIC_RESOURCES_ADDR, 0x0C)
-        selected_row = int(_u16le_from(static_raw, TMCASE_STATIC_SELECTED_ROW_OFFSET)) if len(static_raw) >= 0x0C else 0
-        scroll_pos = int(_u16le_from(static_raw, TMCASE_STATIC_SCROLL_OFFSET)) if len(static_raw) >= 0x0C else 0
-        menu_type = int(_u8_from(static_raw, TMCASE_STATIC_MENU_TYPE_OFFSET)) if len(static_raw) >= 0x06 else 0
-        allow_select_close = bool(int(_u8_from(static_raw, TMCASE_STATIC_ALLOW_SELECT_CLOSE_OFFSET))) if len(static_raw) >= 0x06 else False
+        # TM CASE pocket is pocket index 3 in gBagPockets.
+        pocket_ptr = _u32le_from(pocket_header, 0)
+        pocket_cap = _u8_from(pocket_header, 4)
+        if pocket_ptr == 0 or pocket_cap <= 0:
+            return None
+
+        total_slots = min(pocket_cap, _TMHM_COUNT)
+        entry_size = player_bag.ITEM_ENTRY_SIZE
+
+        # tm_case.c dynamic state (pointer may be NULL while setting up / tearing down); read it together
+        # with the pocket slots.
+        dynamic_ptr = _u32le_from(dynamic_ptr_raw, 0)
+        body_ranges: List[Tuple[int, int]] = [(pocket_ptr, total_slots * entry_size)]
+        if 0x02000000 <= dynamic_ptr <= 0x0203FFFF:
+            body_ranges.append((dynamic_ptr, 0x14))
+        body = mgba_read_ranges_bytes(body_ranges)
+        if len(body) < len(body_ranges):
+            return None
+        pocket_raw = body[0]
 
-        # tm_case.c dynamic state (pointer may be NULL while setting up / tearing down)
-        dynamic_ptr = int(mgba_read32(STM_CASE_DYNAMIC_RESOURCES_PTR_ADDR))
         max_shown = 5
         num_tms = 0
         context_window_id = WINDOW_NONE
         action_indices_ptr = 0
         num_actions = 0
-        if 0x02000000 <= dynamic_ptr <= 0x0203FFFF:
-            dyn = mgba_read_range_bytes(dynamic_ptr, 0x14)
+        if len(body) > 1:
+            dyn = body[1]
             if len(dyn) >= 0x14:
-                max_shown = int(_u8_from(dyn, TMCASE_DYNAMIC_MAX_TMS_SHOWN_OFFSET))
-                num_tms = int(_u8_from(dyn, TMCASE_DYNAMIC_NUM_TMS_OFFSET))
-                context_window_id = int(_u8_from(dyn, TMCASE_DYNAMIC_CONTEXT_MENU_WINDOW_ID_OFFSET))
-                action_indices_ptr = int(_u32le_from(dyn, TMCASE_DYNAMIC_MENU_ACTION_INDICES_PTR_OFFSET))
-                num_actions = int(_u8_from(dyn, TMCASE_DYNAMIC_NUM_MENU_ACTIONS_OFFSET))
+                max_shown = _u8_from(dyn, TMCASE_DYNAMIC_MAX_TMS_SHOWN_OFFSET)
+                num_tms = _u8_from(dyn, TMCASE_DYNAMIC_NUM_TMS_OFFSET)
+                context_window_id = _u8_from(dyn, TMCASE_DYNAMIC_CONTEXT_MENU_WINDOW_ID_OFFSET)
+                action_indices_ptr = _u32le_from(dyn, TMCASE_DYNAMIC_MENU_ACTION_INDICES_PTR_OFFSET)
+                num_actions = _u8_from(dyn, TMCASE_DYNAMIC_NUM_MENU_ACTIONS_OFFSET)
 
-        # TM CASE pocket is pocket index 3 in gBagPockets.
-        pocket_ptr, pocket_cap = player_bag._get_pocket_info(3)
-        if pocket_ptr == 0 or pocket_cap <= 0:
-            return None
+        key16 = _security_key16(sec_key)
 
-        key16: int = 0
-        try:
-            key16 = (int(sec_key) if sec_key is not None else int(get_security_key())) & 0xFFFF
-        except Exception:
-            key16 = 0
-
-        total_slots = min(int(pocket_cap), _TMHM_COUNT)
-        pocket_raw = mgba_read_range_bytes(int(pocket_ptr), total_slots * player_bag.ITEM_ENTRY_SIZE)
+        # Decode the whole pocket in one pass (quantities XORed with the key as a single block).
+        slot_count = min(total_slots, len(pocket_raw) // entry_size)
+        if key16:
+            pocket_raw = _xor_u32le_block(pocket_raw, key16 << 16)
+        pocket_slots = list(_ITEM_SLOT_STRUCT.iter_unpack(pocket_raw[: slot_count * entry_size]))
+        pocket_ids = [item_id for item_id, _qty in pocket_slots]
 
         if num_tms <= 0 or num_tms > total_slots:
             # Fallback if dynamic state isn't ready yet.
-            num_tms = 0
-            for i in range(total_slots):
-                off = i * player_bag.ITEM_ENTRY_SIZE
-                item_id_i = int(_u16le_from(pocket_raw, off))
-                if item_id_i <= 0:
-                    break
-                num_tms += 1
+            num_tms = pocket_ids.index(0) if 0 in pocket_ids else len(pocket_ids)
 
         if max_shown <= 0 or max_shown > 8:
             max_shown = 5
 
-        total_entries = int(num_tms) + 1  # + CLOSE
+        total_entries = num_tms + 1  # + CLOSE
         if total_entries <= 0:
             total_entries = 1
 
@@ -674,123 +854,117 @@ def get_tm_case_state(
         if selected_row < 0:
             selected_row = 0
 
-        selected_index = int(scroll_pos) + int(selected_row)
+        selected_index = scroll_pos + selected_row
         if selected_index >= total_entries:
             selected_index = total_entries - 1
 
-        start = int(scroll_pos)
+        start = scroll_pos
         if start >= total_entries:
-            start = max(0, total_entries - int(max_shown))
-        end = min(total_entries, start + int(max_shown))
+            start = max(0, total_entries - max_shown)
+        end = min(total_entries, start + max_shown)
 
-        max_scroll = max(0, total_entries - int(max_shown))
-        up_visible = int(scroll_pos) > 0
-        down_visible = int(scroll_pos) < int(max_scroll)
+        max_scroll = max(0, total_entries - max_shown)
+        up_visible = scroll_pos > 0
+        down_visible = scroll_pos < max_scroll
 
         visible_items: List[Dict[str, Any]] = []
         selected_item_id: Optional[int] = None
         selected_item_label: Optional[str] = None
         selected_tm_index: Optional[int] = None
         selected_move_id: Optional[int] = None
-        selected_is_close = selected_index == int(num_tms)
+        selected_is_close = selected_index == num_tms
 
+        tmhm_moves = _read_tmhm_moves()
         for i in range(start, end):
-            is_close = i == int(num_tms)
+            is_close = i == num_tms
             if is_close:
-                visible_items.append(
-                    {
-                        "index": int(i),
-                        "name": "CLOSE",
-                        "label": "CLOSE",
-                        "id": None,
-                        "quantity": None,
-                        "isClose": True,
-                        "isHm": False,
-                        "tmhmIndex": None,
-                        "moveId": None,
-                        "moveName": None,
-                    }
-                )
+                visible_items.append(dict(_TM_CASE_CLOSE_ROW, index=i))
                 continue
 
-            off = i * player_bag.ITEM_ENTRY_SIZE
-            item_id = int(_u16le_from(pocket_raw, off)) if (off + 3) < len(pocket_raw) else 0
-            enc_qty = int(_u16le_from(pocket_raw, off + 2)) if (off + 3) < len(pocket_raw) else 0
-            qty = int(enc_qty ^ key16) if key16 else 0
-            tm_index = _get_tmhm_index(item_id)
-            move_id = int(mgba_read16(STMHM_MOVES_ADDR + (int(tm_index) * 2))) if tm_index is not None else 0
-            move_name = (get_move_name(int(move_id)) or f"MOVE_{int(move_id)}").replace("_", " ") if move_id > 0 else ""
-            is_hm = bool(tm_index is not None and int(tm_index) >= 50)
-
-            if tm_index is None:
-                code = f"ITEM_{item_id}"
-            elif is_hm:
-                code = f"HM No{(int(tm_index) - 50) + 1}"
+            item_id, qty = pocket_slots[i] if i < slot_count else (0, 0)
+            if not key16:
+                qty = 0
+
+            # A row only changes with its slot: reuse last frame's dict while (itemId, quantity) match.
+            row_key = (item_id, qty, len(tmhm_moves))
+            cached_row = _LAST_TM_ROWS.get(i)
+            if cached_row is not None and cached_row[0] == row_key:
+                base_label, entry = cached_row[1], cached_row[2]
             else:
-                code = f"No{int(tm_index) + 1:02d}"
+                tm_index = _get_tmhm_index(item_id)
+                move_id = tmhm_moves[tm_index] if (tm_index is not None and tm_index < len(tmhm_moves)) else 0
+                move_name = _move_display_name(move_id) if move_id > 0 else ""
+                is_hm = tm_index is not None and tm_index >= 50
 
-            base_label = f"{code} {move_name}".strip()
-            label = base_label if is_hm else f"{base_label} x {max(0, int(qty))}"
+                code = _TMHM_CODES[tm_index] if tm_index is not None else f"ITEM_{item_id}"
 
-            if i == selected_index:
-                selected_item_id = int(item_id) if item_id > 0 else None
-                selected_item_label = base_label
-                selected_tm_index = int(tm_index) if tm_index is not None else None
-                selected_move_id = int(move_id) if move_id > 0 else None
+                base_label = f"{code} {move_name}".strip()
+                label = base_label if is_hm else f"{base_label} x {max(0, qty)}"
 
-            visible_items.append(
-                {
-                    "index": int(i),
+                entry = {
+                    "index": i,
                     "name": move_name or code,
                     "label": label,
-                    "id": int(item_id) if item_id > 0 else None,
-                    "quantity": int(qty) if not is_hm else None,
+                    "id": item_id if item_id > 0 else None,
+                    "quantity": qty if not is_hm else None,
                     "isClose": False,
-                    "isHm": bool(is_hm),
-                    "tmhmIndex": int(tm_index) if tm_index is not None else None,
-                    "moveId": int(move_id) if move_id > 0 else None,
+                    "isHm": is_hm,
+                    "tmhmIndex": tm_index,
+                    "moveId": move_id if move_id > 0 else None,
                     "moveName": move_name or None,
                     "displayCode": code,
                 }
-            )
+                _LAST_TM_ROWS[i] = (row_key, base_label, entry)
 
-        # Move details panel mirrors PrintMoveInfo() in tm_case.c.
-        move_info: Dict[str, Any] = {
-            "typeId": None,
-            "type": "---",
-            "power": None,
-            "powerText": "---",
-            "accuracy": None,
-            "accuracyText": "---",
-            "pp": None,
-            "ppText": "---",
-        }
-        description = ""
-        if selected_is_close:
-            description = _read_gba_cstring(GTEXT_TMCASE_WILL_BE_PUT_AWAY_ADDR, 220) or "TM CASE will be put away."
-        elif selected_item_id is not None and selected_item_id > 0:
-            description = _read_item_description_from_gitems(int(selected_item_id), 220)
+            if i == selected_index:
+                selected_item_id = entry["id"]
+                selected_item_label = base_label
+                selected_tm_index = entry["tmhmIndex"]
+                selected_move_id = entry["moveId"]
 
-            if selected_move_id is not None and selected_move_id > 0:
-                move_raw = mgba_read_range_bytes(
-                    GBATTLE_MOVES_ADDR + (int(selected_move_id) * BATTLE_MOVE_SIZE),
-                    BATTLE_MOVE_SIZE,
-                )
-                if len(move_raw) >= BATTLE_MOVE_SIZE:
-                    power = int(_u8_from(move_raw, 1))
-                    type_id = int(_u8_from(move_raw, 2))
-                    accuracy = int(_u8_from(move_raw, 3))
-                    pp = int(_u8_from(move_raw, 4))
+            visible_items.append(entry)
+
+        # Move details panel mirrors PrintMoveInfo() in tm_case.c. It only depends on the selected row, so
+        # the last fully resolved panel is reused while the cursor stays put.
+        panel_key = (selected_is_close, selected_item_id, selected_move_id)
+        if _LAST_TM_MOVE_PANEL[0] == panel_key:
+            _key, move_info, description, description_lines = _LAST_TM_MOVE_PANEL
+        else:
+            move_info = {
+                "typeId": None,
+                "type": "---",
+                "power": None,
+                "powerText": "---",
+                "accuracy": None,
+                "accuracyText": "---",
+                "pp": None,
+                "ppText": "---",
+            }
+            description = ""
+            panel_complete = True
+            if selected_is_close:
+                description = _read_gba_cstring(GTEXT_TMCASE_WILL_BE_PUT_AWAY_ADDR, 220) or "TM CASE will be put away."
+            elif selected_item_id is not None and selected_item_id > 0:
+                description = _read_item_description_from_gitems(selected_item_id, 220)
+
+                move_stats = _read_battle_move_stats(selected_move_id) if selected_move_id else None
+                if move_stats is not None:
+                    power, type_id, accuracy, pp = move_stats
                     move_info = {
-                        "typeId": int(type_id),
-                        "type": _move_type_label(type_id) or f"TYPE_{int(type_id)}",
-                        "power": int(power),
-                        "powerText": "---" if int(power) < 2 else str(int(power)),
-                        "accuracy": int(accuracy),
-                        "accuracyText": "---" if int(accuracy) == 0 else str(int(accuracy)),
-                        "pp": int(pp),
-                        "ppText": str(int(pp)),
+                        "typeId": type_id,
+                        "type": _move_type_label(type_id) or f"TYPE_{type_id}",
+                        "power": power,
+                        "powerText": "---" if power < 2 else str(power),
+                        "accuracy": accuracy,
+                        "accuracyText": "---" if accuracy == 0 else str(accuracy),
+                        "pp": pp,
+                        "ppText": str(pp),
                     }
+                # Don't pin a panel whose reads came back empty; retry them next frame.
+                panel_complete = bool(description) and (not selected_move_id or move_stats is not None)
+            description_lines = [ln for ln in str(description).splitlines() if ln.strip()]
+            if panel_complete:
+                _LAST_TM_MOVE_PANEL = (panel_key, move_info, description, description_lines)
 
         context_task = _find_active_task_by_func(TASK_TM_CASE_CONTEXT_MENU_HANDLE_INPUT_ADDR, tasks_raw)
         selected_field_task = _find_active_task_by_func(TASK_TM_CASE_SELECTED_FIELD_ADDR, tasks_raw)
@@ -799,36 +973,37 @@ def get_tm_case_state(
             or selected_field_task is not None
             or (
                 context_window_id != WINDOW_NONE
-                and 0 <= int(context_window_id) < 32
-                and int(action_indices_ptr) != 0
-                and int(num_actions) > 0
+                and 0 <= context_window_id < 32
+                and action_indices_ptr != 0
+                and num_actions > 0
             )
         )
 
         context_menu: Optional[Dict[str, Any]] = None
         if context_open:
             action_ids: List[int] = []
-            if action_indices_ptr != 0 and 0 < int(num_actions) <= 4:
-                raw_ids = mgba_read_range_bytes(int(action_indices_ptr), int(num_actions))
-                action_ids = [int(v) & 0xFF for v in raw_ids[: int(num_actions)]]
+            if action_indices_ptr != 0 and 0 < num_actions <= 4:
+                raw_ids = mgba_read_range_bytes(action_indices_ptr, num_actions)
+                action_ids = list(raw_ids[:num_actions])
             if not action_ids:
                 # Field fallback: USE / GIVE / EXIT
                 action_ids = [0, 1, 2]
 
-            uncached = [aid for aid in action_ids if aid not in _TM_CASE_MENU_ACTION_LABEL_CACHE]
-            if uncached and TMCASE_MENU_ACTIONS_ADDR:
-                uniq = sorted(set(int(a) & 0xFF for a in uncached))
+            labels = [_TM_CASE_MENU_ACTION_LABEL_CACHE[aid] for aid in action_ids]
+            # Only touch the bridge while some id of this menu hasn't been resolved yet.
+            if None in labels and TMCASE_MENU_ACTIONS_ADDR:
+                uniq = sorted({aid for aid, label in zip(action_ids, labels) if label is None})
                 ranges = [(TMCASE_MENU_ACTIONS_ADDR + (aid * MENU_ACTION_SIZE), 4) for aid in uniq]
                 ptr_chunks = mgba_read_ranges_bytes(ranges)
                 for aid, chunk in zip(uniq, ptr_chunks):
-                    ptr = int(_u32le_from(chunk, 0)) if isinstance(chunk, (bytes, bytearray)) and len(chunk) >= 4 else 0
+                    ptr = _u32le_from(chunk, 0)  # 0 for a short chunk
                     label = _read_gba_cstring(ptr, 24) if ptr else ""
-                    _TM_CASE_MENU_ACTION_LABEL_CACHE[int(aid)] = label or ""
+                    _TM_CASE_MENU_ACTION_LABEL_CACHE[aid] = label or ""
+                labels = [_TM_CASE_MENU_ACTION_LABEL_CACHE[aid] for aid in action_ids]
 
-            fallback_labels = {0: "USE", 1: "GIVE", 2: "EXIT"}
             options = [
-                (_TM_CASE_MENU_ACTION_LABEL_CACHE.get(int(aid), "") or fallback_labels.get(int(aid), f"ACTION_{int(aid)}"))
-                for aid in action_ids
+                label or _TM_CASE_FALLBACK_ACTION_LABELS.get(aid, f"ACTION_{aid}")
+                for aid, label in zip(action_ids, labels)
             ]
 
             cursor = _read_menu_cursor_pos(smenu_raw)
@@ -840,89 +1015,92 @@ def get_tm_case_state(
             context_menu = {
                 "type": "tmCaseContextMenu",
                 "layout": "list",
-                "windowId": int(context_window_id) if context_window_id != WINDOW_NONE else None,
-                "cursorPosition": int(cursor),
+                "windowId": context_window_id if context_window_id != WINDOW_NONE else None,
+                "cursorPosition": cursor,
                 "selectedOption": options[cursor] if options else None,
                 "options": options,
-                "actionIds": [int(aid) for aid in action_ids],
+                "actionIds": action_ids,
             }
 
             # Scroll arrows are hidden while the context menu is open.
             up_visible = False
             down_visible = False
 
+        row_prefix = _CONTEXT_CURSOR_PREFIX if context_open else _CURSOR_PREFIX
         lines: List[str] = ["TM CASE"]
         if up_visible:
             lines.append("↑")
-        for entry in visible_items:
-            idx = int(entry.get("index") or 0)
-            prefix = ("▷" if context_open else "►") if idx == selected_index else " "
-            lines.append(f"{prefix}{str(entry.get('label') or '').strip()}".rstrip())
+        lines.extend(
+            (row_prefix[entry["index"] != selected_index] + (entry["label"] or "").strip()).rstrip()
+            for entry in visible_items
+        )
         if down_visible:
             lines.append("↓")
 
-        lines.append("")
-        lines.append(f"TYPE {move_info.get('type') or '---'}")
-        lines.append(f"POWER {move_info.get('powerText') or '---'}")
-        lines.append(f"ACCURACY {move_info.get('accuracyText') or '---'}")
-        lines.append(f"PP {move_info.get('ppText') or '---'}")
+        lines.extend(
+            (
+                "",
+                f"TYPE {move_info.get('type') or '---'}",
+                f"POWER {move_info.get('powerText') or '---'}",
+                f"ACCURACY {move_info.get('accuracyText') or '---'}",
+                f"PP {move_info.get('ppText') or '---'}",
+            )
+        )
         if description:
             lines.append("")
-            lines.extend([ln for ln in str(description).splitlines() if ln.strip()])
+            lines.extend(description_lines)
 
         if context_menu is not None:
             lines.append("")
             if selected_item_label:
                 lines.append(f"{selected_item_label} is selected.")
-            opts = context_menu.get("options") if isinstance(context_menu.get("options"), list) else []
-            cur = int(context_menu.get("cursorPosition") or 0)
-            for i, opt in enumerate(opts):
-                prefix = "►" if i == cur else " "
-                lines.append(f"{prefix}{opt}")
+            opts = context_menu["options"]
+            cur = context_menu["cursorPosition"]
+            lines.extend(f"{_CURSOR_PREFIX[i != cur]}{opt}" for i, opt in enumerate(opts))
 
+        # Reuse last frame's selectedMove while it would be rebuilt from the same (cached) move panel.
         selected_move = None
         if selected_move_id is not None and selected_move_id > 0:
-            selected_move = {
-                "tmhmIndex": int(selected_tm_index) if selected_tm_index is not None else None,
-                "moveId": int(selected_move_id),
-                "name": (get_move_name(int(selected_move_id)) or f"MOVE_{int(selected_move_id)}").replace("_", " "),
-                "typeId": move_info.get("typeId"),
-                "type": move_info.get("type"),
-                "power": move_info.get("power"),
-                "powerText": move_info.get("powerText"),
-                "accuracy": move_info.get("accuracy"),
-                "accuracyText": move_info.get("accuracyText"),
-                "pp": move_info.get("pp"),
-                "ppText": move_info.get("ppText"),
-                "description": description or None,
-            }
+            selected_move_key = (selected_move_id, selected_tm_index, description)
+            if _LAST_TM_SELECTED_MOVE[0] == selected_move_key and _LAST_TM_SELECTED_MOVE[1] is move_info:
+                selected_move = _LAST_TM_SELECTED_MOVE[2]
+            else:
+                selected_move = {
+                    "tmhmIndex": selected_tm_index,
+                    "moveId": selected_move_id,
+                    "name": _move_display_name(selected_move_id),
+                    "typeId": move_info.get("typeId"),
+                    "type": move_info.get("type"),
+                    "power": move_info.get("power"),
+                    "powerText": move_info.get("powerText"),
+                    "accuracy": move_info.get("accuracy"),
+                    "accuracyText": move_info.get("accuracyText"),
+                    "pp": move_info.get("pp"),
+                    "ppText": move_info.get("ppText"),
+                    "description": description or None,
+                }
+                _LAST_TM_SELECTED_MOVE = (selected_move_key, move_info, selected_move)
 
-        menu_type_name = {
-            0: "field",
-            1: "giveParty",
-            2: "sell",
-            3: "givePc",
-            4: "pokedude",
-        }.get(int(menu_type), f"mode_{int(menu_type)}")
+        menu_type_name = _TM_CASE_MENU_MODE_NAMES.get(menu_type, f"mode_{menu_type}")
 
         return {
             "type": "tmCase",
             "menuMode": menu_type_name,
-            "allowSelectClose": bool(allow_select_close),
-            "cursorPosition": int(selected_row),
-            "scrollPosition": int(scroll_pos),
-            "selectedIndex": int(selected_index),
-            "numItems": int(num_tms),
-            "numShownItems": int(max_shown),
+            "allowSelectClose": allow_select_close,
+            "cursorPosition": selected_row,
+            "scrollPosition": scroll_pos,
+            "selectedIndex": selected_index,
+            "numItems": num_tms,
+            "numShownItems": max_shown,
             "visibleItems": visible_items,
-            "selectedItemId": int(selected_item_id) if selected_item_id is not None else None,
+            "selectedItemId": selected_item_id,
             "selectedMove": selected_move,
             "description": description or "",
             "scrollIndicators": {
-                "upVisible": bool(up_visible),
-                "downVisible": bool(down_visible),
-                "maxScroll": int(max_scroll),
-                "totalEntries": int(total_entries),
+                "upVisible": up_visible,
+                "downVisible": down_visible,
+                "maxScroll": max_scroll,
+                "totalEntries": total_entries,
             },
             "contextMenu": context_menu,
             "visibleText": "\n".join(lines).strip(),
@@ -931,48 +1109,83 @@ def get_tm_case_state(
         return None
 
 
+# SaveBlock2 header fields read by the trainer card / option menu, as (offset, size). They sit within
+# the first few words of the block, so one contiguous read covers all of them.
+_SB2_HEADER_FIELDS = (
+    (SB2_PLAYER_NAME_OFFSET, 8),
+    (SB2_TRAINER_ID_OFFSET, 4),
+    (SB2_PLAY_TIME_HOURS_OFFSET, 2),
+    (SB2_PLAY_TIME_MINUTES_OFFSET, 1),
+    (SB2_PLAY_TIME_SECONDS_OFFSET, 1),
+    (SB2_BUTTON_MODE_OFFSET, 1),
+    (SB2_OPTIONS_OFFSET, 2),
+)
+_SB2_HEADER_OFF = min(off for off, _size in _SB2_HEADER_FIELDS)
+_SB2_HEADER_LEN = max(off + size for off, size in _SB2_HEADER_FIELDS) - _SB2_HEADER_OFF
+# (raw SaveBlock2 playerName bytes, decoded name) from the last Trainer Card frame.
+_TRAINER_CARD_NAME_CACHE: Tuple[Optional[bytes], str] = (None, "")
+
+
 def get_trainer_card_state(callback2: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
     Read the Trainer Card state if it's being displayed.
     """
+    global _TRAINER_CARD_NAME_CACHE
     try:
         if callback2 is None:
             callback2 = mgba_read32(GMAIN_ADDR + GMAIN_CALLBACK2_OFFSET)
         if (int(callback2) & 0xFFFFFFFE) != (CB2_TRAINER_CARD_ADDR & 0xFFFFFFFE):
             return None
 
-        sb2_ptr = mgba_read32(GSAVEBLOCK2_PTR_ADDR)
+        ptrs = mgba_read_ranges_bytes([(GSAVEBLOCK2_PTR_ADDR, 4), (GSAVEBLOCK1_PTR_ADDR, 4)])
+        if len(ptrs) < 2:
+            return None
+        sb2_ptr = _u32le_from(ptrs[0], 0)
         if sb2_ptr == 0:
             return None
+        sb1_ptr = _u32le_from(ptrs[1], 0)
+
+        # Every field the card shows, in one bridge call.
+        badge_byte_start = FLAG_BADGE01 // 8
+        badge_byte_end = ((FLAG_BADGE01 + NUM_BADGES - 1) // 8) + 1
+        fields = mgba_read_ranges_bytes(
+            [
+                (sb2_ptr + _SB2_HEADER_OFF, _SB2_HEADER_LEN),
+                (sb2_ptr + SB2_ENCRYPTION_KEY_OFFSET, 4),
+                (sb1_ptr + SB1_MONEY_OFFSET, 4),
+                (sb1_ptr + SB1_FLAGS_OFFSET + badge_byte_start, badge_byte_end - badge_byte_start),
+            ]
+        )
+        if len(fields) < 4:
+            return None
+        header, key_raw, money_raw, badge_raw = fields[:4]
 
-        name_bytes = mgba_read_range(sb2_ptr + SB2_PLAYER_NAME_OFFSET, 8)
-        player_name = decode_gba_string(name_bytes, 8)
+        # The name only changes when a new game is started: decode it again only when its bytes differ.
+        name_off = SB2_PLAYER_NAME_OFFSET - _SB2_HEADER_OFF
+        name_raw = header[name_off : name_off + 8]
+        if _TRAINER_CARD_NAME_CACHE[0] == name_raw:
+            player_name = _TRAINER_CARD_NAME_CACHE[1]
+        else:
+            player_name = decode_gba_string(name_raw, 8)
+            _TRAINER_CARD_NAME_CACHE = (name_raw, player_name)
 
-        trainer_id_full = mgba_read32(sb2_ptr + SB2_TRAINER_ID_OFFSET)
+        trainer_id_full = _u32le_from(header, SB2_TRAINER_ID_OFFSET - _SB2_HEADER_OFF)
         trainer_id = trainer_id_full & 0xFFFF
 
-        play_hours = mgba_read16(sb2_ptr + SB2_PLAY_TIME_HOURS_OFFSET)
-        play_minutes = mgba_read8(sb2_ptr + SB2_PLAY_TIME_MINUTES_OFFSET)
-        play_seconds = mgba_read8(sb2_ptr + SB2_PLAY_TIME_SECONDS_OFFSET)
+        play_hours = _u16le_from(header, SB2_PLAY_TIME_HOURS_OFFSET - _SB2_HEADER_OFF)
+        play_minutes = _u8_from(header, SB2_PLAY_TIME_MINUTES_OFFSET - _SB2_HEADER_OFF)
+        play_seconds = _u8_from(header, SB2_PLAY_TIME_SECONDS_OFFSET - _SB2_HEADER_OFF)
 
-        encryption_key = mgba_read32(sb2_ptr + SB2_ENCRYPTION_KEY_OFFSET)
+        encryption_key = _u32le_from(key_raw, 0)
 
-        sb1_ptr = mgba_read32(GSAVEBLOCK1_PTR_ADDR)
-        money_encrypted = mgba_read32(sb1_ptr + SB1_MONEY_OFFSET)
+        money_encrypted = _u32le_from(money_raw, 0)
         money = money_encrypted ^ encryption_key
 
-        flags_base = sb1_ptr + SB1_FLAGS_OFFSET
-        badges = []
-        badge_count = 0
-        for i in range(NUM_BADGES):
-            flag_id = FLAG_BADGE01 + i
-            byte_offset = flag_id // 8
-            bit_offset = flag_id % 8
-            flag_byte = mgba_read8(flags_base + byte_offset)
-            has_badge = (flag_byte >> bit_offset) & 1
-            badges.append(has_badge == 1)
-            if has_badge:
-                badge_count += 1
+        badge_bits = (int.from_bytes(badge_raw, "little") >> (FLAG_BADGE01 - (badge_byte_start * 8))) & (
+            (1 << NUM_BADGES) - 1
+        )
+        badges = [((badge_bits >> i) & 1) == 1 for i in range(NUM_BADGES)]
+        badge_count = sum(badges)
 
         play_time = f"{play_hours}:{play_minutes:02d}"
 
@@ -994,6 +1207,54 @@ def get_trainer_card_state(callback2: Optional[int] = None) -> Optional[Dict[str
         return None
 
 
+# struct OptionMenu option[] entries named in the result, in array order (option_menu.c MENUITEM_*),
+# with the name reported when the resolved value is out of range. option[5] is the frame type.
+_OPTION_NAME_FIELDS = (
+    (OPTION_TEXT_SPEED_NAMES, "FAST"),
+    (OPTION_BATTLE_SCENE_NAMES, "ON"),
+    (OPTION_BATTLE_STYLE_NAMES, "SHIFT"),
+    (OPTION_SOUND_NAMES, "MONO"),
+    (OPTION_BUTTON_MODE_NAMES, "NORMAL"),
+)
+# struct OptionMenu head: u16 option[7], then u16 cursorPos at OPTION_MENU_CURSOR_POS_OFFSET.
+_OPTION_MENU_STRUCT = struct.Struct(
+    "<7H" + "x" * (OPTION_MENU_CURSOR_POS_OFFSET - OPTION_MENU_OPTION_ARRAY_OFFSET - 14) + "H"
+)
+
+
+_OPTION_MENU_CB2_MASKED = frozenset((CB2_INIT_OPTION_MENU_ADDR & 0xFFFFFFFE, CB2_OPTION_MENU_ADDR & 0xFFFFFFFE))
+_OPTION_MENU_TASKS_MASKED = frozenset(
+    (
+        TASK_OPTION_MENU_FADEIN_ADDR & 0xFFFFFFFE,
+        TASK_OPTION_MENU_PROCESSINPUT_ADDR & 0xFFFFFFFE,
+        TASK_OPTION_MENU_SAVE_ADDR & 0xFFFFFFFE,
+        TASK_OPTION_MENU_FADEOUT_ADDR & 0xFFFFFFFE,
+    )
+)
+_MAIN_MENU_CB2_MASKED = frozenset(
+    (
+        CB2_MAIN_MENU_ADDR & 0xFFFFFFFE,
+        CB2_INIT_MAIN_MENU_ADDR & 0xFFFFFFFE,
+        CB2_REINIT_MAIN_MENU_ADDR & 0xFFFFFFFE,
+    )
+)
+_MAIN_MENU_TASKS_MASKED = frozenset(
+    (
+        TASK_DISPLAY_MAIN_MENU_ADDR & 0xFFFFFFFE,
+        TASK_HIGHLIGHT_SELECTED_MAIN_MENU_ITEM_ADDR & 0xFFFFFFFE,
+        TASK_HANDLE_MAIN_MENU_INPUT_ADDR & 0xFFFFFFFE,
+    )
+)
+_TITLE_SCREEN_CB2_MASKED = frozenset((CB2_INIT_TITLE_SCREEN_ADDR & 0xFFFFFFFE, CB2_TITLE_SCREEN_ADDR & 0xFFFFFFFE))
+_TITLE_SCREEN_TASKS_MASKED = frozenset(
+    (
+        TASK_TITLE_SCREEN_PHASE1_ADDR & 0xFFFFFFFE,
+        TASK_TITLE_SCREEN_PHASE2_ADDR & 0xFFFFFFFE,
+        TASK_TITLE_SCREEN_PHASE3_ADDR & 0xFFFFFFFE,
+    )
+)
+
+
 def get_option_menu_state(callback2: Optional[int] = None, tasks_raw: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
     """
     Read the Option Menu state if it's being displayed.
@@ -1008,46 +1269,36 @@ def get_option_menu_state(callback2: Optional[int] = None, tasks_raw: Optional[b
         # - CB2_InitOptionMenu (state machine)
         # - the option-menu MainCB2 (static function; symbol selection can be ambiguous)
         # Additionally, we can reliably identify it by its task funcs.
-        option_task_addrs = {
-            TASK_OPTION_MENU_FADEIN_ADDR & 0xFFFFFFFE,
-            TASK_OPTION_MENU_PROCESSINPUT_ADDR & 0xFFFFFFFE,
-            TASK_OPTION_MENU_SAVE_ADDR & 0xFFFFFFFE,
-            TASK_OPTION_MENU_FADEOUT_ADDR & 0xFFFFFFFE,
-        }
-
-        option_task_active = False
-        if tasks_raw is not None and len(tasks_raw) >= (NUM_TASKS * TASK_SIZE):
-            for i in range(NUM_TASKS):
-                base = i * TASK_SIZE
-                if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in option_task_addrs:
-                    option_task_active = True
-                    break
-        else:
-            for i in range(NUM_TASKS):
-                task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-                if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in option_task_addrs:
-                    option_task_active = True
-                    break
+        option_task_addrs = _OPTION_MENU_TASKS_MASKED
 
-        if callback2_masked not in (
-            CB2_INIT_OPTION_MENU_ADDR & 0xFFFFFFFE,
-            CB2_OPTION_MENU_ADDR & 0xFFFFFFFE,
-        ) and not option_task_active:
+        if tasks_raw is None or len(tasks_raw) < (NUM_TASKS * TASK_SIZE):
+            tasks_raw = _read_tasks_raw()
+        option_task_active = not _decode_active_tasks(tasks_raw).keys().isdisjoint(option_task_addrs)
+        if callback2_masked not in _OPTION_MENU_CB2_MASKED and not option_task_active:
             return None
 
-        sb2_ptr = mgba_read32(GSAVEBLOCK2_PTR_ADDR)
+        ptr_ranges: List[Tuple[int, int]] = [(GSAVEBLOCK2_PTR_ADDR, 4)]
+        if SOPTION_MENU_PTR_ADDR:
+            ptr_ranges.append((SOPTION_MENU_PTR_ADDR, 4))
+        ptrs = mgba_read_ranges_bytes(ptr_ranges)
+        if len(ptrs) < len(ptr_ranges):
+            return None
+        sb2_ptr = _u32le_from(ptrs[0], 0)
         if sb2_ptr == 0:
             return None
+        option_ptr = _u32le_from(ptrs[1], 0) if len(ptrs) > 1 else 0
+
+        # SaveBlock2 values are persisted settings (fallback when live option struct is unavailable),
+        # fetched in the same bridge call as the live struct OptionMenu (option_menu.c: sOptionMenuPtr).
+        value_ranges: List[Tuple[int, int]] = [(sb2_ptr + _SB2_HEADER_OFF, _SB2_HEADER_LEN)]
+        if 0x02000000 <= option_ptr <= 0x0203FFFF:
+            value_ranges.append((option_ptr + OPTION_MENU_OPTION_ARRAY_OFFSET, _OPTION_MENU_STRUCT.size))
+        values = mgba_read_ranges_bytes(value_ranges)
+        if not values:
+            return None
 
-        # SaveBlock2 values are persisted settings (fallback when live option struct is unavailable).
-        button_mode = mgba_read8(sb2_ptr + SB2_BUTTON_MODE_OFFSET)
-        options_word = mgba_read16(sb2_ptr + SB2_OPTIONS_OFFSET)
+        button_mode = _u8_from(values[0], SB2_BUTTON_MODE_OFFSET - _SB2_HEADER_OFF)
+        options_word = _u16le_from(values[0], SB2_OPTIONS_OFFSET - _SB2_HEADER_OFF)
 
         text_speed = options_word & 0x7
         frame_type = (options_word >> 3) & 0x1F
@@ -1055,91 +1306,30 @@ def get_option_menu_state(callback2: Optional[int] = None, tasks_raw: Optional[b
         battle_style = (options_word >> 9) & 0x1
         battle_scene_off = (options_word >> 10) & 0x1
 
-        # Prefer live values from struct OptionMenu (option_menu.c: sOptionMenuPtr) while the menu is open.
+        # Prefer live values from struct OptionMenu while the menu is open.
         # This captures unsaved changes and the real cursor position.
-        live_text_speed: Optional[int] = None
-        live_battle_scene_off: Optional[int] = None
-        live_battle_style: Optional[int] = None
-        live_sound: Optional[int] = None
-        live_button_mode: Optional[int] = None
-        live_frame_type: Optional[int] = None
+        live_values: Optional[Tuple[int, ...]] = None
         live_cursor_pos: Optional[int] = None
-
-        if SOPTION_MENU_PTR_ADDR:
-            option_ptr = int(mgba_read32(SOPTION_MENU_PTR_ADDR))
-            if 0x02000000 <= option_ptr <= 0x0203FFFF:
-                try:
-                    # struct OptionMenu:
-                    #   0x00 u16 option[7]
-                    #   0x0E u16 cursorPos
-                    raw = mgba_read_range_bytes(
-                        option_ptr + OPTION_MENU_OPTION_ARRAY_OFFSET,
-                        OPTION_MENU_CURSOR_POS_OFFSET + 2,
-                    )
-                    if len(raw) >= (OPTION_MENU_CURSOR_POS_OFFSET + 2):
-                        live_text_speed = int(_u16le_from(raw, 0x00))
-                        live_battle_scene_off = int(_u16le_from(raw, 0x02))
-                        live_battle_style = int(_u16le_from(raw, 0x04))
-                        live_sound = int(_u16le_from(raw, 0x06))
-                        live_button_mode = int(_u16le_from(raw, 0x08))
-                        live_frame_type = int(_u16le_from(raw, 0x0A))
-                        live_cursor_pos = int(_u16le_from(raw, OPTION_MENU_CURSOR_POS_OFFSET))
-                except Exception:
-                    pass
-
-        text_speed_idx = (
-            int(live_text_speed)
-            if live_text_speed is not None and 0 <= int(live_text_speed) < len(OPTION_TEXT_SPEED_NAMES)
-            else int(text_speed)
-        )
-        battle_scene_idx = (
-            int(live_battle_scene_off)
-            if live_battle_scene_off is not None and 0 <= int(live_battle_scene_off) < len(OPTION_BATTLE_SCENE_NAMES)
-            else int(battle_scene_off)
-        )
-        battle_style_idx = (
-            int(live_battle_style)
-            if live_battle_style is not None and 0 <= int(live_battle_style) < len(OPTION_BATTLE_STYLE_NAMES)
-            else int(battle_style)
-        )
-        sound_idx = int(live_sound) if live_sound is not None and 0 <= int(live_sound) < len(OPTION_SOUND_NAMES) else int(sound)
-        button_mode_idx = (
-            int(live_button_mode)
-            if live_button_mode is not None and 0 <= int(live_button_mode) < len(OPTION_BUTTON_MODE_NAMES)
-            else int(button_mode)
-        )
-        frame_type_idx = int(live_frame_type) if live_frame_type is not None and 0 <= int(live_frame_type) <= 31 else int(frame_type)
-
-        text_speed_name = OPTION_TEXT_SPEED_NAMES[text_speed_idx] if text_speed_idx < 3 else "FAST"
-        battle_scene_name = OPTION_BATTLE_SCENE_NAMES[battle_scene_idx] if battle_scene_idx < 2 else "ON"
-        battle_style_name = OPTION_BATTLE_STYLE_NAMES[battle_style_idx] if battle_style_idx < 2 else "SHIFT"
-        sound_name = OPTION_SOUND_NAMES[sound_idx] if sound_idx < 2 else "MONO"
-        button_mode_name = OPTION_BUTTON_MODE_NAMES[button_mode_idx] if button_mode_idx < 3 else "NORMAL"
+        raw = values[1] if len(values) > 1 else b""
+        if len(raw) >= _OPTION_MENU_STRUCT.size:
+            live_fields = _OPTION_MENU_STRUCT.unpack_from(raw, 0)
+            live_values = live_fields[:7]
+            live_cursor_pos = live_fields[7]
+
+        saved_values = (text_speed, battle_scene_off, battle_style, sound, button_mode)
+        option_names: List[str] = []
+        for i, (names, default_name) in enumerate(_OPTION_NAME_FIELDS):
+            idx = live_values[i] if live_values is not None and live_values[i] < len(names) else saved_values[i]
+            option_names.append(names[idx] if idx < len(names) else default_name)
+        text_speed_name, battle_scene_name, battle_style_name, sound_name, button_mode_name = option_names
+        frame_type_idx = live_values[5] if live_values is not None and live_values[5] <= 31 else frame_type
 
         cursor_pos = live_cursor_pos if live_cursor_pos is not None else 0
-        if live_cursor_pos is None and tasks_raw is not None:
-            targets = option_task_addrs
-            for i in range(NUM_TASKS):
-                base = i * TASK_SIZE
-                if (base + TASK_SIZE) > len(tasks_raw):
-                    break
-                if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in targets:
-                    cursor_pos = int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET))
-                    cursor_pos = cursor_pos - 65536 if cursor_pos > 32767 else cursor_pos
-                    break
-        elif live_cursor_pos is None:
-            for i in range(NUM_TASKS):
-                task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-                task_func = mgba_read32(task_addr + TASK_FUNC_OFFSET)
-                task_func_masked = task_func & 0xFFFFFFFE
-                if task_func_masked in option_task_addrs:
-                    cursor_pos = int(mgba_read16(task_addr + TASK_DATA_OFFSET))
-                    if cursor_pos > 32767:
-                        cursor_pos = cursor_pos - 65536
-                    break
+        if live_cursor_pos is None:
+            option_task_id = _find_active_task_by_masked_funcs(option_task_addrs, tasks_raw)
+            if option_task_id is not None:
+                cursor_pos = int(_u16le_from(tasks_raw, _TASK_BASES[option_task_id] + TASK_DATA_OFFSET))
+                cursor_pos = cursor_pos - 65536 if cursor_pos > 32767 else cursor_pos
 
         if len(OPTION_MENU_ITEMS) > 0:
             if cursor_pos < 0:
@@ -1177,36 +1367,12 @@ def get_title_menu_state(callback2: Optional[int] = None, tasks_raw: Optional[by
 
         callback2_masked = int(callback2) & 0xFFFFFFFE
 
-        main_menu_cb2_addrs = {
-            CB2_MAIN_MENU_ADDR & 0xFFFFFFFE,
-            CB2_INIT_MAIN_MENU_ADDR & 0xFFFFFFFE,
-            CB2_REINIT_MAIN_MENU_ADDR & 0xFFFFFFFE,
-        }
-        main_menu_task_addrs = {
-            TASK_DISPLAY_MAIN_MENU_ADDR & 0xFFFFFFFE,
-            TASK_HIGHLIGHT_SELECTED_MAIN_MENU_ITEM_ADDR & 0xFFFFFFFE,
-            TASK_HANDLE_MAIN_MENU_INPUT_ADDR & 0xFFFFFFFE,
-        }
+        main_menu_cb2_addrs = _MAIN_MENU_CB2_MASKED
+        main_menu_task_addrs = _MAIN_MENU_TASKS_MASKED
 
-        main_menu_task_active = False
-        if tasks_raw is not None and len(tasks_raw) >= (NUM_TASKS * TASK_SIZE):
-            for i in range(NUM_TASKS):
-                base = i * TASK_SIZE
-                if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in main_menu_task_addrs:
-                    main_menu_task_active = True
-                    break
-        else:
-            for i in range(NUM_TASKS):
-                task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-                if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in main_menu_task_addrs:
-                    main_menu_task_active = True
-                    break
+        if tasks_raw is None or len(tasks_raw) < (NUM_TASKS * TASK_SIZE):
+            tasks_raw = _read_tasks_raw()
+        main_menu_task_active = not _decode_active_tasks(tasks_raw).keys().isdisjoint(main_menu_task_addrs)
 
         if callback2_masked not in main_menu_cb2_addrs and not main_menu_task_active:
             return None
@@ -1220,14 +1386,9 @@ def get_title_menu_state(callback2: Optional[int] = None, tasks_raw: Optional[by
         if task_id is None:
             return None
 
-        if tasks_raw is not None:
-            base = task_id * TASK_SIZE
-            menu_type = int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET))
-            curr_item = _s16_from_u16(int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + 2)))
-        else:
-            task_addr = GTASKS_ADDR + (task_id * TASK_SIZE)
-            menu_type = int(mgba_read16(task_addr + TASK_DATA_OFFSET))
-            curr_item = _s16_from_u16(int(mgba_read16(task_addr + TASK_DATA_OFFSET + 2)))
+        base = _TASK_BASES[task_id]
+        menu_type = int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET))
+        curr_item = _s16_from_u16(int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + 2)))
 
         variant_name = TITLE_MENU_VARIANT_NAMES.get(menu_type, f"UNKNOWN_{menu_type}")
 
@@ -1285,51 +1446,25 @@ def get_title_screen_press_start_state(
             callback2 = mgba_read32(GMAIN_ADDR + GMAIN_CALLBACK2_OFFSET)
         callback2_masked = int(callback2) & 0xFFFFFFFE
 
-        title_cb2_addrs = {
-            CB2_INIT_TITLE_SCREEN_ADDR & 0xFFFFFFFE,
-            CB2_TITLE_SCREEN_ADDR & 0xFFFFFFFE,
-        }
-        title_task_addrs = {
-            TASK_TITLE_SCREEN_PHASE1_ADDR & 0xFFFFFFFE,
-            TASK_TITLE_SCREEN_PHASE2_ADDR & 0xFFFFFFFE,
-            TASK_TITLE_SCREEN_PHASE3_ADDR & 0xFFFFFFFE,
-        }
+        title_cb2_addrs = _TITLE_SCREEN_CB2_MASKED
+        title_task_addrs = _TITLE_SCREEN_TASKS_MASKED
 
-        phase = None
-        any_task_active = False
-        if tasks_raw is not None and len(tasks_raw) >= (NUM_TASKS * TASK_SIZE):
-            for i in range(NUM_TASKS):
-                base = i * TASK_SIZE
-                if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in title_task_addrs:
-                    any_task_active = True
-                    if task_func_masked == (TASK_TITLE_SCREEN_PHASE1_ADDR & 0xFFFFFFFE):
-                        phase = "phase1"
-                    elif task_func_masked == (TASK_TITLE_SCREEN_PHASE2_ADDR & 0xFFFFFFFE):
-                        phase = "phase2"
-                    elif task_func_masked == (TASK_TITLE_SCREEN_PHASE3_ADDR & 0xFFFFFFFE):
-                        phase = "pressStart"
-                    break
-        else:
-            for i in range(NUM_TASKS):
-                task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-                if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in title_task_addrs:
-                    any_task_active = True
-                    if task_func_masked == (TASK_TITLE_SCREEN_PHASE1_ADDR & 0xFFFFFFFE):
-                        phase = "phase1"
-                    elif task_func_masked == (TASK_TITLE_SCREEN_PHASE2_ADDR & 0xFFFFFFFE):
-                        phase = "phase2"
-                    elif task_func_masked == (TASK_TITLE_SCREEN_PHASE3_ADDR & 0xFFFFFFFE):
-                        phase = "pressStart"
-                    break
+        if tasks_raw is None or len(tasks_raw) < (NUM_TASKS * TASK_SIZE):
+            tasks_raw = _read_tasks_raw()
+        title_task_id = _find_active_task_by_masked_funcs(title_task_addrs, tasks_raw)
+        if title_task_id is None:
+            if callback2_masked not in title_cb2_addrs:
+                return None
+            return {"type": "titleScreen", "phase": None}
 
-        if callback2_masked not in title_cb2_addrs and not any_task_active:
-            return None
+        phase = None
+        task_func_masked = _u32le_from(tasks_raw, _TASK_BASES[title_task_id] + TASK_FUNC_OFFSET) & 0xFFFFFFFE
+        if task_func_masked == (TASK_TITLE_SCREEN_PHASE1_ADDR & 0xFFFFFFFE):
+            phase = "phase1"
+        elif task_func_masked == (TASK_TITLE_SCREEN_PHASE2_ADDR & 0xFFFFFFFE):
+            phase = "phase2"
+        elif task_func_masked == (TASK_TITLE_SCREEN_PHASE3_ADDR & 0xFFFFFFFE):
+            phase = "pressStart"
 
         return {"type": "titleScreen", "phase": phase}
     except Exception:
@@ -1342,10 +1477,42 @@ _CONTROLS_GUIDE_TASK_FUNCS = (
     TASK_CONTROLS_GUIDE_CHANGE_PAGE_ADDR,
     TASK_CONTROLS_GUIDE_CLEAR_ADDR,
 )
+# Controls Guide page bodies: ROM text pointers (read through the ROM string cache) with fallbacks.
+_CONTROLS_GUIDE_PAGE_BLOCKS: Dict[int, Tuple[Tuple[int, str], ...]] = {
+    0: ((GCONTROLS_GUIDE_TEXT_INTRO_ADDR, "The controls guide."),),
+    1: (
+        (GCONTROLS_GUIDE_TEXT_DPAD_ADDR, "D-PAD"),
+        (GCONTROLS_GUIDE_TEXT_ABUTTON_ADDR, "A BUTTON"),
+        (GCONTROLS_GUIDE_TEXT_BBUTTON_ADDR, "B BUTTON"),
+    ),
+    2: (
+        (GCONTROLS_GUIDE_TEXT_STARTBUTTON_ADDR, "START BUTTON"),
+        (GCONTROLS_GUIDE_TEXT_SELECTBUTTON_ADDR, "SELECT BUTTON"),
+        (GCONTROLS_GUIDE_TEXT_LRBUTTONS_ADDR, "L/R BUTTONS"),
+    ),
+}
+# Page names reported by the Controls Guide and the Pikachu intro (both three pages long).
+_PAGE_NAMES = ("page1", "page2", "page3")
 _PIKACHU_INTRO_TASK_FUNCS = (
     TASK_PIKACHU_INTRO_LOAD_PAGE1_ADDR,
     TASK_PIKACHU_INTRO_HANDLE_INPUT_ADDR,
 )
+_PIKACHU_INTRO_PAGE_TEXT_ADDRS = (
+    GPIKACHU_INTRO_TEXT_PAGE1_ADDR,
+    GPIKACHU_INTRO_TEXT_PAGE2_ADDR,
+    GPIKACHU_INTRO_TEXT_PAGE3_ADDR,
+)
+_PIKACHU_INTRO_PAGE_FALLBACKS = (
+    "In the world which you are about to enter...",
+    "There are also many places where people gather...",
+    "Now, why don't you tell me a little about yourself?",
+)
+# OakSpeechResources.currentPage .. windowIds[WIN_INTRO_TEXTBOX], read as one span by the Pikachu intro.
+_OAK_SPEECH_TEXTBOX_WINDOW_ID_OFFSET = OAK_SPEECH_WINDOW_IDS_OFFSET + (OAK_SPEECH_WIN_INTRO_TEXTBOX_INDEX * 2)
+_OAK_SPEECH_PAGE_WINDOW_LO = min(OAK_SPEECH_CURRENT_PAGE_OFFSET, _OAK_SPEECH_TEXTBOX_WINDOW_ID_OFFSET)
+_OAK_SPEECH_PAGE_WINDOW_SPAN = (
+    max(OAK_SPEECH_CURRENT_PAGE_OFFSET, _OAK_SPEECH_TEXTBOX_WINDOW_ID_OFFSET) + 2 - _OAK_SPEECH_PAGE_WINDOW_LO
+)
 _QUEST_LOG_STATE_NAMES = {
     QL_STATE_RECORDING: "RECORDING",
     QL_STATE_PLAYBACK: "PLAYBACK",
@@ -1380,37 +1547,12 @@ def get_controls_guide_state(tasks_raw: Optional[bytes] = None) -> Optional[Dict
         if page_raw < 0 or page_raw >= int(CONTROLS_GUIDE_NUM_PAGES):
             return None
 
-        def _txt(addr: int, fallback: str, max_len: int = 320) -> str:
-            try:
-                if int(addr) == 0:
-                    return fallback
-                t = _read_gba_cstring(int(addr), int(max_len)).strip()
-                return t or fallback
-            except Exception:
-                return fallback
-
-        page_blocks: Dict[int, List[Tuple[int, str]]] = {
-            0: [
-                (GCONTROLS_GUIDE_TEXT_INTRO_ADDR, "The controls guide."),
-            ],
-            1: [
-                (GCONTROLS_GUIDE_TEXT_DPAD_ADDR, "D-PAD"),
-                (GCONTROLS_GUIDE_TEXT_ABUTTON_ADDR, "A BUTTON"),
-                (GCONTROLS_GUIDE_TEXT_BBUTTON_ADDR, "B BUTTON"),
-            ],
-            2: [
-                (GCONTROLS_GUIDE_TEXT_STARTBUTTON_ADDR, "START BUTTON"),
-                (GCONTROLS_GUIDE_TEXT_SELECTBUTTON_ADDR, "SELECT BUTTON"),
-                (GCONTROLS_GUIDE_TEXT_LRBUTTONS_ADDR, "L/R BUTTONS"),
-            ],
-        }
-
         all_pages: List[str] = []
         for i in range(int(CONTROLS_GUIDE_NUM_PAGES)):
-            entries = page_blocks.get(i, [])
+            entries = _CONTROLS_GUIDE_PAGE_BLOCKS.get(i, ())
             body_parts: List[str] = []
             for addr, fallback in entries:
-                txt = _txt(int(addr), fallback)
+                txt = _text_or_fallback(int(addr), fallback, 320)
                 if txt:
                     body_parts.append(txt)
             all_pages.append("\n\n".join([p for p in body_parts if p]).strip())
@@ -1418,11 +1560,11 @@ def get_controls_guide_state(tasks_raw: Optional[bytes] = None) -> Optional[Dict
         current_page = int(page_raw)
         body_text = all_pages[current_page] if 0 <= current_page < len(all_pages) else ""
 
-        header_text = _txt(int(GTEXT_CONTROLS_ADDR), "CONTROLS", 64)
+        header_text = _text_or_fallback(int(GTEXT_CONTROLS_ADDR), "CONTROLS", 64)
         if current_page == 0:
-            controls_hint = _txt(int(GTEXT_ABUTTON_NEXT_ADDR), "A NEXT", 64)
+            controls_hint = _text_or_fallback(int(GTEXT_ABUTTON_NEXT_ADDR), "A NEXT", 64)
         else:
-            controls_hint = _txt(int(GTEXT_ABUTTON_NEXT_BBUTTON_BACK_ADDR), "A NEXT B BACK", 80)
+            controls_hint = _text_or_fallback(int(GTEXT_ABUTTON_NEXT_BBUTTON_BACK_ADDR), "A NEXT B BACK", 80)
 
         parts: List[str] = []
         if header_text:
@@ -1433,16 +1575,14 @@ def get_controls_guide_state(tasks_raw: Optional[bytes] = None) -> Optional[Dict
             parts.append(body_text)
         visible_text = "\n\n".join(parts).strip()
 
-        page_names = ["page1", "page2", "page3"]
-
         return {
             "type": "controlsGuide",
-            "taskId": int(task_id),
+            "taskId": task_id,
             "isReady": True,
             "page": {
-                "index": int(current_page),
-                "number": int(current_page) + 1,
-                "name": page_names[current_page] if 0 <= current_page < len(page_names) else f"page{current_page + 1}",
+                "index": current_page,
+                "number": current_page + 1,
+                "name": _PAGE_NAMES[current_page] if 0 <= current_page < len(_PAGE_NAMES) else f"page{current_page + 1}",
             },
             "pageCount": int(CONTROLS_GUIDE_NUM_PAGES),
             "allPages": all_pages,
@@ -1454,6 +1594,15 @@ def get_controls_guide_state(tasks_raw: Optional[bytes] = None) -> Optional[Dict
         return None
 
 
+def _pikachu_intro_pages() -> List[str]:
+    # Page text lives in ROM: successful decodes come from the ROM string cache, while a failed
+    # read shows that page's fallback for one frame only.
+    return [
+        _text_or_fallback(addr, fallback, 512)
+        for addr, fallback in zip(_PIKACHU_INTRO_PAGE_TEXT_ADDRS[:PIKACHU_INTRO_NUM_PAGES], _PIKACHU_INTRO_PAGE_FALLBACKS)
+    ]
+
+
 def get_pikachu_intro_state(
     tasks_raw: Optional[bytes] = None,
     *,
@@ -1475,46 +1624,21 @@ def get_pikachu_intro_state(
         if not (0x02000000 <= resources_ptr <= 0x0203FFFF):
             return None
 
-        page_raw = int(mgba_read16(resources_ptr + OAK_SPEECH_CURRENT_PAGE_OFFSET))
-        if page_raw < 0:
+        # currentPage and the textbox window id sit next to each other; fetch both in one read.
+        res_raw = mgba_read_range_bytes(resources_ptr + _OAK_SPEECH_PAGE_WINDOW_LO, _OAK_SPEECH_PAGE_WINDOW_SPAN)
+        if len(res_raw) < _OAK_SPEECH_PAGE_WINDOW_SPAN:
             return None
 
-        page_idx = int(page_raw)
+        page_idx = _u16le_from(res_raw, OAK_SPEECH_CURRENT_PAGE_OFFSET - _OAK_SPEECH_PAGE_WINDOW_LO)
         if page_idx >= int(PIKACHU_INTRO_NUM_PAGES):
             page_idx = int(PIKACHU_INTRO_NUM_PAGES) - 1
         if page_idx < 0:
             page_idx = 0
 
-        def _txt(addr: int, fallback: str, max_len: int = 512) -> str:
-            try:
-                if int(addr) == 0:
-                    return fallback
-                t = _read_gba_cstring(int(addr), int(max_len)).strip()
-                return t or fallback
-            except Exception:
-                return fallback
-
-        page_text_addrs = [
-            int(GPIKACHU_INTRO_TEXT_PAGE1_ADDR),
-            int(GPIKACHU_INTRO_TEXT_PAGE2_ADDR),
-            int(GPIKACHU_INTRO_TEXT_PAGE3_ADDR),
-        ]
-        page_fallbacks = [
-            "In the world which you are about to enter...",
-            "There are also many places where people gather...",
-            "Now, why don't you tell me a little about yourself?",
-        ]
-
-        all_pages: List[str] = []
-        for i in range(min(int(PIKACHU_INTRO_NUM_PAGES), len(page_text_addrs))):
-            all_pages.append(_txt(page_text_addrs[i], page_fallbacks[i]))
+        all_pages = _pikachu_intro_pages()
 
         body_text: Optional[str] = None
-        textbox_window_id = int(
-            mgba_read16(
-                resources_ptr + OAK_SPEECH_WINDOW_IDS_OFFSET + (int(OAK_SPEECH_WIN_INTRO_TEXTBOX_INDEX) * 2)
-            )
-        )
+        textbox_window_id = _u16le_from(res_raw, _OAK_SPEECH_TEXTBOX_WINDOW_ID_OFFSET - _OAK_SPEECH_PAGE_WINDOW_LO)
         if 0 <= textbox_window_id < 32:
             body_text = get_textprinter_text_for_window(
                 textbox_window_id,
@@ -1530,9 +1654,9 @@ def get_pikachu_intro_state(
             body_text = all_pages[page_idx]
 
         controls_hint = (
-            _txt(int(GTEXT_ABUTTON_NEXT_ADDR), "A NEXT", 64)
+            _text_or_fallback(int(GTEXT_ABUTTON_NEXT_ADDR), "A NEXT", 64)
             if page_idx == 0
-            else _txt(int(GTEXT_ABUTTON_NEXT_BBUTTON_BACK_ADDR), "A NEXT B BACK", 96)
+            else _text_or_fallback(int(GTEXT_ABUTTON_NEXT_BBUTTON_BACK_ADDR), "A NEXT B BACK", 96)
         )
 
         parts: List[str] = []
@@ -1542,16 +1666,14 @@ def get_pikachu_intro_state(
             parts.append(body_text)
         visible_text = "\n\n".join(parts).strip()
 
-        page_names = ["page1", "page2", "page3"]
-
         return {
             "type": "pikachuIntro",
-            "taskId": int(task_id),
+            "taskId": task_id,
             "isReady": True,
             "page": {
-                "index": int(page_idx),
-                "number": int(page_idx) + 1,
-                "name": page_names[page_idx] if 0 <= page_idx < len(page_names) else f"page{page_idx + 1}",
+                "index": page_idx,
+                "number": page_idx + 1,
+                "name": _PAGE_NAMES[page_idx] if 0 <= page_idx < len(_PAGE_NAMES) else f"page{page_idx + 1}",
             },
             "pageCount": int(PIKACHU_INTRO_NUM_PAGES),
             "allPages": all_pages,
@@ -1579,23 +1701,39 @@ def get_quest_log_playback_state(
     - sWindowIds[WIN_DESCRIPTION]
     """
     try:
-        if quest_log_state_raw is not None and len(quest_log_state_raw) >= 1:
-            quest_log_state = int(quest_log_state_raw[0])
-        else:
-            quest_log_state = int(mgba_read8(GQUEST_LOG_STATE_ADDR))
-
+        # Reject non-playback frames before touching the bridge whenever the state was snapshotted;
+        # whatever else the caller didn't snapshot is then fetched together, in one bridge call.
+        if quest_log_state_raw and quest_log_state_raw[0] not in (QL_STATE_PLAYBACK, QL_STATE_PLAYBACK_LAST):
+            return None
+        if (
+            not quest_log_state_raw
+            or not quest_log_playback_state_raw
+            or quest_log_window_ids_raw is None
+            or len(quest_log_window_ids_raw) < QUEST_LOG_WINDOW_COUNT
+        ):
+            fetched = mgba_read_ranges_bytes(
+                [
+                    (GQUEST_LOG_STATE_ADDR, 1),
+                    (GQUEST_LOG_PLAYBACK_STATE_ADDR, 1),
+                    (SQUEST_LOG_WINDOW_IDS_ADDR, QUEST_LOG_WINDOW_COUNT),
+                ]
+            )
+            if len(fetched) < 3:
+                return None
+            if not quest_log_state_raw:
+                quest_log_state_raw = fetched[0]
+            if not quest_log_playback_state_raw:
+                quest_log_playback_state_raw = fetched[1]
+            if quest_log_window_ids_raw is None or len(quest_log_window_ids_raw) < QUEST_LOG_WINDOW_COUNT:
+                quest_log_window_ids_raw = fetched[2]
+
+        quest_log_state = int(quest_log_state_raw[0])
         if quest_log_state not in (QL_STATE_PLAYBACK, QL_STATE_PLAYBACK_LAST):
             return None
 
-        if quest_log_playback_state_raw is not None and len(quest_log_playback_state_raw) >= 1:
-            playback_state = int(quest_log_playback_state_raw[0])
-        else:
-            playback_state = int(mgba_read8(GQUEST_LOG_PLAYBACK_STATE_ADDR))
+        playback_state = int(quest_log_playback_state_raw[0])
 
-        if quest_log_window_ids_raw is not None and len(quest_log_window_ids_raw) >= QUEST_LOG_WINDOW_COUNT:
-            window_ids = bytes(quest_log_window_ids_raw[:QUEST_LOG_WINDOW_COUNT])
-        else:
-            window_ids = mgba_read_range_bytes(SQUEST_LOG_WINDOW_IDS_ADDR, QUEST_LOG_WINDOW_COUNT)
+        window_ids = quest_log_window_ids_raw
         if len(window_ids) < QUEST_LOG_WINDOW_COUNT:
             return None
 
@@ -1666,10 +1804,10 @@ def get_quest_log_playback_state(
         return None
 
 
-_NEW_GAME_BIRCH_SPEECH_TASK_ADDRS_MASKED: Optional[set[int]] = None
+_NEW_GAME_BIRCH_SPEECH_TASK_ADDRS_MASKED: Optional[frozenset[int]] = None
 
 
-def _new_game_birch_speech_task_addrs_masked() -> set[int]:
+def _new_game_birch_speech_task_addrs_masked() -> frozenset[int]:
     global _NEW_GAME_BIRCH_SPEECH_TASK_ADDRS_MASKED
     if _NEW_GAME_BIRCH_SPEECH_TASK_ADDRS_MASKED is None:
         addrs: List[int] = []
@@ -1677,7 +1815,9 @@ def _new_game_birch_speech_task_addrs_masked() -> set[int]:
         addrs.extend(_sym_addrs_by_prefix("Task_NewGameBirchSpeech"))
         addrs.extend(_sym_addrs_by_prefix("Task_OakSpeech"))
         addrs.extend(_sym_addrs_by_prefix("Task_NewGameScene"))
-        _NEW_GAME_BIRCH_SPEECH_TASK_ADDRS_MASKED = {int(addr) & 0xFFFFFFFE for addr in addrs if int(addr) != 0}
+        _NEW_GAME_BIRCH_SPEECH_TASK_ADDRS_MASKED = frozenset(
+            int(addr) & 0xFFFFFFFE for addr in addrs if int(addr) != 0
+        )
     return _NEW_GAME_BIRCH_SPEECH_TASK_ADDRS_MASKED
 
 
@@ -1694,26 +1834,9 @@ def _is_new_game_birch_speech_active(tasks_raw: Optional[bytes] = None) -> bool:
         if not task_addrs:
             return False
 
-        if tasks_raw is not None and len(tasks_raw) >= (NUM_TASKS * TASK_SIZE):
-            for i in range(NUM_TASKS):
-                base = i * TASK_SIZE
-                if (base + TASK_SIZE) > len(tasks_raw):
-                    break
-                if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func in task_addrs:
-                    return True
-            return False
-
-        for i in range(NUM_TASKS):
-            task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-            if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-                continue
-            task_func = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-            if task_func in task_addrs:
-                return True
-        return False
+        if tasks_raw is None or len(tasks_raw) < (NUM_TASKS * TASK_SIZE):
+            tasks_raw = _read_tasks_raw()
+        return not _decode_active_tasks(tasks_raw).keys().isdisjoint(task_addrs)
     except Exception:
         return False
 
@@ -1721,14 +1844,18 @@ def _is_new_game_birch_speech_active(tasks_raw: Optional[bytes] = None) -> bool:
 _NEW_GAME_BIRCH_GENDER_PROMPT_FALLBACK = "Are you a boy?\nOr are you a girl?"
 
 
-_BERRY_CRUSH_RANKINGS_TASK_ADDR_MASKED: Optional[int] = None
-
-
-def _berry_crush_rankings_task_addr_masked() -> int:
-    global _BERRY_CRUSH_RANKINGS_TASK_ADDR_MASKED
-    if _BERRY_CRUSH_RANKINGS_TASK_ADDR_MASKED is None:
-        _BERRY_CRUSH_RANKINGS_TASK_ADDR_MASKED = int(TASK_BERRY_CRUSH_SHOW_RANKINGS_ADDR) & 0xFFFFFFFE
-    return int(_BERRY_CRUSH_RANKINGS_TASK_ADDR_MASKED)
+# Both come straight from address constants, so they are resolved at import (unlike the speech
+# task set above, which needs a symbol-table prefix scan).
+_NEW_GAME_BIRCH_GENDER_TASK_ADDRS_MASKED = frozenset(
+    addr & 0xFFFFFFFE
+    for addr in (
+        TASK_NEW_GAME_BIRCH_SPEECH_CHOOSE_GENDER_ADDR,
+        TASK_NEW_GAME_BIRCH_SPEECH_SLIDE_OUT_OLD_GENDER_SPRITE_ADDR,
+        TASK_NEW_GAME_BIRCH_SPEECH_SLIDE_IN_NEW_GENDER_SPRITE_ADDR,
+    )
+    if addr
+)
+_BERRY_CRUSH_RANKINGS_TASK_ADDR_MASKED = TASK_BERRY_CRUSH_SHOW_RANKINGS_ADDR & 0xFFFFFFFE
 
 
 _BERRY_CRUSH_RANKINGS_PHASE_BY_STATE: Dict[int, str] = {
@@ -1739,6 +1866,11 @@ _BERRY_CRUSH_RANKINGS_PHASE_BY_STATE: Dict[int, str] = {
 }
 
 
+# Task_ShowRankings data[0..5]: state, windowId, pressing speed for 2..5 players (packed u16 each).
+_BERRY_CRUSH_RANKINGS_TASK_DATA = struct.Struct("<6H")
+_BERRY_CRUSH_RANKINGS_HEADER_LINES = ("BERRY CRUSH", "Pressing-Speed Rankings", "")
+
+
 _BERRY_CRUSH_PRESSING_SPEED_CONVERSION_TABLE = [
     50000000,  # 50.000000
     25000000,  # 25.000000
@@ -1749,6 +1881,12 @@ _BERRY_CRUSH_PRESSING_SPEED_CONVERSION_TABLE = [
     781250,  # 0.781250
     390625,  # 0.390625
 ]
+# Hundredths for every possible fractional byte (bit 7 maps to the first table entry).
+_BERRY_CRUSH_PRESSING_SPEED_FRAC_TABLE = tuple(
+    sum(val for j, val in enumerate(_BERRY_CRUSH_PRESSING_SPEED_CONVERSION_TABLE) if (frac_bits >> (7 - j)) & 1)
+    // 1_000_000
+    for frac_bits in range(256)
+)
 
 
 def _berry_crush_times_per_sec_from_packing(raw: int) -> str:
@@ -1759,14 +1897,7 @@ def _berry_crush_times_per_sec_from_packing(raw: int) -> str:
     integer part and converting the low byte bits into hundredths via sPressingSpeedConversionTable.
     """
     packed = int(raw) & 0xFFFF
-    int_part = (packed >> 8) & 0xFF
-    frac_bits = packed & 0xFF
-    score = 0
-    for j, val in enumerate(_BERRY_CRUSH_PRESSING_SPEED_CONVERSION_TABLE):
-        if ((frac_bits >> (7 - j)) & 1) != 0:
-            score += int(val)
-    frac = int(score // 1_000_000)
-    return f"{int_part}.{frac:02d}"
+    return f"{packed >> 8}.{_BERRY_CRUSH_PRESSING_SPEED_FRAC_TABLE[packed & 0xFF]:02d}"
 
 
 def get_berry_crush_rankings_state(tasks_raw: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
@@ -1777,7 +1908,7 @@ def get_berry_crush_rankings_state(tasks_raw: Optional[bytes] = None) -> Optiona
     It is not the standard dialog box (window 0).
     """
     try:
-        target = _berry_crush_rankings_task_addr_masked()
+        target = _BERRY_CRUSH_RANKINGS_TASK_ADDR_MASKED
         if target == 0:
             return None
 
@@ -1792,10 +1923,8 @@ def get_berry_crush_rankings_state(tasks_raw: Optional[bytes] = None) -> Optiona
             wid = int(window_id) & 0xFF
             speeds = [_berry_crush_times_per_sec_from_packing(v) for v in pressing_speeds_raw]
 
-            lines: List[str] = ["BERRY CRUSH", "Pressing-Speed Rankings", ""]
-            for i, speed in enumerate(speeds):
-                players = i + 2
-                lines.append(f"{players} PLAYERS: {speed} Times/sec.")
+            lines = [*_BERRY_CRUSH_RANKINGS_HEADER_LINES]
+            lines.extend(f"{i + 2} PLAYERS: {speed} Times/sec." for i, speed in enumerate(speeds))
 
             return {
                 "type": "berryCrushRankings",
@@ -1810,49 +1939,17 @@ def get_berry_crush_rankings_state(tasks_raw: Optional[bytes] = None) -> Optiona
                 "visibleText": "\n".join(lines).strip(),
             }
 
-        if tasks_raw is not None and len(tasks_raw) >= (NUM_TASKS * TASK_SIZE):
-            for i in range(NUM_TASKS):
-                base = i * TASK_SIZE
-                if (base + TASK_SIZE) > len(tasks_raw):
-                    break
-                if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func != target:
-                    continue
-                state = int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET))
-                window_id = int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + (1 * 2)))
-                pressing_raw = [
-                    int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + (2 * 2))),
-                    int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + (3 * 2))),
-                    int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + (4 * 2))),
-                    int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + (5 * 2))),
-                ]
-                if int(state) >= 3:
-                    return None
-                return _build_state(i, state=state, window_id=window_id, pressing_speeds_raw=pressing_raw)
+        if tasks_raw is None or len(tasks_raw) < (NUM_TASKS * TASK_SIZE):
+            tasks_raw = _read_tasks_raw()
+        task_id = _decode_active_tasks(tasks_raw).get(target)
+        if task_id is None:
             return None
-
-        for i in range(NUM_TASKS):
-            task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-            if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-                continue
-            task_func = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-            if task_func != target:
-                continue
-            state = int(mgba_read16(task_addr + TASK_DATA_OFFSET))
-            window_id = int(mgba_read16(task_addr + TASK_DATA_OFFSET + (1 * 2)))
-            pressing_raw = [
-                int(mgba_read16(task_addr + TASK_DATA_OFFSET + (2 * 2))),
-                int(mgba_read16(task_addr + TASK_DATA_OFFSET + (3 * 2))),
-                int(mgba_read16(task_addr + TASK_DATA_OFFSET + (4 * 2))),
-                int(mgba_read16(task_addr + TASK_DATA_OFFSET + (5 * 2))),
-            ]
-            if int(state) >= 3:
-                return None
-            return _build_state(i, state=state, window_id=window_id, pressing_speeds_raw=pressing_raw)
-
-        return None
+        state, window_id, *pressing_raw = _BERRY_CRUSH_RANKINGS_TASK_DATA.unpack_from(
+            tasks_raw, _TASK_BASES[task_id] + TASK_DATA_OFFSET
+        )
+        if state >= 3:
+            return None
+        return _build_state(task_id, state=state, window_id=window_id, pressing_speeds_raw=pressing_raw)
     except Exception:
         return None
 
@@ -1870,39 +1967,13 @@ def get_new_game_birch_gender_menu_state(
     and uses `sMenu.cursorPos` for selection.
     """
     try:
-        gender_task_addrs = {
-            int(addr) & 0xFFFFFFFE
-            for addr in (
-                TASK_NEW_GAME_BIRCH_SPEECH_CHOOSE_GENDER_ADDR,
-                TASK_NEW_GAME_BIRCH_SPEECH_SLIDE_OUT_OLD_GENDER_SPRITE_ADDR,
-                TASK_NEW_GAME_BIRCH_SPEECH_SLIDE_IN_NEW_GENDER_SPRITE_ADDR,
-            )
-            if int(addr) != 0
-        }
+        gender_task_addrs = _NEW_GAME_BIRCH_GENDER_TASK_ADDRS_MASKED
         if not gender_task_addrs:
             return None
 
-        active = False
-        if tasks_raw is not None and len(tasks_raw) >= (NUM_TASKS * TASK_SIZE):
-            for i in range(NUM_TASKS):
-                base = i * TASK_SIZE
-                if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in gender_task_addrs:
-                    active = True
-                    break
-        else:
-            for i in range(NUM_TASKS):
-                task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-                if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
-                task_func_masked = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func_masked in gender_task_addrs:
-                    active = True
-                    break
-
-        if not active:
+        if tasks_raw is None or len(tasks_raw) < (NUM_TASKS * TASK_SIZE):
+            tasks_raw = _read_tasks_raw()
+        if _decode_active_tasks(tasks_raw).keys().isdisjoint(gender_task_addrs):
             return None
 
         cursor_pos = _read_menu_cursor_pos(smenu_raw)
@@ -1989,6 +2060,29 @@ _NAMING_SCREEN_KEYBOARD_ROWS = {
     _KEYBOARD_LETTERS_UPPER: ["ABCDEF .", "GHIJKL ,", "MNOPQRS ", "TUVWXYZ "],
     _KEYBOARD_SYMBOLS: ["01234   ", "56789   ", "!?♂♀/-  ", "…“”‘'   "],
 }
+# Per keyboard id: each row split into its key characters, truncated to the keyboard's column count.
+_NAMING_SCREEN_KEYBOARD_ROWS_SPLIT: Dict[int, Tuple[Tuple[str, ...], ...]] = {
+    kid: tuple(tuple(r[: _NAMING_SCREEN_KEYBOARD_COLS.get(kid, 8)]) for r in rows)
+    for kid, rows in _NAMING_SCREEN_KEYBOARD_ROWS.items()
+}
+
+_NAMING_SCREEN_HEADER_LINE = "MOVE OK BACK"
+_NAMING_SCREEN_BUTTON_NAMES = {0: "PAGE", 1: "BACK", 2: "OK"}
+# Button rows below the page toggle (whose label depends on the page), as (cursor y, label).
+_NAMING_SCREEN_FIXED_BUTTON_LINES = ((1, "BACK (B)"), (2, "OK (START)"))
+_SPRITE_DATA_XY = struct.Struct("<hh")  # cursor sprite data[0] (s16 x), data[1] (s16 y)
+# (templatePtr, templateNum, monSpeciesId) -> (maxChars, displayed title, species name) for the
+# naming screen currently open.
+_NAMING_SCREEN_TEMPLATE_CACHE: Dict[Tuple[int, int, int], Tuple[int, str, Optional[str]]] = {}
+
+
+@lru_cache(maxsize=64)
+def _naming_screen_keyboard_line(row: Tuple[Any, ...], cursor_col: int) -> str:
+    """Render one keyboard row ("␠" for space), marking `cursor_col` with "►" (-1: no cursor on this row)."""
+    cells = ["␠" if key == " " else (key if isinstance(key, str) else "") for key in row]
+    if 0 <= cursor_col < len(cells):
+        cells[cursor_col] = "►" + cells[cursor_col]
+    return " ".join(cells)
 
 
 def _format_naming_screen_visible_text(state: Dict[str, Any]) -> str:
@@ -2000,14 +2094,7 @@ def _format_naming_screen_visible_text(state: Dict[str, Any]) -> str:
         max_chars = 7
 
     text = str(state.get("text") or "")
-    slots: List[str] = []
-    for i in range(max_chars):
-        if i < len(text):
-            ch = text[i]
-            slots.append("␠" if ch == " " else ch)
-        else:
-            slots.append("_")
-    name_line = "".join(slots)
+    name_line = text[:max_chars].replace(" ", "␠").ljust(max_chars, "_")
 
     cursor = state.get("cursor") if isinstance(state.get("cursor"), dict) else {}
     cursor_x = int(cursor.get("x") or 0)
@@ -2015,36 +2102,29 @@ def _format_naming_screen_visible_text(state: Dict[str, Any]) -> str:
     cursor_area = str(cursor.get("area") or "")
 
     kb = state.get("keyboard") if isinstance(state.get("keyboard"), dict) else {}
-    kb_rows = kb.get("rows") if isinstance(kb.get("rows"), list) else []
+    kb_rows = kb.get("rows") if isinstance(kb.get("rows"), (list, tuple)) else []
     kb_col_count = int(kb.get("colCount") or 0)
 
-    lines: List[str] = ["MOVE OK BACK", title, name_line, "", f"Keyboard ({page}):"]
+    lines: List[str] = [_NAMING_SCREEN_HEADER_LINE, title, name_line, "", f"Keyboard ({page}):"]
 
     if kb_rows and kb_col_count > 0:
+        key_cursor_y = cursor_y if cursor_area == "keys" else -1
         for row_idx, row in enumerate(kb_rows):
-            if not isinstance(row, list):
+            if not isinstance(row, (list, tuple)):
                 continue
-            cells: List[str] = []
-            for col_idx in range(min(kb_col_count, len(row))):
-                key = row[col_idx]
-                key_s = str(key) if isinstance(key, str) else ""
-                key_disp = "␠" if key_s == " " else key_s
-                prefix = "►" if (cursor_area == "keys" and row_idx == cursor_y and col_idx == cursor_x) else ""
-                cells.append(f"{prefix}{key_disp}")
-            lines.append(" ".join(cells))
+            lines.append(
+                _naming_screen_keyboard_line(
+                    tuple(row[:kb_col_count]), cursor_x if row_idx == key_cursor_y else -1
+                )
+            )
 
     lines.append("")
     lines.append("Buttons:")
-    btn_lines = [
-        (0, f"{next_page or 'PAGE'} (SELECT)"),
-        (1, "BACK (B)"),
-        (2, "OK (START)"),
-    ]
-    for btn_y, label in btn_lines:
-        prefix = "►" if (cursor_area == "buttons" and btn_y == cursor_y) else " "
-        lines.append(f"{prefix}{label}")
+    btn_cursor_y = cursor_y if cursor_area == "buttons" else -1
+    lines.append(f"{_CURSOR_PREFIX[btn_cursor_y != 0]}{next_page or 'PAGE'} (SELECT)")
+    lines.extend(_CURSOR_PREFIX[btn_cursor_y != btn_y] + label for btn_y, label in _NAMING_SCREEN_FIXED_BUTTON_LINES)
 
-    return "\n".join([ln for ln in lines if ln is not None])
+    return "\n".join(lines)
 
 
 def get_naming_screen_state(callback2: Optional[int] = None) -> Optional[Dict[str, Any]]:
@@ -2065,10 +2145,13 @@ def get_naming_screen_state(callback2: Optional[int] = None) -> Optional[Dict[st
         elif cb2_masked == (CB2_NAMING_SCREEN_ADDR & 0xFFFFFFFE):
             phase = "active"
         else:
+            if _NAMING_SCREEN_TEMPLATE_CACHE:
+                _NAMING_SCREEN_TEMPLATE_CACHE.clear()
             return None
 
         ns_ptr = int(mgba_read32(SNAMING_SCREEN_PTR_ADDR))
         if ns_ptr == 0:
+            _NAMING_SCREEN_TEMPLATE_CACHE.clear()
             return None
 
         text_buf = mgba_read_range_bytes(ns_ptr + NAMING_SCREEN_TEXT_BUFFER_OFFSET, NAMING_SCREEN_TEXT_BUFFER_SIZE)
@@ -2086,60 +2169,61 @@ def get_naming_screen_state(callback2: Optional[int] = None) -> Optional[Dict[st
 
         keyboard_id = _NAMING_SCREEN_PAGE_TO_KEYBOARD_ID.get(current_page, _KEYBOARD_LETTERS_UPPER)
         col_count = int(_NAMING_SCREEN_KEYBOARD_COLS.get(keyboard_id, 8))
-        rows_s = _NAMING_SCREEN_KEYBOARD_ROWS.get(keyboard_id, [])
-        rows: List[List[str]] = []
-        for r in rows_s:
-            if not isinstance(r, str):
-                continue
-            rows.append([ch for ch in r[:col_count]])
+        rows = _NAMING_SCREEN_KEYBOARD_ROWS_SPLIT.get(keyboard_id, ())
 
         cursor_sprite_id = int(_u8_from(state_raw, NAMING_SCREEN_CURSOR_SPRITE_ID_REL))
         cursor_x = 0
         cursor_y = 0
         if 0 <= cursor_sprite_id < 64:
             sprite_base = GSPRITES_ADDR + (cursor_sprite_id * SPRITE_SIZE) + SPRITE_DATA_OFFSET
-            spr_raw = mgba_read_range_bytes(sprite_base, 4)
-            cursor_x = _s16_from_u16(_u16le_from(spr_raw, 0))
-            cursor_y = _s16_from_u16(_u16le_from(spr_raw, 2))
+            cursor_x, cursor_y = _SPRITE_DATA_XY.unpack_from(mgba_read_range_bytes(sprite_base, 4))
 
         cursor_area = "keys"
         selected: Optional[str] = None
         if cursor_x >= col_count:
             cursor_area = "buttons"
-            selected = {0: "PAGE", 1: "BACK", 2: "OK"}.get(cursor_y)
+            selected = _NAMING_SCREEN_BUTTON_NAMES.get(cursor_y)
         else:
             if 0 <= cursor_y < len(rows) and 0 <= cursor_x < col_count:
                 selected = rows[cursor_y][cursor_x]
 
+        # The template (and its title) is fixed for the lifetime of one naming screen session.
         template_ptr = int(_u32le_from(state_raw, NAMING_SCREEN_TEMPLATE_PTR_REL))
-        max_chars = 7
-        title = ""
-        if template_ptr:
-            tmpl_raw = mgba_read_range_bytes(template_ptr, 12)
-            max_chars_val = int(_u8_from(tmpl_raw, NAMING_SCREEN_TEMPLATE_MAX_CHARS_OFFSET))
-            if 0 < max_chars_val <= 16:
-                max_chars = max_chars_val
-            title_ptr = int(_u32le_from(tmpl_raw, NAMING_SCREEN_TEMPLATE_TITLE_PTR_OFFSET))
-            if title_ptr:
-                title_raw = mgba_read_range_bytes(title_ptr, 32)
-                title = decode_gba_string(title_raw, 32)
-
-        if not title:
-            if template_num == 1:
-                title = "BOX NAME?"
-            elif template_num in (2, 3):
-                title = "'s nickname?"
-            else:
-                title = "YOUR NAME?"
-
-        mon_species_name = get_species_name(mon_species_id) if mon_species_id else None
-        if is_mon_naming and mon_species_name:
-            # naming_screen.c builds the displayed title by prepending gSpeciesNames[monSpecies]
-            # then appending template->title (which starts with a {STR_VAR_1} control code).
-            # Our decoder strips the control code, leaving "'s nickname?", so we reproduce the
-            # game's visible result here.
-            if not str(title).startswith(mon_species_name):
-                title = f"{mon_species_name}{title}"
+        template_key = (template_ptr, template_num, mon_species_id)
+        cached_template = _NAMING_SCREEN_TEMPLATE_CACHE.get(template_key)
+        if cached_template is not None:
+            max_chars, title, mon_species_name = cached_template
+        else:
+            max_chars = 7
+            title = ""
+            if template_ptr:
+                tmpl_raw = mgba_read_range_bytes(template_ptr, 12)
+                max_chars_val = int(_u8_from(tmpl_raw, NAMING_SCREEN_TEMPLATE_MAX_CHARS_OFFSET))
+                if 0 < max_chars_val <= 16:
+                    max_chars = max_chars_val
+                title_ptr = int(_u32le_from(tmpl_raw, NAMING_SCREEN_TEMPLATE_TITLE_PTR_OFFSET))
+                if title_ptr:
+                    title_raw = mgba_read_range_bytes(title_ptr, 32)
+                    title = decode_gba_string(title_raw, 32)
+
+            if not title:
+                if template_num == 1:
+                    title = "BOX NAME?"
+                elif template_num in (2, 3):
+                    title = "'s nickname?"
+                else:
+                    title = "YOUR NAME?"
+
+            mon_species_name = get_species_name(mon_species_id) if mon_species_id else None
+            if is_mon_naming and mon_species_name:
+                # naming_screen.c builds the displayed title by prepending gSpeciesNames[monSpecies]
+                # then appending template->title (which starts with a {STR_VAR_1} control code).
+                # Our decoder strips the control code, leaving "'s nickname?", so we reproduce the
+                # game's visible result here.
+                if not title.startswith(mon_species_name):
+                    title = f"{mon_species_name}{title}"
+            if template_ptr:
+                _NAMING_SCREEN_TEMPLATE_CACHE[template_key] = (max_chars, title, mon_species_name)
 
         text = decode_gba_string(text_buf, max_chars + 1)
 
@@ -2186,39 +2270,127 @@ def _read_menu_cursor_pos(smenu_raw: Optional[bytes] = None) -> int:
     return _s8_from_u8(_u8_from(smenu_raw, SMENU_CURSORPOS_OFFSET))
 
 
+# Last gTasks snapshot and its u16 view, reused while callers keep passing the same buffer.
+_TASKS_U16_VIEW_CACHE: Tuple[Optional[bytes], Optional[memoryview]] = (None, None)
+
+
+def _tasks_u16_view(tasks_raw: bytes) -> Optional[memoryview]:
+    """gTasks snapshot as native u16 words (None when the host or buffer can't be cast as little-endian)."""
+    global _TASKS_U16_VIEW_CACHE
+    cached_raw, cached_view = _TASKS_U16_VIEW_CACHE
+    if cached_raw is tasks_raw:
+        return cached_view
+    view = None
+    if _NATIVE_LITTLE_ENDIAN and isinstance(tasks_raw, (bytes, bytearray)) and len(tasks_raw) % 2 == 0:
+        view = memoryview(tasks_raw).cast("B").cast("H")
+    if type(tasks_raw) is bytes:
+        _TASKS_U16_VIEW_CACHE = (tasks_raw, view)
+    return view
+
+
 def _read_task_data_u16(task_id: int, data_index: int, tasks_raw: Optional[bytes] = None) -> int:
     if tasks_raw is not None:
         base = (int(task_id) * TASK_SIZE) + TASK_DATA_OFFSET + (int(data_index) * 2)
-        return int(_u16le_from(tasks_raw, base))
+        words = _tasks_u16_view(tasks_raw)
+        if words is None:
+            return int(_u16le_from(tasks_raw, base))
+        return int(words[base >> 1]) if 0 <= base < len(tasks_raw) - 1 else 0
     addr = GTASKS_ADDR + (int(task_id) * TASK_SIZE) + TASK_DATA_OFFSET + (int(data_index) * 2)
     return int(mgba_read16(addr))
 
 
+def _read_tasks_raw() -> bytes:
+    """Fetch the whole gTasks array in one bridge call (for callers that weren't handed a snapshot)."""
+    return mgba_read_range_bytes(GTASKS_ADDR, NUM_TASKS * TASK_SIZE)
+
+
+# struct Task viewed as (func, isActive) records of TASK_SIZE bytes.
+_TASK_HEAD_STRUCT = struct.Struct(
+    f"<{TASK_FUNC_OFFSET}xI{TASK_ISACTIVE_OFFSET - TASK_FUNC_OFFSET - 4}xB{TASK_SIZE - TASK_ISACTIVE_OFFSET - 1}x"
+)
+_ACTIVE_TASKS_CACHE: Tuple[Optional[bytes], Dict[int, int], Dict[int, Tuple[int, ...]]] = (None, {}, {})
+# Live lookups (no snapshot passed): masked TaskFunc / TaskFunc group -> taskId it was last found in.
+_LAST_ACTIVE_TASK_IDS: Dict[Union[int, frozenset], int] = {}
+
+
+def _decode_active_tasks(tasks_raw: bytes) -> Dict[int, int]:
+    """
+    Map each active TaskFunc (Thumb bit cleared) to its lowest taskId in a gTasks snapshot.
+
+    The readers of one frame all receive the same snapshot object, so the last decode is kept and
+    reused while the caller keeps passing that (immutable) buffer.
+    """
+    return _index_active_tasks(tasks_raw)[0]
+
+
+def _active_task_slots(tasks_raw: bytes) -> Dict[int, Tuple[int, ...]]:
+    """Map each active TaskFunc (Thumb bit cleared) to all of its taskIds, ascending, in a gTasks snapshot."""
+    return _index_active_tasks(tasks_raw)[1]
+
+
+def _index_active_tasks(tasks_raw: bytes) -> Tuple[Dict[int, int], Dict[int, Tuple[int, ...]]]:
+    global _ACTIVE_TASKS_CACHE
+    cached_raw, cached_first, cached_slots = _ACTIVE_TASKS_CACHE
+    if cached_raw is tasks_raw:
+        return cached_first, cached_slots
+
+    slots: Dict[int, Tuple[int, ...]] = {}
+    count = min(NUM_TASKS, len(tasks_raw) // TASK_SIZE)
+    for i, (func, is_active) in enumerate(_TASK_HEAD_STRUCT.iter_unpack(memoryview(tasks_raw)[: count * TASK_SIZE])):
+        if is_active:
+            func &= 0xFFFFFFFE
+            slots[func] = slots.get(func, ()) + (i,)
+    first = {func: ids[0] for func, ids in slots.items()}
+    if type(tasks_raw) is bytes:
+        _ACTIVE_TASKS_CACHE = (tasks_raw, first, slots)
+    return first, slots
+
+
+def _first_task_in(active: Dict[int, int], masked_set: Union[Tuple[int], frozenset]) -> Optional[int]:
+    """Lowest taskId in `active` (masked func -> taskId) whose func is in `masked_set`."""
+    return min([active[func] for func in masked_set if func in active], default=None)
+
+
+def _live_task_slot_func(task_id: int) -> Optional[int]:
+    """Masked TaskFunc of one live gTasks slot, or None if that slot is inactive."""
+    head = mgba_read_range_bytes(_TASK_ABS_BASES[task_id], TASK_ISACTIVE_OFFSET + 1)
+    if len(head) <= TASK_ISACTIVE_OFFSET or head[TASK_ISACTIVE_OFFSET] == 0:
+        return None
+    return _u32le_from(head, TASK_FUNC_OFFSET) & 0xFFFFFFFE
+
+
+def _find_live_task(key: Union[int, frozenset], masked_set: Union[Tuple[int], frozenset]) -> Optional[int]:
+    """
+    Live-memory lookup: re-check the slot `key` was last found in, and only bulk-read gTasks on a miss.
+
+    A menu's task normally keeps its slot for the menu's lifetime, so most frames cost one tiny read.
+    """
+    last_id = _LAST_ACTIVE_TASK_IDS.get(key)
+    if last_id is not None and _live_task_slot_func(last_id) in masked_set:
+        return last_id
+
+    task_id = _first_task_in(_decode_active_tasks(_read_tasks_raw()), masked_set)
+    if task_id is None:
+        _LAST_ACTIVE_TASK_IDS.pop(key, None)
+    else:
+        _LAST_ACTIVE_TASK_IDS[key] = task_id
+    return task_id
+
+
 def _find_active_task_by_func(func_addr: int, tasks_raw: Optional[bytes] = None) -> Optional[int]:
     """Return taskId for a given TaskFunc, or None if not active."""
     if int(func_addr) == 0:
         return None
     masked = func_addr & 0xFFFFFFFE
-    if tasks_raw is not None:
-        for i in range(NUM_TASKS):
-            base = i * TASK_SIZE
-            if (base + TASK_SIZE) > len(tasks_raw):
-                break
-            if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                continue
-            task_func = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-            if task_func == masked:
-                return i
-        return None
+    if tasks_raw is None:
+        return _find_live_task(masked, (masked,))
+    return _decode_active_tasks(tasks_raw).get(masked)
 
-    for i in range(NUM_TASKS):
-        task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-        if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-            continue
-        task_func = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-        if task_func == masked:
-            return i
-    return None
+
+@lru_cache(maxsize=64)
+def _masked_task_funcs(func_addrs: Union[Tuple[int, ...], frozenset]) -> frozenset:
+    """Masked (Thumb bit cleared), non-NULL form of a constant TaskFunc group, built once per group."""
+    return frozenset(int(addr) & 0xFFFFFFFE for addr in func_addrs if int(addr) != 0)
 
 
 def _find_active_task_by_funcs(func_addrs: Sequence[int], tasks_raw: Optional[bytes] = None) -> Optional[int]:
@@ -2228,55 +2400,64 @@ def _find_active_task_by_funcs(func_addrs: Sequence[int], tasks_raw: Optional[by
     Some UI state machines swap gTasks[taskId].func between many handlers; for those cases we treat
     any of the known functions as equivalent evidence that the UI is active.
     """
-    masked_set = {int(addr) & 0xFFFFFFFE for addr in func_addrs if int(addr) != 0}
+    if isinstance(func_addrs, (tuple, frozenset)):
+        masked_set = _masked_task_funcs(func_addrs)
+    else:
+        masked_set = frozenset(int(addr) & 0xFFFFFFFE for addr in func_addrs if int(addr) != 0)
+    return _find_active_task_by_masked_funcs(masked_set, tasks_raw)
+
+
+def _find_active_task_by_masked_funcs(masked_set: frozenset, tasks_raw: Optional[bytes] = None) -> Optional[int]:
+    """`_find_active_task_by_funcs` for a prebuilt frozenset of masked (Thumb bit cleared) TaskFuncs."""
     if not masked_set:
         return None
 
-    if tasks_raw is not None:
-        for i in range(NUM_TASKS):
-            base = i * TASK_SIZE
-            if (base + TASK_SIZE) > len(tasks_raw):
-                break
-            if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                continue
-            task_func = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-            if task_func in masked_set:
-                return i
-        return None
+    if tasks_raw is None:
+        return _find_live_task(masked_set, masked_set)
+    return _first_task_in(_decode_active_tasks(tasks_raw), masked_set)
 
-    for i in range(NUM_TASKS):
-        task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-        if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-            continue
-        task_func = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-        if task_func in masked_set:
-            return i
-    return None
 
+def _read_elevator_special_vars() -> Tuple[int, Optional[int]]:
+    """
+    Return (gSpecialVar_0x8004, gSpecialVar_0x8005) = (ListMenu type or -1, current floor index or None).
 
-def _read_elevator_floor_name() -> Tuple[Optional[int], Optional[str]]:
+    Both are fetched in a single bridge call.
+    """
+    ranges: List[Tuple[int, int]] = []
+    if GSPECIALVAR_0X8004_ADDR:
+        ranges.append((GSPECIALVAR_0X8004_ADDR, 2))
+    if GSPECIALVAR_0X8005_ADDR:
+        ranges.append((GSPECIALVAR_0X8005_ADDR, 2))
+    if not ranges:
+        return -1, None
     try:
-        if int(GSPECIALVAR_0X8005_ADDR) == 0:
-            return None, None
-        floor_idx = int(mgba_read16(GSPECIALVAR_0X8005_ADDR))
-        if floor_idx < 0:
-            return None, None
-
-        if int(SFLOOR_NAME_POINTERS_ADDR) == 0:
-            return floor_idx, None
-
-        table_bytes = int(SFLOOR_NAME_POINTERS_SIZE)
-        table_count = (table_bytes // 4) if table_bytes > 0 else 0
-        if table_count <= 0 or floor_idx >= table_count:
-            return floor_idx, None
-
-        ptr = int(mgba_read32(SFLOOR_NAME_POINTERS_ADDR + (floor_idx * 4)))
-        if ptr == 0:
-            return floor_idx, None
-        floor_name = _read_gba_cstring(ptr, 32) or None
-        return floor_idx, floor_name
+        chunks = iter(mgba_read_ranges_bytes(ranges))
+        list_menu_type = _u16le_from(next(chunks), 0) if GSPECIALVAR_0X8004_ADDR else -1
+        floor_idx = _u16le_from(next(chunks), 0) if GSPECIALVAR_0X8005_ADDR else None
+        return list_menu_type, floor_idx
     except Exception:
-        return None, None
+        return -1, None
+
+
+def _read_elevator_floor_name(floor_idx: Optional[int]) -> Optional[str]:
+    if floor_idx is None or int(SFLOOR_NAME_POINTERS_ADDR) == 0:
+        return None
+    table_count = max(int(SFLOOR_NAME_POINTERS_SIZE), 0) // 4
+    if not (0 <= floor_idx < table_count):
+        return None
+    try:
+        return _elevator_floor_name(floor_idx)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _elevator_floor_name(floor_idx: int) -> Optional[str]:
+    # sFloorNamePointers and the names it points at are ROM data; short reads raise so they are not cached.
+    ptr = _u32le_from(_read_rom_range_bytes(SFLOOR_NAME_POINTERS_ADDR + (floor_idx * 4), 4), 0)
+    if ptr < 0x08000000:
+        return None
+    return _read_rom_cstring(ptr, 32) or None
 
 
 def _read_script_list_menu_options(
@@ -2294,20 +2475,19 @@ def _read_script_list_menu_options(
             return options, scroll_offset, selected_row
 
         if tasks_raw is not None:
-            base = tid * TASK_SIZE
+            base = _TASK_BASES[tid]
             if (base + TASK_SIZE) > len(tasks_raw):
                 return options, scroll_offset, selected_row
+            list_raw = tasks_raw
             list_base = base + TASK_DATA_OFFSET
-            items_ptr = int(_u32le_from(tasks_raw, list_base + _LISTMENU_TEMPLATE_ITEMS_PTR_OFFSET))
-            total_items = int(_u16le_from(tasks_raw, list_base + _LISTMENU_TEMPLATE_TOTAL_ITEMS_OFFSET))
-            scroll_offset = int(_u16le_from(tasks_raw, list_base + _LISTMENU_CURSOR_POS_OFFSET))
-            selected_row = int(_u16le_from(tasks_raw, list_base + _LISTMENU_ITEMS_ABOVE_OFFSET))
         else:
-            list_base = GTASKS_ADDR + (tid * TASK_SIZE) + TASK_DATA_OFFSET
-            items_ptr = int(mgba_read32(list_base + _LISTMENU_TEMPLATE_ITEMS_PTR_OFFSET))
-            total_items = int(mgba_read16(list_base + _LISTMENU_TEMPLATE_TOTAL_ITEMS_OFFSET))
-            scroll_offset = int(mgba_read16(list_base + _LISTMENU_CURSOR_POS_OFFSET))
-            selected_row = int(mgba_read16(list_base + _LISTMENU_ITEMS_ABOVE_OFFSET))
+            list_raw = mgba_read_range_bytes(
+                _TASK_ABS_BASES[tid] + TASK_DATA_OFFSET, _LIST_MENU_TASK_STRUCT.size
+            )
+            list_base = 0
+        items_ptr, _, _, total_items, _, scroll_offset, selected_row = _LIST_MENU_TASK_STRUCT.unpack_from(
+            list_raw, list_base
+        )
 
         if items_ptr == 0:
             return options, scroll_offset, selected_row
@@ -2317,21 +2497,22 @@ def _read_script_list_menu_options(
         if total_items > 32:
             total_items = 32
 
-        ptr_chunks = mgba_read_ranges_bytes([(items_ptr + (i * 8), 4) for i in range(total_items)])
-        text_ptrs: List[int] = []
-        for i in range(total_items):
-            seg = ptr_chunks[i] if i < len(ptr_chunks) else b""
-            if isinstance(seg, (bytes, bytearray)) and len(seg) >= 4:
-                text_ptrs.append(int(_u32le_from(seg, 0)))
-            else:
-                text_ptrs.append(0)
+        # The ListMenuItem array is contiguous: fetch it in one read and take each label pointer.
+        items_raw = mgba_read_range_bytes(items_ptr, total_items * _LIST_MENU_ITEM_STRUCT.size)
+        items_len = (len(items_raw) // _LIST_MENU_ITEM_STRUCT.size) * _LIST_MENU_ITEM_STRUCT.size
+        text_ptrs = [ptr for (ptr,) in _LIST_MENU_ITEM_STRUCT.iter_unpack(memoryview(items_raw)[:items_len])]
+        text_ptrs.extend([0] * (total_items - len(text_ptrs)))
 
-        for i, text_ptr in enumerate(text_ptrs):
-            if text_ptr == 0:
-                options.append(f"CHOICE_{i}")
-                continue
-            txt = _read_gba_cstring(int(text_ptr), 64) or f"CHOICE_{i}"
-            options.append(txt)
+        # All labels come back from one batched read; ROM-only menus are served from the cache after that.
+        ptrs = tuple(text_ptrs)
+        try:
+            if all(ptr == 0 or ptr >= 0x08000000 for ptr in ptrs):
+                labels = _read_rom_cstrings(ptrs, 64)
+            else:
+                labels = _read_cstrings(ptrs, 64)
+        except Exception:
+            labels = tuple(_read_gba_cstring(ptr, 64) for ptr in ptrs)
+        options = [label or f"CHOICE_{i}" for i, label in enumerate(labels)]
     except Exception:
         return [], 0, 0
 
@@ -2354,6 +2535,15 @@ def get_elevator_menu_state(
     - Department Store / Rocket Hideout / Trainer Tower elevators (multichoice)
     """
     try:
+        # Nothing below is needed unless a script ListMenu or a multichoice task is running.
+        # Every task lookup below shares one gTasks snapshot (and its memoized func -> taskId index).
+        if tasks_raw is None:
+            tasks_raw = _read_tasks_raw()
+        list_menu_task_id = _find_active_task_by_masked_funcs(_SCRIPT_LIST_MENU_TASK_FUNCS_MASKED, tasks_raw)
+        multi_task_id = _find_active_task_by_func(TASK_HANDLE_MULTICHOICE_INPUT_ADDR, tasks_raw)
+        if list_menu_task_id is None and multi_task_id is None:
+            return None
+
         prompt_text = get_textprinter_text_for_window(
             0,
             text_printers_raw=text_printers_raw,
@@ -2365,13 +2555,12 @@ def get_elevator_menu_state(
             prompt_text = _read_gba_cstring(TEXT_WANT_WHICH_FLOOR_ADDR, 128) or "Which floor do you want?"
 
         now_on = _read_gba_cstring(GTEXT_NOW_ON_ADDR, 32) or "Now on:"
-        floor_idx, floor_name = _read_elevator_floor_name()
+        list_menu_type, floor_idx = _read_elevator_special_vars()
+        floor_name = _read_elevator_floor_name(floor_idx)
         current_floor_line = f"{now_on} {floor_name}".strip() if floor_name else None
 
         # 1) Silph Co elevator uses Script ListMenu (Task_ListMenuHandleInput), not multichoice.
-        list_menu_task_id = _find_active_task_by_funcs(_SCRIPT_LIST_MENU_TASK_FUNCS, tasks_raw)
         if list_menu_task_id is not None:
-            list_menu_type = int(mgba_read16(GSPECIALVAR_0X8004_ADDR)) if int(GSPECIALVAR_0X8004_ADDR) else -1
             if list_menu_type == _LISTMENU_SILPHCO_FLOORS:
                 list_task_id = _read_task_data_u16(
                     int(list_menu_task_id),
@@ -2400,9 +2589,7 @@ def get_elevator_menu_state(
                     if options:
                         if lines:
                             lines.append("")
-                        for i, opt in enumerate(options):
-                            prefix = "►" if i == selected_index else " "
-                            lines.append(f"{prefix}{opt}")
+                        lines.extend(_CURSOR_PREFIX[i != selected_index] + opt for i, opt in enumerate(options))
 
                     return {
                         "type": "elevatorMenu",
@@ -2425,12 +2612,11 @@ def get_elevator_menu_state(
                     }
 
         # 2) Other elevators use multichoice menus. Gate on known elevator multichoice IDs.
-        multi_task_id = _find_active_task_by_func(TASK_HANDLE_MULTICHOICE_INPUT_ADDR, tasks_raw)
         if multi_task_id is None:
             return None
 
         mc_id = _s16_from_u16(_read_task_data_u16(int(multi_task_id), 7, tasks_raw))
-        if int(mc_id) not in _ELEVATOR_MULTICHOICE_IDS:
+        if mc_id not in _ELEVATOR_MULTICHOICE_IDS:
             return None
 
         multichoice = get_multichoice_menu_state(
@@ -2459,9 +2645,7 @@ def get_elevator_menu_state(
         if options:
             if lines:
                 lines.append("")
-            for i, opt in enumerate(options):
-                prefix = "►" if i == cursor_pos else " "
-                lines.append(f"{prefix}{opt}")
+            lines.extend(_CURSOR_PREFIX[i != cursor_pos] + opt for i, opt in enumerate(options))
 
         return {
             "type": "elevatorMenu",
@@ -2483,70 +2667,84 @@ def get_elevator_menu_state(
         return None
 
 
+# Masked (Thumb bit cleared) ListMenu task func and bag list callbacks.
+_BAG_LIST_DUMMY_TASK_MASKED = LIST_MENU_DUMMY_TASK_ADDR & 0xFFFFFFFE
+_BAG_LIST_MOVE_CURSOR_MASKED = BAGMENU_MOVE_CURSOR_CALLBACK_ADDR & 0xFFFFFFFE
+_BAG_LIST_ITEM_PRINT_MASKED = BAGMENU_ITEM_PRINT_CALLBACK_ADDR & 0xFFFFFFFE
+
+
 def _find_bag_list_menu_scroll_and_row(tasks_raw: Optional[bytes] = None) -> Optional[Tuple[int, int]]:
     """
     Find the active ListMenu task used by the Bag item list and return (scrollOffset, selectedRow).
 
     Bag list selection is stored in the ListMenu task (ListMenuDummyTask), not reliably in gBagMenuState.
     """
-    try:
-        dummy_masked = LIST_MENU_DUMMY_TASK_ADDR & 0xFFFFFFFE
-        move_masked = BAGMENU_MOVE_CURSOR_CALLBACK_ADDR & 0xFFFFFFFE
-        print_masked = BAGMENU_ITEM_PRINT_CALLBACK_ADDR & 0xFFFFFFFE
-        if tasks_raw is not None:
-            for i in range(NUM_TASKS):
-                base = i * TASK_SIZE
-                if (base + TASK_SIZE) > len(tasks_raw):
-                    break
-                if _u8_from(tasks_raw, base + TASK_ISACTIVE_OFFSET) == 0:
-                    continue
+    if tasks_raw is None:
+        try:
+            tasks_raw = _read_tasks_raw()
+        except Exception:
+            return None
+    # The slot index only lists whole tasks, so the unpack below always stays inside the buffer.
+    for i in _active_task_slots(tasks_raw).get(_BAG_LIST_DUMMY_TASK_MASKED, ()):
+        data = _TASK_BASES[i] + TASK_DATA_OFFSET
+        _, move_cb, item_cb, _, window_id, scroll, row = _LIST_MENU_TASK_STRUCT.unpack_from(tasks_raw, data)
 
-                task_func = _u32le_from(tasks_raw, base + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-                if task_func != dummy_masked:
-                    continue
+        # WIN_ITEM_LIST is 0 in pokefirered/src/item_menu.c
+        if (
+            (move_cb & 0xFFFFFFFE) != _BAG_LIST_MOVE_CURSOR_MASKED
+            or (item_cb & 0xFFFFFFFE) != _BAG_LIST_ITEM_PRINT_MASKED
+            or window_id != 0
+        ):
+            continue
 
-                move_cb = (
-                    _u32le_from(tasks_raw, base + TASK_DATA_OFFSET + LISTMENU_TEMPLATE_MOVECURSORFUNC_OFFSET)
-                    & 0xFFFFFFFE
-                )
-                item_cb = (
-                    _u32le_from(tasks_raw, base + TASK_DATA_OFFSET + LISTMENU_TEMPLATE_ITEMPRINTFUNC_OFFSET)
-                    & 0xFFFFFFFE
-                )
-                window_id = _u8_from(tasks_raw, base + TASK_DATA_OFFSET + LISTMENU_TEMPLATE_WINDOWID_OFFSET)
+        return scroll, row
 
-                # WIN_ITEM_LIST is 0 in pokefirered/src/item_menu.c
-                if move_cb != move_masked or item_cb != print_masked or window_id != 0:
-                    continue
+    return None
 
-                scroll = int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + LISTMENU_SCROLL_OFFSET))
-                row = int(_u16le_from(tasks_raw, base + TASK_DATA_OFFSET + LISTMENU_SELECTED_ROW_OFFSET))
-                return scroll, row
-            return None
 
-        for i in range(NUM_TASKS):
-            task_addr = GTASKS_ADDR + (i * TASK_SIZE)
-            if mgba_read8(task_addr + TASK_ISACTIVE_OFFSET) == 0:
-                continue
+def _read_rom_range_bytes(addr: int, length: int) -> bytes:
+    """
+    `mgba_read_range_bytes` for ROM data that is about to be cached.
 
-            task_func = mgba_read32(task_addr + TASK_FUNC_OFFSET) & 0xFFFFFFFE
-            if task_func != dummy_masked:
-                continue
+    The bridge client returns b"" (or a short buffer) on a failed read instead of raising, so a
+    short read is raised here to keep the failure out of the caller's cache.
+    """
+    raw = mgba_read_range_bytes(addr, length)
+    if len(raw) < length:
+        raise RuntimeError(f"short ROM read at 0x{addr:08X}: {len(raw)}/{length} bytes")
+    return raw
 
-            move_cb = mgba_read32(task_addr + TASK_DATA_OFFSET + LISTMENU_TEMPLATE_MOVECURSORFUNC_OFFSET) & 0xFFFFFFFE
-            item_cb = mgba_read32(task_addr + TASK_DATA_OFFSET + LISTMENU_TEMPLATE_ITEMPRINTFUNC_OFFSET) & 0xFFFFFFFE
-            window_id = mgba_read8(task_addr + TASK_DATA_OFFSET + LISTMENU_TEMPLATE_WINDOWID_OFFSET)
 
-            if move_cb != move_masked or item_cb != print_masked or window_id != 0:
-                continue
+@lru_cache(maxsize=4096)
+def _read_rom_cstring(ptr: int, max_len: int) -> str:
+    # ROM text never changes; failed reads raise in _read_rom_range_bytes and are not cached.
+    return decode_gba_string(_read_rom_range_bytes(ptr, max_len), max_len)
 
-            scroll = int(mgba_read16(task_addr + TASK_DATA_OFFSET + LISTMENU_SCROLL_OFFSET))
-            row = int(mgba_read16(task_addr + TASK_DATA_OFFSET + LISTMENU_SELECTED_ROW_OFFSET))
-            return scroll, row
 
-        return None
-    except Exception:
-        return None
+def _read_cstrings(ptrs: Tuple[int, ...], max_len: int) -> Tuple[str, ...]:
+    """Decode the string at each pointer using a single batched read ("" for null pointers)."""
+    live = [(ptr, max_len) for ptr in ptrs if ptr]
+    blobs = iter(mgba_read_ranges_bytes(live) if live else ())
+    return tuple(decode_gba_string(next(blobs), max_len) if ptr else "" for ptr in ptrs)
+
+
+@lru_cache(maxsize=256)
+def _read_rom_cstrings(ptrs: Tuple[int, ...], max_len: int) -> Tuple[str, ...]:
+    # Same as _read_cstrings for pointer sets that are all ROM (or null). The batched read returns
+    # short (or no) blobs on failure, so those raise here instead of being cached as "" labels.
+    live = [(ptr, max_len) for ptr in ptrs if ptr]
+    blobs = list(mgba_read_ranges_bytes(live)) if live else []
+    if len(blobs) < len(live) or any(len(blob) < max_len for blob in blobs):
+        raise RuntimeError("short ROM read in batched string fetch")
+    it = iter(blobs)
+    return tuple(decode_gba_string(next(it), max_len) if ptr else "" for ptr in ptrs)
+
+
+def _text_or_fallback(addr: int, fallback: str, max_len: int) -> str:
+    """Stripped string at `addr` (ROM text comes from the ROM string cache), or `fallback` if missing/empty."""
+    if addr == 0:
+        return fallback
+    return _read_gba_cstring(addr, max_len).strip() or fallback
 
 
 def _read_gba_cstring(ptr: int, max_len: int = 64) -> str:
@@ -2554,12 +2752,33 @@ def _read_gba_cstring(ptr: int, max_len: int = 64) -> str:
     if ptr == 0:
         return ""
     try:
+        if ptr >= 0x08000000:
+            return _read_rom_cstring(int(ptr), int(max_len))
         raw = mgba_read_range_bytes(ptr, max_len)
         return decode_gba_string(raw, max_len)
     except Exception:
         return ""
 
 
+@lru_cache(maxsize=32)
+def _bag_context_menu_layout(
+    action_ids: Tuple[int, ...],
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Dict[int, int]]:
+    """
+    (cells, non-empty options, source index -> option index) for one sItemMenuActions id list.
+
+    Only called once every id has a label in _ITEM_MENU_ACTION_LABEL_CACHE, so the result never goes stale.
+    """
+    cells = tuple(_ITEM_MENU_ACTION_LABEL_CACHE.get(action_id, "") or "" for action_id in action_ids)
+    src_to_display: Dict[int, int] = {}
+    options: List[str] = []
+    for src_idx, label in enumerate(cells):
+        if label:
+            src_to_display[src_idx] = len(options)
+            options.append(label)
+    return cells, tuple(options), src_to_display
+
+
 def get_bag_context_menu_state(
     bag_menu_ptr: int,
     *,
@@ -2580,7 +2799,7 @@ def get_bag_context_menu_state(
         # When callers already know it's open they can pass num_items/items_ptr to avoid these reads.
         if num_items is None or items_ptr is None:
             win = mgba_read_range_bytes(bag_menu_ptr + BAGMENU_WINDOW_IDS_OFFSET, 4)
-            if not win or all(int(b) == WINDOW_NONE for b in win[:4]):
+            if not win or win[:4] == _ALL_WINDOW_NONE:
                 return None
             num_items = int(mgba_read8(bag_menu_ptr + BAGMENU_CONTEXT_MENU_NUM_ITEMS_OFFSET))
             items_ptr = int(mgba_read32(bag_menu_ptr + BAGMENU_CONTEXT_MENU_ITEMS_PTR_OFFSET))
@@ -2596,10 +2815,6 @@ def get_bag_context_menu_state(
             return None
 
         # Resolve action labels from ROM, but cache them (ROM tables are static).
-        cells: List[str] = []
-        options: List[str] = []
-        src_to_display: Dict[int, int] = {}
-
         uncached: List[int] = []
         for action_id in action_ids:
             if int(action_id) not in _ITEM_MENU_ACTION_LABEL_CACHE:
@@ -2609,21 +2824,16 @@ def get_bag_context_menu_state(
             uniq = sorted(set(int(a) & 0xFF for a in uncached))
             ranges = [(SITEM_MENU_ACTIONS_ADDR + (aid * 8), 4) for aid in uniq]
             ptr_chunks = mgba_read_ranges_bytes(ranges)
-            ptr_by_action: Dict[int, int] = {}
-            for aid, chunk in zip(uniq, ptr_chunks):
-                if isinstance(chunk, (bytes, bytearray)) and len(chunk) >= 4:
-                    ptr_by_action[aid] = int(_u32le_from(chunk, 0))
+            # mgba_read_ranges_bytes always yields bytes; _u32le_from gives 0 for a short chunk.
+            ptr_by_action = {aid: _u32le_from(chunk, 0) for aid, chunk in zip(uniq, ptr_chunks)}
+            # Fetch every missing label in one more call instead of one read per action.
+            label_ids = [aid for aid in uniq if ptr_by_action.get(aid)]
+            label_chunks = mgba_read_ranges_bytes([(ptr_by_action[aid], 32) for aid in label_ids]) if label_ids else []
+            labels = {aid: decode_gba_string(chunk, 32) for aid, chunk in zip(label_ids, label_chunks)}
             for aid in uniq:
-                ptr = int(ptr_by_action.get(aid, 0))
-                label = _read_gba_cstring(ptr, 32) if ptr else ""
-                _ITEM_MENU_ACTION_LABEL_CACHE[aid] = label or ""
+                _ITEM_MENU_ACTION_LABEL_CACHE[aid] = labels.get(aid) or ""
 
-        for src_idx, action_id in enumerate(action_ids):
-            label = _ITEM_MENU_ACTION_LABEL_CACHE.get(int(action_id), "") or ""
-            cells.append(label)
-            if label:
-                src_to_display[src_idx] = len(options)
-                options.append(label)
+        cells, options, src_to_display = _bag_context_menu_layout(tuple(action_ids))
 
         cursor_src = _read_menu_cursor_pos(smenu_raw)
         cursor_src_int = int(cursor_src)
@@ -2647,21 +2857,48 @@ def get_bag_context_menu_state(
             "cursorPosition": int(cursor_display),
             "cursorPositionRaw": int(cursor_src_int),
             "selectedOption": selected,
-            "options": options,
-            "cells": cells,
+            "options": list(options),
+            "cells": list(cells),
             "actionIds": [int(a) for a in action_ids],
         }
     except Exception:
         return None
 
 
+def _decode_item_name_price(raw: bytes) -> Tuple[str, int]:
+    return decode_gba_string(raw[:ITEM_NAME_LENGTH], ITEM_NAME_LENGTH), _u16le_from(raw, ITEM_PRICE_OFFSET)
+
+
+def _prefetch_item_names_prices(item_ids: Sequence[int]) -> None:
+    """Fill _ITEM_NAME_PRICE_CACHE for every uncached id in one bridge call (gItems lives in ROM)."""
+    missing = sorted({item_id for item_id in item_ids if item_id not in _ITEM_NAME_PRICE_CACHE})
+    if not missing:
+        return
+    chunks = mgba_read_ranges_bytes(
+        [(GITEMS_ADDR + (item_id * ITEM_STRUCT_SIZE), _ITEM_NAME_PRICE_READ_LEN) for item_id in missing]
+    )
+    for item_id, raw in zip(missing, chunks):
+        if len(raw) >= _ITEM_NAME_PRICE_READ_LEN:
+            _ITEM_NAME_PRICE_CACHE[item_id] = _decode_item_name_price(raw)
+
+
+def _read_item_name_price_cached(item_id: int) -> Tuple[str, int]:
+    # gItems lives in ROM; name and price share one read. A failed (short) read is decoded for this
+    # call only and left out of the cache.
+    cached = _ITEM_NAME_PRICE_CACHE.get(item_id)
+    if cached is None:
+        raw = mgba_read_range_bytes(GITEMS_ADDR + (item_id * ITEM_STRUCT_SIZE), _ITEM_NAME_PRICE_READ_LEN)
+        cached = _decode_item_name_price(raw)
+        if len(raw) >= _ITEM_NAME_PRICE_READ_LEN:
+            _ITEM_NAME_PRICE_CACHE[item_id] = cached
+    return cached
+
+
 def _read_item_name_from_gitems(item_id: int) -> str:
     if item_id < 0 or item_id > 2048:
         item_id = 0
-    base = GITEMS_ADDR + (int(item_id) * ITEM_STRUCT_SIZE)
     try:
-        raw = mgba_read_range(base, ITEM_NAME_LENGTH)
-        return decode_gba_string(raw, ITEM_NAME_LENGTH)
+        return _read_item_name_price_cached(int(item_id))[0]
     except Exception:
         return ""
 
@@ -2669,30 +2906,40 @@ def _read_item_name_from_gitems(item_id: int) -> str:
 def _read_item_price_from_gitems(item_id: int) -> int:
     if item_id < 0 or item_id > 2048:
         item_id = 0
-    base = GITEMS_ADDR + (int(item_id) * ITEM_STRUCT_SIZE)
     try:
-        return int(mgba_read16(base + ITEM_PRICE_OFFSET))
+        return _read_item_name_price_cached(int(item_id))[1]
     except Exception:
         return 0
 
 
+@lru_cache(maxsize=512)
+def _read_item_description_cached(item_id: int, max_len: int) -> str:
+    # gItems[].description points into ROM, so the text never changes. Failed reads raise
+    # (mgba_read32 / _read_rom_range_bytes) and are therefore not cached.
+    ptr = mgba_read32(GITEMS_ADDR + (item_id * ITEM_STRUCT_SIZE) + ITEM_DESCRIPTION_PTR_OFFSET)
+    if ptr == 0:
+        return ""
+    return decode_gba_string(_read_rom_range_bytes(ptr, max_len), max_len) or ""
+
+
 def _read_item_description_from_gitems(item_id: int, max_len: int = 200) -> str:
     if item_id < 0 or item_id > 2048:
         item_id = 0
-    cached = _ITEM_DESCRIPTION_CACHE.get(int(item_id))
-    if cached is not None:
-        return cached
-    base = GITEMS_ADDR + (int(item_id) * ITEM_STRUCT_SIZE)
     try:
-        ptr = mgba_read32(base + ITEM_DESCRIPTION_PTR_OFFSET)
-        desc = _read_gba_cstring(ptr, max_len)
-        _ITEM_DESCRIPTION_CACHE[int(item_id)] = desc or ""
-        return desc
+        return _read_item_description_cached(int(item_id), int(max_len))
     except Exception:
-        _ITEM_DESCRIPTION_CACHE[int(item_id)] = ""
         return ""
 
 
+@lru_cache(maxsize=16)
+def _read_rom_menu_action_labels(menu_actions_ptr: int, count: int, max_len: int) -> Tuple[str, ...]:
+    # A ROM MenuAction table: one read for the text pointers, one batched read for the labels.
+    # Short reads of either raise, so a failed fetch is never cached as empty labels.
+    raw = _read_rom_range_bytes(menu_actions_ptr, count * MENU_ACTION_SIZE)
+    ptrs = tuple(ptr for (ptr,) in _MENU_ACTION_TEXT_STRUCT.iter_unpack(raw[: count * MENU_ACTION_SIZE]))
+    return _read_rom_cstrings(ptrs, max_len)
+
+
 def _read_shop_cancel_text() -> str:
     return _read_gba_cstring(GTEXT_CANCEL2_ADDR, 32) or "CANCEL"
 
@@ -2728,14 +2975,14 @@ def get_shop_choice_menu_state(tasks_raw: Optional[bytes] = None, smenu_raw: Opt
         if count <= 0 or count > 6:
             return None
 
-        options: List[str] = []
-        for i in range(count):
-            if menu_actions_ptr != 0:
-                text_ptr = mgba_read32(menu_actions_ptr + (i * 8))
-                txt = _read_gba_cstring(text_ptr, 32) or f"OPTION_{i}"
-            else:
-                txt = ["BUY", "SELL", "QUIT"][i] if count == 3 else ["BUY", "QUIT"][i]
-            options.append(txt)
+        if menu_actions_ptr != 0:
+            try:
+                labels = _read_rom_menu_action_labels(menu_actions_ptr, count, 32)
+            except Exception:
+                labels = ("",) * count
+            options = [txt or f"OPTION_{i}" for i, txt in enumerate(labels)]
+        else:
+            options = ["BUY", "SELL", "QUIT"] if count == 3 else ["BUY", "QUIT"]
 
         cursor_pos = _read_menu_cursor_pos(smenu_raw)
         selected = options[cursor_pos] if 0 <= cursor_pos < len(options) else "UNKNOWN"
@@ -2761,18 +3008,15 @@ def get_shop_buy_menu_state(callback2: Optional[int] = None, tasks_raw: Optional
     on sShopData (scrollOffset/selectedRow/itemsShowed).
     """
     try:
-        def _task_data_u16(task_id: int, idx: int) -> int:
-            if tasks_raw is not None:
-                base = (int(task_id) * TASK_SIZE) + TASK_DATA_OFFSET + (int(idx) * 2)
-                return int(_u16le_from(tasks_raw, base))
-            addr = GTASKS_ADDR + (int(task_id) * TASK_SIZE) + TASK_DATA_OFFSET + (int(idx) * 2)
-            return int(mgba_read16(addr))
-
         if callback2 is None:
             callback2 = mgba_read32(GMAIN_ADDR + GMAIN_CALLBACK2_OFFSET)
         if (int(callback2) & 0xFFFFFFFE) != (CB2_BUY_MENU_ADDR & 0xFFFFFFFE):
             return None
 
+        # The task lookups and task data reads below share one gTasks snapshot.
+        if tasks_raw is None:
+            tasks_raw = _read_tasks_raw()
+
         task_id: Optional[int] = None
         matched_task_func: Optional[int] = None
         mode = "itemList"
@@ -2798,18 +3042,20 @@ def get_shop_buy_menu_state(callback2: Optional[int] = None, tasks_raw: Optional
         if shop_data_ptr == 0:
             return None
 
-        total_cost = int(mgba_read32(shop_data_ptr + SHOPDATA_TOTAL_COST_OFFSET))
-        items_showed = int(mgba_read16(shop_data_ptr + SHOPDATA_ITEMS_SHOWED_OFFSET))
-        selected_row = int(mgba_read16(shop_data_ptr + SHOPDATA_SELECTED_ROW_OFFSET))
-        scroll_offset = int(mgba_read16(shop_data_ptr + SHOPDATA_SCROLL_OFFSET_OFFSET))
+        (
+            item_list_ptr,
+            total_cost,
+            selected_row,
+            scroll_offset,
+            shop_item_count,
+            items_showed,
+            mart_type,
+        ) = _SHOP_DATA_STRUCT.unpack(mgba_read_range_bytes(shop_data_ptr, _SHOP_DATA_STRUCT.size))
+        mart_type &= SMARTINFO_MARTTYPE_MASK
 
         if items_showed <= 0 or items_showed > 20:
             items_showed = 8
 
-        item_list_ptr = int(mgba_read32(shop_data_ptr + SMARTINFO_ITEMLIST_PTR_OFFSET))
-        shop_item_count = int(mgba_read16(shop_data_ptr + SMARTINFO_ITEMCOUNT_OFFSET))
-        mart_type = int(mgba_read16(shop_data_ptr + SMARTINFO_MARTTYPE_OFFSET)) & int(SMARTINFO_MARTTYPE_MASK)
-
         total_entries = shop_item_count + 1  # + CANCEL
         if total_entries <= 0 or total_entries > 1024:
             return None
@@ -2826,6 +3072,17 @@ def get_shop_buy_menu_state(callback2: Optional[int] = None, tasks_raw: Optional
         entries: List[Dict[str, Any]] = []
         options: List[str] = []
 
+        # The visible item ids are one contiguous slice of the u16 item list.
+        items_end = min(end, shop_item_count)
+        visible_ids: List[int] = []
+        if start < items_end:
+            if item_list_ptr == 0:
+                return None
+            ids_raw = mgba_read_range_bytes(item_list_ptr + (start * 2), (items_end - start) * 2)
+            visible_ids = [_u16le_from(ids_raw, i * 2) for i in range(items_end - start)]
+            if mart_type == 0:
+                _prefetch_item_names_prices([item_id for item_id in visible_ids if 0 <= item_id <= 2048])
+
         for idx in range(start, end):
             is_cancel = idx == shop_item_count
             entry: Dict[str, Any] = {"index": int(idx), "isCancel": bool(is_cancel)}
@@ -2834,9 +3091,7 @@ def get_shop_buy_menu_state(callback2: Optional[int] = None, tasks_raw: Optional
                 entry.update({"id": None, "name": name, "price": None})
                 label = name
             else:
-                if item_list_ptr == 0:
-                    return None
-                entry_id = int(mgba_read16(item_list_ptr + (idx * 2)))
+                entry_id = visible_ids[idx - start]
                 entry["id"] = entry_id
                 if mart_type == 0:
                     name = _read_item_name_from_gitems(entry_id) or f"ITEM_{entry_id}"
@@ -2873,8 +3128,8 @@ def get_shop_buy_menu_state(callback2: Optional[int] = None, tasks_raw: Optional
         selected_item_name: Optional[str] = None
 
         if mode == "howMany":
-            selected_item_id = int(_task_data_u16(task_id, 5))  # tItemId
-            selected_quantity = int(_s16_from_u16(_task_data_u16(task_id, 1)))  # tItemCount
+            selected_item_id = _read_task_data_u16(task_id, 5, tasks_raw)  # tItemId
+            selected_quantity = _s16_from_u16(_read_task_data_u16(task_id, 1, tasks_raw))  # tItemCount
             if selected_quantity <= 0:
                 selected_quantity = 1
 
@@ -2904,10 +3159,7 @@ def get_shop_buy_menu_state(callback2: Optional[int] = None, tasks_raw: Optional
             lines.append(message_text)
         else:
             lines.append(f"MONEY ₽{money}")
-            for i, opt in enumerate(options):
-                abs_idx = start + i
-                prefix = "►" if abs_idx == selected_index else " "
-                lines.append(f"{prefix}{opt}")
+            lines.extend(_CURSOR_PREFIX[abs_idx != selected_index] + opt for abs_idx, opt in enumerate(options, start))
             if selected_description:
                 lines.append("")
                 lines.append(selected_description)
@@ -2973,22 +3225,25 @@ def get_party_action_menu_state(
         rel_actions = int(PARTY_MENU_INTERNAL_ACTIONS_OFFSET - PARTY_MENU_INTERNAL_WINDOWIDS_OFFSET)
         action_ids = [int(_u8_from(internal, rel_actions + i)) for i in range(num_actions)]
 
-        # sCursorOptions entry layout: { const u8 *text; void (*func)(u8 taskId); }
-        ptr_ranges = [(SCURSOR_OPTIONS_ADDR + (action_id * 8), 4) for action_id in action_ids]
-        ptr_segs = mgba_read_ranges_bytes(ptr_ranges)
-
-        options: List[str] = []
-        for action_id, seg in zip(action_ids, ptr_segs):
-            cached = _PARTY_MENU_ACTION_LABEL_CACHE.get(int(action_id))
-            if cached:
-                options.append(cached)
-                continue
+        # Only touch sCursorOptions for action ids whose label hasn't been resolved yet.
+        missing = sorted({action_id for action_id in action_ids if not _PARTY_MENU_ACTION_LABEL_CACHE.get(action_id)})
+        if missing:
+            # sCursorOptions entry layout: { const u8 *text; void (*func)(u8 taskId); }
+            ptr_segs = mgba_read_ranges_bytes(
+                [(SCURSOR_OPTIONS_ADDR + (action_id * MENU_ACTION_SIZE), 4) for action_id in missing]
+            )
+            text_ptrs = tuple(_u32le_from(seg, 0) for seg in ptr_segs)
+            try:
+                labels = _read_cstrings(text_ptrs, 64)
+            except Exception:
+                labels = tuple(_read_gba_cstring(ptr, 64) for ptr in text_ptrs)
+            for action_id, label in zip(missing, labels):
+                if label:
+                    _PARTY_MENU_ACTION_LABEL_CACHE[action_id] = label
 
-            text_ptr = int(_u32le_from(seg, 0))
-            txt = _read_gba_cstring(text_ptr, 64) or f"ACTION_{action_id}"
-            if txt and not txt.startswith("ACTION_"):
-                _PARTY_MENU_ACTION_LABEL_CACHE[int(action_id)] = str(txt)
-            options.append(txt)
+        options = [
+            _PARTY_MENU_ACTION_LABEL_CACHE.get(action_id) or f"ACTION_{action_id}" for action_id in action_ids
+        ]
 
         cursor_pos = _read_menu_cursor_pos(smenu_raw)
         selected = options[cursor_pos] if 0 <= cursor_pos < len(options) else "UNKNOWN"
@@ -3029,8 +3284,21 @@ def get_party_menu_state(
     If the per-Pokémon action menu is open (after pressing A), its options are appended like other choice menus.
     """
     try:
+        # Whatever the caller didn't pass (callback2, gPartyMenu.slotId, gPlayerPartyCount,
+        # sPartyMenuInternal) is fetched in one bridge call, in that order.
+        primer_ranges: List[Tuple[int, int]] = []
         if callback2 is None:
-            callback2 = mgba_read32(GMAIN_ADDR + GMAIN_CALLBACK2_OFFSET)
+            primer_ranges.append((GMAIN_ADDR + GMAIN_CALLBACK2_OFFSET, 4))
+        if party_menu_raw is None:
+            primer_ranges.append((GPARTY_MENU_ADDR + GPARTY_MENU_SLOTID_OFFSET, 1))
+        if party_count_raw is None:
+            primer_ranges.append((GPLAYER_PARTY_COUNT_ADDR, 1))
+        if party_internal_ptr_raw is None:
+            primer_ranges.append((SPARTY_MENU_INTERNAL_PTR_ADDR, 4))
+        primer = iter(mgba_read_ranges_bytes(primer_ranges) if primer_ranges else ())
+
+        if callback2 is None:
+            callback2 = _u32le_from(next(primer), 0)
         callback2 = int(callback2) & 0xFFFFFFFE
         if callback2 not in (
             CB2_INIT_PARTY_MENU_ADDR & 0xFFFFFFFE,
@@ -3041,23 +3309,21 @@ def get_party_menu_state(
         if party_menu_raw is not None:
             slot_id_raw = int(_u8_from(party_menu_raw, GPARTY_MENU_SLOTID_OFFSET))
         else:
-            slot_id_raw = int(mgba_read8(GPARTY_MENU_ADDR + GPARTY_MENU_SLOTID_OFFSET))
+            slot_id_raw = int(_u8_from(next(primer), 0))
         slot_id = _s8_from_u8(slot_id_raw)
 
-        if party_count_raw is not None:
-            party_count = int(_u8_from(party_count_raw, 0))
-        else:
-            party_count = int(mgba_read8(GPLAYER_PARTY_COUNT_ADDR))
+        if party_count_raw is None:
+            party_count_raw = next(primer)
+        party_count = int(_u8_from(party_count_raw, 0))
         if party_count < 0 or party_count > PARTY_SIZE:
             party_count = PARTY_SIZE
 
         # Cancel/Confirm buttons (Confirm only exists for choose-half scenarios)
         choose_half = False
         message_id = -1
-        if party_internal_ptr_raw is not None:
-            internal_ptr = int(_u32le_from(party_internal_ptr_raw, 0))
-        else:
-            internal_ptr = mgba_read32(SPARTY_MENU_INTERNAL_PTR_ADDR)
+        if party_internal_ptr_raw is None:
+            party_internal_ptr_raw = next(primer)
+        internal_ptr = int(_u32le_from(party_internal_ptr_raw, 0))
         if internal_ptr != 0:
             flags = mgba_read32(internal_ptr + PARTY_MENU_INTERNAL_FLAGS_OFFSET)
             choose_half = (flags & 0x1) != 0
@@ -3096,7 +3362,6 @@ def get_party_menu_state(
             learnset_word_index = int(teach_tm_index // 32)
             learn_bit = int(teach_tm_index % 32)
 
-            learn_words: Dict[int, int] = {}
             uniq_species = sorted(
                 {
                     int(info.get("speciesId") or 0)
@@ -3104,11 +3369,16 @@ def get_party_menu_state(
                     if not bool(info.get("isEgg")) and int(info.get("speciesId") or 0) != SPECIES_NONE
                 }
             )
-            if uniq_species:
-                ranges = [(GTMHM_LEARNSETS_ADDR + (sid * 8) + (learnset_word_index * 4), 4) for sid in uniq_species]
-                raw_words = mgba_read_ranges_bytes(ranges)
-                for sid, seg in zip(uniq_species, raw_words):
-                    learn_words[int(sid)] = int(_u32le_from(seg, 0))
+            # sTMHMLearnsets is ROM-constant: only words not seen before cost a (single, batched) read.
+            missing = [sid for sid in uniq_species if (sid, learnset_word_index) not in _TMHM_LEARNSET_WORD_CACHE]
+            if missing:
+                ranges = [(GTMHM_LEARNSETS_ADDR + (sid * 8) + (learnset_word_index * 4), 4) for sid in missing]
+                for sid, seg in zip(missing, mgba_read_ranges_bytes(ranges)):
+                    if len(seg) >= 4:
+                        _TMHM_LEARNSET_WORD_CACHE[(sid, learnset_word_index)] = _u32le_from(seg, 0)
+            learn_words = {
+                sid: _TMHM_LEARNSET_WORD_CACHE.get((sid, learnset_word_index), 0) for sid in uniq_species
+            }
 
             for info in infos:
                 nickname = str(info.get("nickname") or "")
@@ -3152,30 +3422,24 @@ def get_party_menu_state(
                 prefix = "►" if slot_id == int(info.get("slot") or 0) else ""
                 lines.append(f"{prefix}{nickname} Lv{level} {status_text}")
         else:
-            for i in range(party_count):
-                base = int(i) * int(POKEMON_DATA_SIZE)
-                if base < 0 or (base + POKEMON_DATA_SIZE) > len(raw_party):
-                    break
-
-                nickname_raw = raw_party[base + NICKNAME_OFFSET : base + NICKNAME_OFFSET + 10]
-                nickname = decode_gba_string(nickname_raw, 10) or f"MON_{i}"
-
-                level = int(_u8_from(raw_party, base + LEVEL_OFFSET))
-                current_hp = int(_u16le_from(raw_party, base + CURRENT_HP_OFFSET))
-                max_hp = int(_u16le_from(raw_party, base + MAX_HP_OFFSET))
-
-                mons.append(
-                    {
-                        "slot": int(i),
-                        "nickname": nickname,
-                        "level": level,
-                        "currentHP": current_hp,
-                        "maxHP": max_hp,
-                    }
-                )
-
-                prefix = "►" if slot_id == i else ""
-                lines.append(f"{prefix}{nickname} Lv{level} HP {current_hp}/{max_hp}")
+            # One struct pass over the party snapshot instead of per-field reads.
+            row_count = min(party_count, len(raw_party) // POKEMON_DATA_SIZE)
+            rows = _PARTY_MON_ROW.iter_unpack(memoryview(raw_party)[: row_count * POKEMON_DATA_SIZE])
+            mons = [
+                {
+                    "slot": i,
+                    "nickname": decode_gba_string(nickname_raw, 10) or f"MON_{i}",
+                    "level": level,
+                    "currentHP": current_hp,
+                    "maxHP": max_hp,
+                }
+                for i, (nickname_raw, level, current_hp, max_hp) in enumerate(rows)
+            ]
+            lines = [
+                f"{'►' if slot_id == mon['slot'] else ''}{mon['nickname']} Lv{mon['level']} "
+                f"HP {mon['currentHP']}/{mon['maxHP']}"
+                for mon in mons
+            ]
 
         if choose_half:
             prefix = "►" if slot_id == PARTY_SIZE else ""
@@ -3330,8 +3594,43 @@ def _decode_summary_text(raw: bytes, offset: int, length: int) -> str:
         return ""
 
 
+@lru_cache(maxsize=4)
+def _decode_summary_texts(summary: bytes) -> Tuple[Any, ...]:
+    """
+    Every PokeSummary string buffer, decoded (offsets relative to the summary block).
+
+    Order: species, nickname, OT name, dex no, OT id, item, gender, level, HP, stats[5], move cur PP[5],
+    move max PP[5], move names[5], move power[5], move accuracy[5], exp, exp to next, ability, ability desc.
+    The block rarely changes while the screen is open, so repeat frames hit the cache.
+    """
+    return (
+        _decode_summary_text(summary, 0x000, 11),
+        _decode_summary_text(summary, 0x00C, 12),
+        _decode_summary_text(summary, 0x018, 12),
+        _decode_summary_text(summary, 0x03C, 5),
+        _decode_summary_text(summary, 0x044, 7),
+        _decode_summary_text(summary, 0x04C, 13),
+        _decode_summary_text(summary, 0x05C, 3),
+        _decode_summary_text(summary, 0x060, 7),
+        _decode_summary_text(summary, 0x068, 9),
+        tuple(_decode_summary_text(summary, 0x074 + (i * 5), 5) for i in range(5)),
+        tuple(_decode_summary_text(summary, 0x090 + (i * 11), 11) for i in range(5)),
+        tuple(_decode_summary_text(summary, 0x0C8 + (i * 11), 11) for i in range(5)),
+        tuple(_decode_summary_text(summary, 0x100 + (i * 13), 13) for i in range(5)),
+        tuple(_decode_summary_text(summary, 0x144 + (i * 5), 5) for i in range(5)),
+        tuple(_decode_summary_text(summary, 0x160 + (i * 5), 5) for i in range(5)),
+        _decode_summary_text(summary, 0x17C, 9),
+        _decode_summary_text(summary, 0x188, 9),
+        _decode_summary_text(summary, 0x194, 13),
+        _decode_summary_text(summary, 0x1A4, 52),
+    )
+
+
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+
 def _digits_to_int(value: str) -> Optional[int]:
-    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    digits = _NON_DIGITS_RE.sub("", str(value))
     if not digits:
         return None
     try:
@@ -3467,7 +3766,7 @@ def get_pokemon_summary_state(
         if mode < 0 or mode > 5 or cur_page < 0 or cur_page > 5:
             return None
 
-        window_ids = [int(_u8_from(raw_tail, WINDOW_IDS_REL + i)) for i in range(7)]
+        window_ids = list(raw_tail[WINDOW_IDS_REL : WINDOW_IDS_REL + 7])
         is_egg = bool(_u8_from(raw_tail, IS_EGG_REL))
         is_bad_egg = bool(_u8_from(raw_tail, IS_BAD_EGG_REL))
         summary = bytes(raw_tail[SUMMARY_REL : SUMMARY_REL + SUMMARY_LEN])
@@ -3475,37 +3774,32 @@ def get_pokemon_summary_state(
         if len(summary) < SUMMARY_LEN or len(mon_raw) < POKEMON_DATA_SIZE:
             return None
 
-        # PokeSummary string buffers offsets (relative to `summary`).
-        species_name_txt = _decode_summary_text(summary, 0x000, 11)
-        nickname_txt = _decode_summary_text(summary, 0x00C, 12)
-        ot_name_txt = _decode_summary_text(summary, 0x018, 12)
-        dex_no_txt = _decode_summary_text(summary, 0x03C, 5)
-        ot_id_txt = _decode_summary_text(summary, 0x044, 7)
-        item_name_txt = _decode_summary_text(summary, 0x04C, 13)
-        gender_symbol_txt = _decode_summary_text(summary, 0x05C, 3)
-        level_txt = _decode_summary_text(summary, 0x060, 7)
-        hp_txt = _decode_summary_text(summary, 0x068, 9)
-        stat_txt = [_decode_summary_text(summary, 0x074 + (i * 5), 5) for i in range(5)]
-        move_cur_pp_txt = [_decode_summary_text(summary, 0x090 + (i * 11), 11) for i in range(5)]
-        move_max_pp_txt = [_decode_summary_text(summary, 0x0C8 + (i * 11), 11) for i in range(5)]
-        move_name_txt = [_decode_summary_text(summary, 0x100 + (i * 13), 13) for i in range(5)]
-        move_power_txt = [_decode_summary_text(summary, 0x144 + (i * 5), 5) for i in range(5)]
-        move_accuracy_txt = [_decode_summary_text(summary, 0x160 + (i * 5), 5) for i in range(5)]
-        exp_points_txt = _decode_summary_text(summary, 0x17C, 9)
-        exp_to_next_txt = _decode_summary_text(summary, 0x188, 9)
-        ability_name_txt = _decode_summary_text(summary, 0x194, 13)
-        ability_desc_txt = _decode_summary_text(summary, 0x1A4, 52)
-
-        pid = int(_u32le_from(mon_raw, PID_OFFSET))
-        otid = int(_u32le_from(mon_raw, OTID_OFFSET))
-        level = int(_u8_from(mon_raw, LEVEL_OFFSET))
-        cur_hp = int(_u16le_from(mon_raw, CURRENT_HP_OFFSET))
-        max_hp = int(_u16le_from(mon_raw, MAX_HP_OFFSET))
-        atk = int(_u16le_from(mon_raw, ATTACK_OFFSET))
-        defense = int(_u16le_from(mon_raw, DEFENSE_OFFSET))
-        speed = int(_u16le_from(mon_raw, SPEED_OFFSET))
-        sp_atk = int(_u16le_from(mon_raw, SP_ATTACK_OFFSET))
-        sp_def = int(_u16le_from(mon_raw, SP_DEFENSE_OFFSET))
+        (
+            species_name_txt,
+            nickname_txt,
+            ot_name_txt,
+            dex_no_txt,
+            ot_id_txt,
+            item_name_txt,
+            gender_symbol_txt,
+            level_txt,
+            hp_txt,
+            stat_txt,
+            move_cur_pp_txt,
+            move_max_pp_txt,
+            move_name_txt,
+            move_power_txt,
+            move_accuracy_txt,
+            exp_points_txt,
+            exp_to_next_txt,
+            ability_name_txt,
+            ability_desc_txt,
+        ) = _decode_summary_texts(summary)
+
+        pid, otid = _PARTY_MON_PID_OTID.unpack_from(mon_raw, PID_OFFSET)
+        level, cur_hp, max_hp, atk, defense, speed, sp_atk, sp_def = _PARTY_MON_STATS.unpack_from(
+            mon_raw, LEVEL_OFFSET
+        )
         mon_nickname = decode_gba_string(mon_raw[NICKNAME_OFFSET : NICKNAME_OFFSET + 10], 10)
 
         species_id = 0
@@ -3523,64 +3817,28 @@ def get_pokemon_summary_state(
         if pid != 0:
             enc = mon_raw[ENCRYPTED_BLOCK_OFFSET : ENCRYPTED_BLOCK_OFFSET + ENCRYPTED_BLOCK_SIZE]
             if len(enc) >= ENCRYPTED_BLOCK_SIZE:
-                key = int(pid) ^ int(otid)
-                dec = bytearray(ENCRYPTED_BLOCK_SIZE)
-                for i in range(0, ENCRYPTED_BLOCK_SIZE, 4):
-                    word = _u32le_from(enc, i) ^ key
-                    dec[i : i + 4] = int(word & 0xFFFFFFFF).to_bytes(4, "little")
-
-                order = SUBSTRUCTURE_ORDER[pid % 24]
-                sub: Dict[str, bytes] = {}
-                for i, ch in enumerate(order):
-                    start = i * SUBSTRUCTURE_SIZE
-                    sub[ch] = bytes(dec[start : start + SUBSTRUCTURE_SIZE])
-
-                growth = sub.get("G", b"")
-                attacks = sub.get("A", b"")
-                misc = sub.get("M", b"")
-                if len(growth) >= SUBSTRUCTURE_SIZE:
-                    species_id = int(_u16le_from(growth, 0))
-                    held_item_id = int(_u16le_from(growth, 2))
-                    exp_points = int(_u32le_from(growth, 4))
-                    pp_bonuses = int(_u8_from(growth, 8))
-                if len(attacks) >= SUBSTRUCTURE_SIZE:
-                    move_ids_dec = [
-                        int(_u16le_from(attacks, 0)),
-                        int(_u16le_from(attacks, 2)),
-                        int(_u16le_from(attacks, 4)),
-                        int(_u16le_from(attacks, 6)),
-                    ]
-                    move_pp_current = [
-                        int(_u8_from(attacks, 8)),
-                        int(_u8_from(attacks, 9)),
-                        int(_u8_from(attacks, 10)),
-                        int(_u8_from(attacks, 11)),
-                    ]
-                if len(misc) >= SUBSTRUCTURE_SIZE:
-                    met_location = int(_u8_from(misc, 1))
-                    met_data = int(_u16le_from(misc, 2))
-                    met_level = int(met_data & 0x7F)
-                    met_game = int((met_data >> 7) & 0x0F)
-                    iv_bitfield = int(_u32le_from(misc, 4))
-                    mon_is_egg_data = ((iv_bitfield >> 30) & 1) != 0
-                    ability_slot = (iv_bitfield >> 31) & 1
-                    ribbon_bits = int(_u32le_from(misc, 8))
-                    modern_fateful = bool((ribbon_bits >> 31) & 1)
-
-        move_types_raw = [int(_u16le_from(raw_tail, MOVE_TYPES_REL + (i * 2))) for i in range(5)]
+                dec = _xor_u32le_block(enc, int(pid) ^ int(otid))
+
+                g_off, a_off, m_off = _SUBSTRUCTURE_GAM_OFFSETS[pid % 24]
+                species_id, held_item_id, exp_points, pp_bonuses = _SUBSTRUCTURE_GROWTH_HEAD.unpack_from(dec, g_off)
+                attacks = _SUBSTRUCTURE_ATTACKS.unpack_from(dec, a_off)
+                move_ids_dec = list(attacks[:4])
+                move_pp_current = list(attacks[4:])
+                met_location, met_data, iv_bitfield, ribbon_bits = _SUBSTRUCTURE_MISC_HEAD.unpack_from(dec, m_off)
+                met_level = met_data & 0x7F
+                met_game = (met_data >> 7) & 0x0F
+                mon_is_egg_data = ((iv_bitfield >> 30) & 1) != 0
+                ability_slot = (iv_bitfield >> 31) & 1
+                modern_fateful = bool((ribbon_bits >> 31) & 1)
+
+        move_types_raw = list(_SUMMARY_MOVE_TYPES.unpack_from(raw_tail, MOVE_TYPES_REL))
         num_moves = int(_u8_from(raw_tail, NUM_MOVES_REL))
         # For the normal Summary pages, the canonical move ordering is from currentMon.
         # This keeps move names/types/PP/details aligned with what is actually shown.
         move_ids = [int(move_ids_dec[i]) for i in range(MAX_MON_MOVES)]
 
         uniq_move_ids = sorted({mid for mid in move_ids if int(mid) > 0})
-        battle_move_entries: Dict[int, bytes] = {}
-        if uniq_move_ids:
-            ranges = [(GBATTLE_MOVES_ADDR + (int(mid) * BATTLE_MOVE_SIZE), BATTLE_MOVE_SIZE) for mid in uniq_move_ids]
-            segs = mgba_read_ranges_bytes(ranges)
-            for mid, seg in zip(uniq_move_ids, segs):
-                if seg and len(seg) >= BATTLE_MOVE_SIZE:
-                    battle_move_entries[int(mid)] = bytes(seg[:BATTLE_MOVE_SIZE])
+        battle_move_entries = _read_battle_move_entries(uniq_move_ids)
 
         def _battle_move_field(move_id: int, offset: int) -> Optional[int]:
             seg = battle_move_entries.get(int(move_id))
@@ -3603,33 +3861,29 @@ def get_pokemon_summary_state(
             if tname and tname not in type_names:
                 type_names.append(tname)
 
-        # Fallback to species table if monTypes were not populated.
-        if not type_names and species_id > 0:
-            try:
-                t = mgba_read_range_bytes(SPECIES_INFO_ADDR + (species_id * SPECIES_INFO_SIZE) + SPECIES_INFO_TYPES_OFFSET, 2)
-                t1 = int(_u8_from(t, 0))
-                t2 = int(_u8_from(t, 1))
-                for tid in (t1, t2):
-                    if tid == 255:
-                        continue
-                    tname = _move_type_label(tid)
-                    if tname and tname not in type_names:
-                        type_names.append(tname)
-            except Exception:
-                pass
-
-        ability_id: Optional[int] = None
+        # types[2] .. abilities[2] of gSpeciesInfo[species] in one read.
+        species_info: Optional[bytes] = None
         if species_id > 0:
             try:
-                arr = mgba_read_range_bytes(
-                    SPECIES_INFO_ADDR + (species_id * SPECIES_INFO_SIZE) + SPECIES_INFO_ABILITIES_OFFSET,
-                    2,
+                species_info = mgba_read_range_bytes(
+                    SPECIES_INFO_ADDR + (species_id * SPECIES_INFO_SIZE) + SPECIES_INFO_TYPES_OFFSET,
+                    _SPECIES_INFO_TYPES_ABILITIES_LEN,
                 )
-                a1 = int(_u8_from(arr, 0))
-                a2 = int(_u8_from(arr, 1))
-                ability_id = int(a2 if int(ability_slot) == 1 else a1)
             except Exception:
-                ability_id = None
+                species_info = None
+
+        # Fallback to species table if monTypes were not populated.
+        if not type_names and species_info is not None:
+            for tid in (int(_u8_from(species_info, 0)), int(_u8_from(species_info, 1))):
+                if tid == 255:
+                    continue
+                tname = _move_type_label(tid)
+                if tname and tname not in type_names:
+                    type_names.append(tname)
+
+        ability_id: Optional[int] = None
+        if species_info is not None:
+            ability_id = int(_u8_from(species_info, _SPECIES_INFO_ABILITIES_REL + (1 if int(ability_slot) == 1 else 0)))
 
         species_name = species_name_txt or get_species_name(int(species_id)) or "POKEMON"
         nickname = nickname_txt or mon_nickname or species_name
@@ -4006,11 +4260,9 @@ def get_pokemon_summary_select_move_state(
         if len(summary) < SUMMARY_LEN or len(mon_raw) < POKEMON_DATA_SIZE:
             return None
 
-        move_cur_pp_txt = [_decode_summary_text(summary, 0x090 + (i * 11), 11) for i in range(5)]
-        move_max_pp_txt = [_decode_summary_text(summary, 0x0C8 + (i * 11), 11) for i in range(5)]
-        move_name_txt = [_decode_summary_text(summary, 0x100 + (i * 13), 13) for i in range(5)]
-        move_power_txt = [_decode_summary_text(summary, 0x144 + (i * 5), 5) for i in range(5)]
-        move_accuracy_txt = [_decode_summary_text(summary, 0x160 + (i * 5), 5) for i in range(5)]
+        move_cur_pp_txt, move_max_pp_txt, move_name_txt, move_power_txt, move_accuracy_txt = _decode_summary_texts(
+            summary
+        )[10:15]
 
         mon_info = _decode_party_mon_teach_info(mon_raw, 0) or {}
         species_id = int(mon_info.get("speciesId") or 0)
@@ -4029,26 +4281,9 @@ def get_pokemon_summary_select_move_state(
         if pid != 0:
             enc = mon_raw[ENCRYPTED_BLOCK_OFFSET : ENCRYPTED_BLOCK_OFFSET + ENCRYPTED_BLOCK_SIZE]
             if len(enc) >= ENCRYPTED_BLOCK_SIZE:
-                key = int(pid) ^ int(otid)
-                dec = bytearray(ENCRYPTED_BLOCK_SIZE)
-                for i in range(0, ENCRYPTED_BLOCK_SIZE, 4):
-                    word = _u32le_from(enc, i) ^ key
-                    dec[i : i + 4] = int(word & 0xFFFFFFFF).to_bytes(4, "little")
-
-                order = SUBSTRUCTURE_ORDER[pid % 24]
-                sub: Dict[str, bytes] = {}
-                for i, ch in enumerate(order):
-                    start = i * SUBSTRUCTURE_SIZE
-                    sub[ch] = bytes(dec[start : start + SUBSTRUCTURE_SIZE])
-
-                attacks = sub.get("A", b"")
-                if len(attacks) >= SUBSTRUCTURE_SIZE:
-                    current_move_ids = [
-                        int(_u16le_from(attacks, 0)),
-                        int(_u16le_from(attacks, 2)),
-                        int(_u16le_from(attacks, 4)),
-                        int(_u16le_from(attacks, 6)),
-                    ]
+                dec = _xor_u32le_block(enc, int(pid) ^ int(otid))
+                attacks_off = _SUBSTRUCTURE_GAM_OFFSETS[pid % 24][1]
+                current_move_ids = list(_SUBSTRUCTURE_MOVES.unpack_from(dec, attacks_off))
 
         # On-screen order should follow displayed moveNameStrBufs first.
         # Match rows to current moves by normalized name to avoid index drift.
@@ -4111,13 +4346,7 @@ def get_pokemon_summary_select_move_state(
             return f"MOVE_{move_id}"
 
         uniq_move_ids = sorted({mid for mid in (move_ids[:4] + ([new_move_id] if new_move_id > 0 else [])) if int(mid) > 0})
-        battle_move_entries: Dict[int, bytes] = {}
-        if uniq_move_ids:
-            ranges = [(GBATTLE_MOVES_ADDR + (int(mid) * BATTLE_MOVE_SIZE), BATTLE_MOVE_SIZE) for mid in uniq_move_ids]
-            segs = mgba_read_ranges_bytes(ranges)
-            for mid, seg in zip(uniq_move_ids, segs):
-                if seg and len(seg) >= BATTLE_MOVE_SIZE:
-                    battle_move_entries[int(mid)] = bytes(seg[:BATTLE_MOVE_SIZE])
+        battle_move_entries = _read_battle_move_entries(uniq_move_ids)
 
         def battle_move_field(move_id: int, offset: int) -> Optional[int]:
             seg = battle_move_entries.get(int(move_id))
@@ -4354,10 +4583,10 @@ def get_multichoice_menu_state(
             return None
 
         if tasks_raw is not None:
-            base = task_id * TASK_SIZE
+            base = _TASK_BASES[task_id]
             multichoice_id_raw = _u16le_from(tasks_raw, base + TASK_DATA_OFFSET + (7 * 2))
         else:
-            task_addr = GTASKS_ADDR + (task_id * TASK_SIZE)
+            task_addr = _TASK_ABS_BASES[task_id]
             multichoice_id_raw = mgba_read16(task_addr + TASK_DATA_OFFSET + (7 * 2))
         multichoice_id = _s16_from_u16(multichoice_id_raw)
         if multichoice_id < 0 or multichoice_id > 512:
@@ -18,6 +18,15 @@ def _u32le_from(raw: bytes, offset: int) -> int:
     return raw[offset] | (raw[offset + 1] << 8) | (raw[offset + 2] << 16) | (raw[offset + 3] << 24)
 
 
+def _xor_u32le_block(raw: bytes, key: int) -> bytes:
+    # XOR every little-endian u32 word with `key` as one big-int op (no per-word Python loop).
+    size = len(raw) & ~3
+    if size <= 0:
+        return b""
+    key_block = int.from_bytes((key & 0xFFFFFFFF).to_bytes(4, "little") * (size >> 2), "little")
+    return (int.from_bytes(raw[:size], "little") ^ key_block).to_bytes(size, "little")
+
+
 
 
 def _s8_from_u8(val: int) -> int: